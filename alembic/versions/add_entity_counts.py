@@ -0,0 +1,71 @@
+"""add trigger-maintained entity_counts
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of src/models/counter.py at this revision
+COUNTED_TABLES = {
+    'events': ('status', '{row}.status'),
+    'courses': ('status', '{row}.status'),
+    'contact_messages': (
+        'is_processed',
+        "CASE WHEN {row}.is_processed THEN 'processed' ELSE 'unprocessed' END",
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        'entity_counts',
+        sa.Column('entity', sa.String(50), nullable=False),
+        sa.Column('bucket', sa.String(20), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('entity', 'bucket'),
+    )
+    for source, (column, bucket) in COUNTED_TABLES.items():
+        new, old = bucket.format(row='new'), bucket.format(row='old')
+        increment = (
+            f"INSERT INTO entity_counts(entity, bucket, count) VALUES ('{source}', {new}, 1) "
+            f"ON CONFLICT(entity, bucket) DO UPDATE SET count = count + 1;"
+        )
+        decrement = (
+            f"UPDATE entity_counts SET count = count - 1 "
+            f"WHERE entity = '{source}' AND bucket = {old};"
+        )
+        op.execute(
+            f'CREATE TRIGGER {source}_count_ai AFTER INSERT ON {source} BEGIN {increment} END'
+        )
+        op.execute(
+            f'CREATE TRIGGER {source}_count_ad AFTER DELETE ON {source} BEGIN {decrement} END'
+        )
+        op.execute(
+            f'CREATE TRIGGER {source}_count_au AFTER UPDATE OF {column} ON {source} '
+            f'WHEN {old} IS NOT {new} BEGIN {decrement} {increment} END'
+        )
+        # Seed from the rows that already exist
+        op.execute(
+            f"INSERT INTO entity_counts(entity, bucket, count) "
+            f"SELECT '{source}', {bucket.format(row=source)}, count(*) FROM {source} "
+            f"GROUP BY 2"
+        )
+
+
+def downgrade() -> None:
+    for source in reversed(COUNTED_TABLES):
+        for suffix in ('au', 'ad', 'ai'):
+            op.execute(f'DROP TRIGGER IF EXISTS {source}_count_{suffix}')
+    op.drop_table('entity_counts')
@@ -0,0 +1,55 @@
+"""add FTS5 search indexes
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copy of src/models/search.py at this revision
+FTS_COLUMNS = {
+    'events': ('title', 'description', 'location'),
+    'courses': ('title', 'description', 'schedule'),
+    'contact_messages': ('name', 'message', 'phone'),
+}
+
+
+def upgrade() -> None:
+    for source, columns in FTS_COLUMNS.items():
+        fts = f'{source}_fts'
+        cols = ', '.join(columns)
+        new = ', '.join(f'new.{c}' for c in columns)
+        old = ', '.join(f'old.{c}' for c in columns)
+        delete = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});"
+        insert = f'INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});'
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, "
+            f"content='{source}', content_rowid='id', "
+            f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+        op.execute(f'CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN {insert} END')
+        op.execute(f'CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN {delete} END')
+        op.execute(
+            f'CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {source} '
+            f'BEGIN {delete} {insert} END'
+        )
+        # Index the rows that already exist
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    for source in reversed(FTS_COLUMNS):
+        fts = f'{source}_fts'
+        for suffix in ('au', 'ad', 'ai'):
+            op.execute(f'DROP TRIGGER IF EXISTS {fts}_{suffix}')
+        op.execute(f'DROP TABLE IF EXISTS {fts}')
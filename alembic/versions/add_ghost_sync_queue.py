@@ -0,0 +1,34 @@
+"""add ghost_sync_queue
+
+Revision ID: b2c3d4e5f6a7
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c3d4e5f6a7'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('ghost_sync_queue',
+    sa.Column('page', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column(
+        'requested_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False
+    ),
+    sa.PrimaryKeyConstraint('page')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('ghost_sync_queue')
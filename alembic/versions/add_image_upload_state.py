@@ -0,0 +1,30 @@
+"""add image upload state columns
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('cover_image_state', sa.String(10), nullable=True))
+    op.add_column('courses', sa.Column('image_desktop_state', sa.String(10), nullable=True))
+    op.add_column('courses', sa.Column('image_mobile_state', sa.String(10), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('courses', 'image_mobile_state')
+    op.drop_column('courses', 'image_desktop_state')
+    op.drop_column('events', 'cover_image_state')
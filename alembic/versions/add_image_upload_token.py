@@ -0,0 +1,30 @@
+"""add image upload token columns
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('cover_image_token', sa.String(64), nullable=True))
+    op.add_column('courses', sa.Column('image_desktop_token', sa.String(64), nullable=True))
+    op.add_column('courses', sa.Column('image_mobile_token', sa.String(64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('courses', 'image_mobile_token')
+    op.drop_column('courses', 'image_desktop_token')
+    op.drop_column('events', 'cover_image_token')
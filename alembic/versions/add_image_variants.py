@@ -0,0 +1,30 @@
+"""add image variant columns
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('cover_image_variants', sa.JSON(), nullable=True))
+    op.add_column('courses', sa.Column('image_desktop_variants', sa.JSON(), nullable=True))
+    op.add_column('courses', sa.Column('image_mobile_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('courses', 'image_mobile_variants')
+    op.drop_column('courses', 'image_desktop_variants')
+    op.drop_column('events', 'cover_image_variants')
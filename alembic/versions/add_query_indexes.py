@@ -0,0 +1,44 @@
+"""add indexes for list and published-page queries
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_events_status_order', 'events', ['status', 'order', 'event_date'])
+    op.create_index('ix_events_status_date', 'events', ['status', 'event_date'])
+    op.create_index('ix_events_order', 'events', ['order', 'event_date'])
+
+    op.create_index('ix_courses_status_order', 'courses', ['status', 'order', sa.text('id DESC')])
+    op.create_index('ix_courses_order', 'courses', ['order', sa.text('id DESC')])
+
+    op.create_index(
+        'ix_contact_messages_processed_created',
+        'contact_messages',
+        ['is_processed', 'created_at'],
+    )
+    op.create_index('ix_contact_messages_created', 'contact_messages', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contact_messages_created', 'contact_messages')
+    op.drop_index('ix_contact_messages_processed_created', 'contact_messages')
+    op.drop_index('ix_courses_order', 'courses')
+    op.drop_index('ix_courses_status_order', 'courses')
+    op.drop_index('ix_events_order', 'events')
+    op.drop_index('ix_events_status_date', 'events')
+    op.drop_index('ix_events_status_order', 'events')
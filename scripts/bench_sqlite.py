@@ -0,0 +1,89 @@
+"""Commit throughput of each SQLITE_PROFILE.
+
+Every commit is one small INSERT in its own transaction, the shape of a
+contact-form submission or an admin edit. Runs against a throwaway database
+in --dir (defaults to a temp dir; pass the data volume to measure the disk
+production actually fsyncs to). --group-commit sends the same inserts
+through GroupCommitWriter (WRITE_GROUP_COMMIT) instead of one transaction each.
+
+    uv run python -m scripts.bench_sqlite --commits 2000 --writers 50 --group-commit
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+
+from src.database import SQLITE_PROFILES, make_engine, sqlite_pragmas
+from src.services.writer import GroupCommitWriter
+
+INSERT = text("INSERT INTO bench (payload) VALUES (:p)")
+
+
+async def _bench(
+    path: Path, profile: str, commits: int, writers: int, group_commit: bool
+) -> float:
+    engine = make_engine(f"sqlite+aiosqlite:///{path}", profile)
+    group_writer = GroupCommitWriter(engine) if group_commit else None
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql(
+                "CREATE TABLE bench (id INTEGER PRIMARY KEY, payload TEXT NOT NULL)"
+            )
+        print(f"{profile:>9}: {await sqlite_pragmas(engine)}")
+
+        async def writer(n: int) -> None:
+            for i in range(n):
+                params = {"p": f"row {i}"}
+                if group_writer:
+                    await group_writer.submit(lambda session: session.execute(INSERT, params))
+                else:
+                    async with engine.begin() as conn:
+                        await conn.execute(INSERT, params)
+
+        if group_writer:
+            await group_writer.start()
+        per_writer, rest = divmod(commits, writers)
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(writer(per_writer + (1 if w < rest else 0)) for w in range(writers))
+        )
+        return commits / (time.perf_counter() - started)
+    finally:
+        if group_writer:
+            await group_writer.stop()
+        await engine.dispose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commits", type=int, default=1000)
+    parser.add_argument("--writers", type=int, default=1)
+    parser.add_argument("--dir", type=Path, default=None)
+    parser.add_argument("--group-commit", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        results = {
+            profile: await _bench(
+                Path(tmp) / f"{profile}.db",
+                profile,
+                args.commits,
+                args.writers,
+                args.group_commit,
+            )
+            for profile in SQLITE_PROFILES
+        }
+
+    mode = "group commit" if args.group_commit else "one transaction per insert"
+    print(f"\n{args.commits} commits, {args.writers} writer(s), {mode}")
+    baseline = results["durable"]
+    for profile, rate in results.items():
+        print(f"{profile:>9}: {rate:10.0f} commits/s  ({rate / baseline:.1f}x durable)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
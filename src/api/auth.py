@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+
+from src.api.deps import authenticate
+from src.config import settings
+from src.schemas.user import MeResponse, SessionResponse
+from src.utils.session_token import issue_session_token
+from src.utils.telegram_auth import TelegramUser
+
+router = APIRouter(prefix="/api/auth", tags=["auth"])
+
+
+@router.post("/session", response_model=SessionResponse)
+async def create_session(auth: tuple[TelegramUser, str] = Depends(authenticate)):
+    """Exchange initData (or a still-valid token, to refresh) for a session token."""
+    user, role = auth
+    token, expires_at = issue_session_token(
+        user, role, settings.SECRET_KEY, settings.SESSION_TOKEN_TTL
+    )
+    return SessionResponse(
+        token=token,
+        expires_at=expires_at,
+        role=role,
+        user=MeResponse(id=user.id, first_name=user.first_name),
+    )
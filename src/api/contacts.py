@@ -5,10 +5,16 @@ import structlog
 from fastapi import APIRouter, Depends, Query, Request
 from slowapi import Limiter
 
-from src.api.deps import get_contact_repo, get_current_user, get_notification_service
+from src.api.deps import (
+    get_contact_repo,
+    get_current_user,
+    get_notification_service,
+    get_writer,
+)
 from src.exceptions import NotFoundError
 from src.repositories.contact import ContactRepository
 from src.schemas.contact import ContactCreate, ContactResponse
+from src.services.writer import GroupCommitWriter
 from src.utils.telegram_auth import TelegramUser
 
 logger = structlog.get_logger()
@@ -37,6 +43,7 @@ async def submit_contact(
     data: ContactCreate,
     repo: ContactRepository = Depends(get_contact_repo),
     notification_service=Depends(get_notification_service),
+    writer: GroupCommitWriter | None = Depends(get_writer),
 ):
     # Honeypot check: if website field is filled, silently drop
     if data.website:
@@ -50,14 +57,12 @@ async def submit_contact(
         if elapsed < MIN_SUBMIT_TIME or elapsed > MAX_SUBMIT_TIME:
             return {"status": "ok"}  # silently drop, same as honeypot
 
-    contact = await repo.create(
-        name=data.name,
-        phone=data.phone,
-        email=data.email,
-        message=data.message,
-        source=data.source,
-    )
-    await repo.session.commit()
+    fields = data.model_dump(include={"name", "phone", "email", "message", "source"})
+    if writer:
+        contact = await writer.submit(lambda session: ContactRepository(session).create(**fields))
+    else:
+        contact = await repo.create(**fields)
+        await repo.session.commit()
 
     # Notify admins (throttled to prevent spam flood)
     if notification_service:
@@ -86,15 +91,18 @@ async def list_contacts(
     sort: str = Query(default="desc", pattern="^(asc|desc)$"),
     date_from: date | None = None,
     date_to: date | None = None,
+    search: str | None = Query(default=None, max_length=100),
+    cursor: str | None = Query(default=None, max_length=500),
 ):
-    items, total = await repo.list_filtered(
-        offset, limit, is_processed, sort, date_from, date_to,
+    items, total, next_cursor = await repo.list_filtered(
+        offset, limit, is_processed, sort, date_from, date_to, search, cursor,
     )
     return {
         "items": [ContactResponse.model_validate(i) for i in items],
         "total": total,
         "offset": offset,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, UploadFile
 
 from src.api.deps import (
     get_admin_user,
@@ -8,12 +8,20 @@ from src.api.deps import (
     get_current_user,
     get_notification_service,
 )
-from src.models.course import CourseStatus
+from src.models.course import Course, CourseStatus
+from src.models.image import IMAGE_STATE_PENDING
 from src.repositories.course import CourseRepository
 from src.schemas.common import ImageUploadResponse
 from src.schemas.course import CourseCreate, CourseResponse, CourseUpdate
 from src.services.audit import AuditService
+from src.services.content_page import PAGE_COURSES
 from src.services.course import CourseService
+from src.services.image import (
+    TARGET_COURSE_DESKTOP,
+    TARGET_COURSE_MOBILE,
+    finish_upload,
+    stash_upload,
+)
 from src.utils.image_validation import validate_image
 from src.utils.telegram_auth import TelegramUser
 
@@ -37,13 +45,15 @@ async def list_courses(
     limit: int = Query(default=20, ge=1, le=100),
     status: CourseStatus | None = None,
     search: str | None = Query(default=None, max_length=100),
+    cursor: str | None = Query(default=None, max_length=500),
 ):
-    items, total = await service.list(offset, limit, status, search)
+    items, total, next_cursor = await service.list(offset, limit, status, search, cursor)
     return {
         "items": [CourseResponse.model_validate(i) for i in items],
         "total": total,
         "offset": offset,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -133,26 +143,26 @@ async def reactivate_course(
 async def upload_course_image(
     course_id: int,
     file: UploadFile,
+    background_tasks: BackgroundTasks,
     type: str = Query(default="desktop", pattern="^(desktop|mobile)$"),
     user: TelegramUser = Depends(get_current_user),
     service: CourseService = Depends(_get_course_service),
     content_page_builder=Depends(get_content_page_builder),
 ):
+    """Accept the image and return at once; processing and Ghost upload run after."""
     course = await service.get(course_id)
-    content, safe_name = await validate_image(file)
-
-    if content_page_builder and content_page_builder.ghost_client:
-        url = await content_page_builder.ghost_client.upload_image(
-            content, safe_name
-        )
-    else:
-        url = f"/uploads/{safe_name}"
+    image = await validate_image(file)
+    pending = await stash_upload(image)
 
     field = "image_desktop" if type == "desktop" else "image_mobile"
-    course = await service.repo.update(course, **{field: url})
+    target = TARGET_COURSE_DESKTOP if type == "desktop" else TARGET_COURSE_MOBILE
+    await service.repo.update(
+        course, **{f"{field}_state": IMAGE_STATE_PENDING, f"{field}_token": pending.token}
+    )
     await service.repo.session.commit()
 
-    if course.status == CourseStatus.PUBLISHED:
-        await service._sync_ghost_page()
-
-    return ImageUploadResponse(url=url)
+    background_tasks.add_task(
+        finish_upload, content_page_builder, Course, course_id, field, target,
+        pending, PAGE_COURSES,
+    )
+    return ImageUploadResponse(url=None, state=IMAGE_STATE_PENDING)
@@ -3,39 +3,55 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.config import settings
 from src.database import get_db
-from src.exceptions import ForbiddenError
+from src.exceptions import AuthError, ForbiddenError
+from src.models.user import ROLE_ADMIN
 from src.repositories.contact import ContactRepository
 from src.repositories.course import CourseRepository
 from src.repositories.event import EventRepository
 from src.repositories.user import UserRepository
 from src.services.audit import AuditService
+from src.services.whitelist import whitelist
+from src.utils.session_token import decode_session_token
 from src.utils.telegram_auth import TelegramUser, validate_init_data
 
 
+async def authenticate(
+    x_telegram_init_data: str | None = Header(None),
+    authorization: str | None = Header(None),
+) -> tuple[TelegramUser, str]:
+    """Resolve the caller from a session token or initData; return (user, role).
+
+    A Bearer token is a single HMAC check plus a snapshot lookup. Its role
+    claim must still match the whitelist, so removing a user or changing
+    their role revokes outstanding tokens (401 — the client re-exchanges).
+    """
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        claims = decode_session_token(token, settings.SECRET_KEY)
+        if await whitelist.role_of(claims.user.id) != claims.role:
+            raise AuthError("Session revoked")
+        return claims.user, claims.role
+
+    user = validate_init_data(x_telegram_init_data or "", settings.TELEGRAM_BOT_TOKEN)
+    role = await whitelist.role_of(user.id)
+    if role is None:
+        raise ForbiddenError("User not in whitelist")
+    return user, role
+
+
 async def get_current_user(
-    x_telegram_init_data: str = Header(...),
-    db: AsyncSession = Depends(get_db),
+    auth: tuple[TelegramUser, str] = Depends(authenticate),
 ) -> TelegramUser:
-    """Validate initData and check user is in whitelist."""
-    user = validate_init_data(x_telegram_init_data, settings.TELEGRAM_BOT_TOKEN)
-    user_repo = UserRepository(db)
-    whitelisted = await user_repo.get_by_telegram_id(user.id)
-    if not whitelisted:
-        raise ForbiddenError("User not in whitelist")
-    return user
+    """Any whitelisted user."""
+    return auth[0]
 
 
 async def get_admin_user(
-    x_telegram_init_data: str = Header(...),
-    db: AsyncSession = Depends(get_db),
+    auth: tuple[TelegramUser, str] = Depends(authenticate),
 ) -> TelegramUser:
-    """Validate initData and check user has admin role."""
-    user = validate_init_data(x_telegram_init_data, settings.TELEGRAM_BOT_TOKEN)
-    user_repo = UserRepository(db)
-    whitelisted = await user_repo.get_by_telegram_id(user.id)
-    if not whitelisted:
-        raise ForbiddenError("User not in whitelist")
-    if not whitelisted.is_admin:
+    """Whitelisted user with the admin role."""
+    user, role = auth
+    if role != ROLE_ADMIN:
         raise ForbiddenError("Admin access required")
     return user
 
@@ -66,3 +82,7 @@ def get_content_page_builder(request: Request):
 
 def get_notification_service(request: Request):
     return request.app.state.notification_service
+
+
+def get_writer(request: Request):
+    return request.app.state.writer
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, UploadFile
 
 from src.api.deps import (
     get_admin_user,
@@ -8,12 +8,15 @@ from src.api.deps import (
     get_event_repo,
     get_notification_service,
 )
-from src.models.event import EventStatus
+from src.models.event import Event, EventStatus
+from src.models.image import IMAGE_STATE_PENDING
 from src.repositories.event import EventRepository
 from src.schemas.common import ImageUploadResponse
 from src.schemas.event import EventCreate, EventResponse, EventUpdate
 from src.services.audit import AuditService
+from src.services.content_page import PAGE_EVENTS
 from src.services.event import EventService
+from src.services.image import TARGET_EVENT_COVER, finish_upload, stash_upload
 from src.utils.image_validation import validate_image
 from src.utils.telegram_auth import TelegramUser
 
@@ -37,13 +40,15 @@ async def list_events(
     limit: int = Query(default=20, ge=1, le=100),
     status: EventStatus | None = None,
     search: str | None = Query(default=None, max_length=100),
+    cursor: str | None = Query(default=None, max_length=500),
 ):
-    items, total = await service.list(offset, limit, status, search)
+    items, total, next_cursor = await service.list(offset, limit, status, search, cursor)
     return {
         "items": [EventResponse.model_validate(i) for i in items],
         "total": total,
         "offset": offset,
         "limit": limit,
+        "next_cursor": next_cursor,
     }
 
 
@@ -133,24 +138,23 @@ async def reactivate_event(
 async def upload_event_image(
     event_id: int,
     file: UploadFile,
+    background_tasks: BackgroundTasks,
     user: TelegramUser = Depends(get_current_user),
     service: EventService = Depends(_get_event_service),
     content_page_builder=Depends(get_content_page_builder),
 ):
+    """Accept the image and return at once; processing and Ghost upload run after."""
     event = await service.get(event_id)
-    content, safe_name = await validate_image(file)
+    image = await validate_image(file)
+    pending = await stash_upload(image)
 
-    if content_page_builder and content_page_builder.ghost_client:
-        url = await content_page_builder.ghost_client.upload_image(
-            content, safe_name
-        )
-    else:
-        url = f"/uploads/{safe_name}"
-
-    event = await service.repo.update(event, cover_image=url)
+    await service.repo.update(
+        event, cover_image_state=IMAGE_STATE_PENDING, cover_image_token=pending.token
+    )
     await service.repo.session.commit()
 
-    if event.status == EventStatus.PUBLISHED:
-        await service._sync_ghost_page()
-
-    return ImageUploadResponse(url=url)
+    background_tasks.add_task(
+        finish_upload, content_page_builder, Event, event_id, "cover_image",
+        TARGET_EVENT_COVER, pending, PAGE_EVENTS,
+    )
+    return ImageUploadResponse(url=None, state=IMAGE_STATE_PENDING)
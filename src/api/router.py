@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.auth import router as auth_router
 from src.api.contacts import router as contacts_router
 from src.api.courses import router as courses_router
+from src.api.deps import get_content_page_builder
 from src.api.events import router as events_router
 from src.api.sync import router as sync_router
 from src.api.users import router as users_router
@@ -13,16 +15,25 @@ router = APIRouter()
 
 
 @router.get("/health")
-async def health(db: AsyncSession = Depends(get_db)):
+async def health(
+    db: AsyncSession = Depends(get_db),
+    content_page_builder=Depends(get_content_page_builder),
+):
     try:
         await db.execute(text("SELECT 1"))
-        return {"status": "ok", "db": "connected"}
     except Exception:
         from fastapi import HTTPException
 
         raise HTTPException(503, detail="Database unavailable")
 
+    # Ghost outages degrade publishing but must not fail the container healthcheck
+    ghost = "not_configured"
+    if content_page_builder:
+        ghost = content_page_builder.ghost_client.breaker.state
+    return {"status": "ok", "db": "connected", "ghost": ghost}
 
+
+router.include_router(auth_router)
 router.include_router(events_router)
 router.include_router(courses_router)
 router.include_router(contacts_router)
@@ -21,13 +21,13 @@ async def sync_all(
     errors: list[str] = []
 
     try:
-        await content_page_builder.sync_events_page()
+        await content_page_builder.sync_events_page(force=True)
     except Exception:
         logger.exception("Manual sync failed for events")
         errors.append("events")
 
     try:
-        await content_page_builder.sync_courses_page()
+        await content_page_builder.sync_courses_page(force=True)
     except Exception:
         logger.exception("Manual sync failed for courses")
         errors.append("courses")
@@ -36,3 +36,14 @@ async def sync_all(
         raise ValidationError(f"Sync failed for: {', '.join(errors)}")
 
     return {"status": "ok"}
+
+
+@router.get("/status")
+async def sync_status(
+    user: TelegramUser = Depends(get_current_user),
+    content_page_builder=Depends(get_content_page_builder),
+):
+    if not content_page_builder:
+        raise ValidationError("Ghost CMS not configured")
+
+    return content_page_builder.sync_queue.status()
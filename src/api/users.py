@@ -4,6 +4,7 @@ from src.api.deps import get_admin_user, get_current_user, get_user_repo
 from src.exceptions import NotFoundError, ValidationError
 from src.repositories.user import UserRepository
 from src.schemas.user import MeResponse, UserCreate, UserResponse
+from src.services.whitelist import whitelist
 from src.utils.telegram_auth import TelegramUser
 
 router = APIRouter(prefix="/api/users", tags=["users"])
@@ -20,7 +21,7 @@ async def list_users(
     user: TelegramUser = Depends(get_current_user),
     repo: UserRepository = Depends(get_user_repo),
 ):
-    items, _ = await repo.list(offset=0, limit=100)
+    items, _, _ = await repo.list(offset=0, limit=100)
     return items
 
 
@@ -43,6 +44,7 @@ async def add_user(
         added_by=user.id,
     )
     await repo.session.commit()
+    whitelist.invalidate()
     return new_user
 
 
@@ -61,3 +63,4 @@ async def delete_user(
 
     await repo.delete(target)
     await repo.session.commit()
+    whitelist.invalidate()
@@ -35,7 +35,7 @@ async def cmd_export(message: Message):
     try:
         async with async_session_factory() as session:
             repo = ContactRepository(session)
-            items, total = await repo.list_filtered(offset=0, limit=EXPORT_MAX_ROWS)
+            items, total, _ = await repo.list_filtered(offset=0, limit=EXPORT_MAX_ROWS)
 
         if total == 0:
             await message.answer("Нет заявок для экспорта.")
@@ -8,8 +8,7 @@ from aiogram.types import (
 )
 
 from src.config import settings
-from src.database import async_session_factory
-from src.repositories.user import UserRepository
+from src.services.whitelist import whitelist
 
 router = Router()
 
@@ -20,11 +19,7 @@ async def cmd_start(message: Message):
     if not message.from_user:
         return
 
-    async with async_session_factory() as session:
-        repo = UserRepository(session)
-        user = await repo.get_by_telegram_id(message.from_user.id)
-
-    if not user:
+    if await whitelist.role_of(message.from_user.id) is None:
         await message.answer(
             "Доступ запрещён. "
             "Обратитесь к администратору."
@@ -4,8 +4,7 @@ from typing import Any
 from aiogram import BaseMiddleware
 from aiogram.types import Message
 
-from src.database import async_session_factory
-from src.repositories.user import UserRepository
+from src.services.whitelist import whitelist
 
 
 class WhitelistMiddleware(BaseMiddleware):
@@ -20,11 +19,7 @@ class WhitelistMiddleware(BaseMiddleware):
         if not event.from_user:
             return
 
-        async with async_session_factory() as session:
-            repo = UserRepository(session)
-            user = await repo.get_by_telegram_id(event.from_user.id)
-
-        if not user:
+        if await whitelist.role_of(event.from_user.id) is None:
             await event.answer("Доступ запрещён.")
             return
 
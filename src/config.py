@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import computed_field
 from pydantic_settings import BaseSettings
 
@@ -5,6 +7,10 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///data/komonbot.db"
+    SQLITE_PROFILE: Literal["durable", "balanced", "fast"] = "balanced"  # see src/database.py
+    DB_WRITE_POOL_SIZE: int = 2  # SQLite has one writer at a time
+    DB_READ_POOL_SIZE: int = 10  # mode=ro connections for repository reads
+    WRITE_GROUP_COMMIT: bool = False  # route contact submissions through one batching writer
 
     # App — subroute
     ROOT_PATH: str = "/bot"
@@ -19,9 +25,29 @@ class Settings(BaseSettings):
     GHOST_ADMIN_API_KEY: str = ""
     GHOST_EVENTS_PAGE_ID: str = ""
     GHOST_COURSES_PAGE_ID: str = ""
+    GHOST_CALL_DEADLINE: float = 20.0  # seconds per client call, retries included
+    GHOST_BREAKER_THRESHOLD: int = 5  # consecutive failures before the circuit opens
+    GHOST_BREAKER_RESET: float = 30.0  # seconds the circuit stays open before a probe
+    GHOST_HTTP2: bool = True
+    GHOST_MAX_CONNECTIONS: int = 10
+    GHOST_MAX_KEEPALIVE: int = 5
+    GHOST_KEEPALIVE_EXPIRY: float = 60.0
+    GHOST_CONNECT_TIMEOUT: float = 5.0
+    GHOST_READ_TIMEOUT: float = 15.0
+    GHOST_WRITE_TIMEOUT: float = 15.0
+    GHOST_POOL_TIMEOUT: float = 5.0
+
+    # Image uploads — re-encoded before upload
+    IMAGE_FORMAT: Literal["webp", "jpeg"] = "webp"
+    IMAGE_QUALITY: int = 80
+    UPLOAD_PENDING_DIR: str = "data/uploads/pending"  # accepted uploads awaiting processing
+    IMAGE_STORAGE: Literal["ghost", "local"] = "ghost"  # local: serve from MEDIA_DIR at /uploads
+    MEDIA_DIR: str = "data/media"
+    MEDIA_ACCEL_REDIRECT: str = ""  # nginx internal location for MEDIA_DIR; "" = serve from app
 
     # App
-    SECRET_KEY: str = ""
+    SECRET_KEY: str = ""  # signs webapp session tokens
+    SESSION_TOKEN_TTL: int = 3600  # seconds a session token is valid
     LOG_LEVEL: str = "INFO"
     TIMEZONE: str = "Europe/Moscow"
     ADMIN_TELEGRAM_IDS_STR: str = ""
@@ -1,32 +1,182 @@
 from collections.abc import AsyncGenerator
 
-from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import Engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.sql.dml import UpdateBase
 
 from src.config import settings
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    connect_args={"check_same_thread": False},
+# Per-connection PRAGMAs by SQLITE_PROFILE. WAL and foreign keys are always on.
+# durable:  fsync on every commit — survives power loss without losing commits
+# balanced: WAL + synchronous=NORMAL — never corrupts, a power cut may drop the
+#           last commits (an app crash loses nothing)
+# fast:     no fsync — an OS crash or power cut can corrupt the database
+SQLITE_PROFILES: dict[str, dict[str, int | str]] = {
+    "durable": {
+        "synchronous": "FULL",
+        "cache_size": -16_000,  # KiB
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5_000,  # ms
+    },
+    "balanced": {
+        "synchronous": "NORMAL",
+        "cache_size": -32_000,
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5_000,
+    },
+    "fast": {
+        "synchronous": "OFF",
+        "cache_size": -64_000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5_000,
+    },
+}
+
+# Reported at startup
+SQLITE_REPORTED_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "cache_size",
+    "mmap_size",
+    "temp_store",
+    "busy_timeout",
+    "foreign_keys",
+    "query_only",
 )
 
 
-# Enable WAL mode and foreign keys for SQLite
-@event.listens_for(engine.sync_engine, "connect")
-def _set_sqlite_pragma(dbapi_connection, connection_record):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA journal_mode=WAL")
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+def read_only_url(url: str) -> str | None:
+    """The same database file opened with mode=ro, or None for in-memory databases."""
+    parsed = make_url(url)
+    if parsed.database in (None, "", ":memory:") or parsed.query.get("uri"):
+        return None
+    return f"{parsed.drivername}:///file:{parsed.database}?mode=ro&uri=true"
+
+
+def make_engine(
+    url: str, profile: str, *, read_only: bool = False, pool_size: int = 5
+) -> AsyncEngine:
+    """Async engine whose connections are configured by the named SQLite profile.
+
+    pool_size connections are kept open; bursts beyond it get short-lived
+    overflow connections rather than waiting for a checkout.
+
+    A read_only engine must be given a mode=ro URL (see read_only_url); its
+    connections also set query_only and leave journal_mode to the writer.
+    """
+    pragmas = SQLITE_PROFILES[profile]
+    new_engine = create_async_engine(
+        url,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        pool_size=pool_size,
+    )
+
+    @event.listens_for(new_engine.sync_engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        else:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA foreign_keys=ON")
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
 
+    return new_engine
+
+
+async def sqlite_pragmas(target: AsyncEngine) -> dict[str, int | str]:
+    """Effective values of SQLITE_REPORTED_PRAGMAS on a pooled connection."""
+    async with target.connect() as conn:
+        return {
+            name: (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar()
+            for name in SQLITE_REPORTED_PRAGMAS
+        }
+
+
+# Writes (and any read outside a repository read scope) go to the small write
+# pool; repository reads go to a larger pool of mode=ro connections, so WAL
+# readers never queue behind writers for a connection.
+engine = make_engine(
+    settings.DATABASE_URL, settings.SQLITE_PROFILE, pool_size=settings.DB_WRITE_POOL_SIZE
+)
+_read_url = read_only_url(settings.DATABASE_URL)
+read_engine = (
+    make_engine(
+        _read_url,
+        settings.SQLITE_PROFILE,
+        read_only=True,
+        pool_size=settings.DB_READ_POOL_SIZE,
+    )
+    if _read_url
+    else engine
+)
 
-async_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+# session.info key: depth of repository read scopes (see repositories.base.read_only)
+READ_SCOPE = "read_scope"
+_WRITER_IN_USE = "writer_in_use"
+
+
+class RoutingSession(Session):
+    """Session that sends repository reads to the read-only engine.
+
+    Inside a read scope, SELECTs go to `reader` unless the current transaction
+    already holds a write connection — a session always sees its own
+    uncommitted writes. Flushes, DML and reads outside a scope use the bound
+    write engine.
+    """
+
+    def __init__(self, *args, reader: Engine | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reader = reader
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if (
+            self.reader is not None
+            and self.info.get(READ_SCOPE)
+            and not self.info.get(_WRITER_IN_USE)
+            and not self._flushing
+            and not isinstance(clause, UpdateBase)
+        ):
+            return self.reader
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def _track_writer(session, transaction, connection):
+    if connection.engine is not session.reader:
+        session.info[_WRITER_IN_USE] = True
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _release_writer(session, transaction):
+    if transaction.parent is None:
+        session.info.pop(_WRITER_IN_USE, None)
+
+
+async_session_factory = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    reader=read_engine.sync_engine if read_engine is not engine else None,
+)
 
 
 class Base(DeclarativeBase):
-    pass
+    # Server-generated values (id, created_at, ...) come back via RETURNING in
+    # the INSERT/UPDATE itself, so a flushed instance is complete without a refresh.
+    __mapper_args__ = {"eager_defaults": True}
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
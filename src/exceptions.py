@@ -16,6 +16,11 @@ class ValidationError(AppError):
         super().__init__(400, "validation_error", message)
 
 
+class ConflictError(AppError):
+    def __init__(self, message: str):
+        super().__init__(409, "conflict", message)
+
+
 class AuthError(AppError):
     def __init__(self, message: str = "Authentication required"):
         super().__init__(401, "auth_error", message)
@@ -24,3 +29,8 @@ class AuthError(AppError):
 class ForbiddenError(AppError):
     def __init__(self, message: str = "Access denied"):
         super().__init__(403, "forbidden", message)
+
+
+class ServiceUnavailableError(AppError):
+    def __init__(self, message: str = "Service temporarily unavailable"):
+        super().__init__(503, "service_unavailable", message)
@@ -24,7 +24,19 @@ async def lifespan(app: FastAPI):
     logger.info("Starting KomonBot", root_path=settings.ROOT_PATH)
 
     if not settings.SECRET_KEY:
-        logger.warning("SECRET_KEY not set — using insecure default. Set it in .env")
+        logger.warning(
+            "SECRET_KEY not set — session tokens use a per-process key. Set it in .env"
+        )
+
+    from src.database import engine, read_engine, sqlite_pragmas
+
+    logger.info(
+        "SQLite storage profile",
+        profile=settings.SQLITE_PROFILE,
+        **await sqlite_pragmas(engine),
+    )
+    if read_engine is not engine:
+        logger.info("SQLite read engine", **await sqlite_pragmas(read_engine))
 
     if not settings.WEBHOOK_SECRET:
         logger.warning("WEBHOOK_SECRET not set — webhook endpoint is unprotected")
@@ -47,6 +59,27 @@ async def lifespan(app: FastAPI):
                 existing.role = "admin"
         await session.commit()
 
+    from src.services.whitelist import whitelist
+
+    whitelist.invalidate()
+    await whitelist.load()
+
+    # Uploads interrupted by the restart will never finish
+    from pathlib import Path
+
+    from src.services.image import fail_stale_uploads
+
+    await fail_stale_uploads()
+    Path(settings.MEDIA_DIR).mkdir(parents=True, exist_ok=True)
+
+    # Single batching writer for public write bursts
+    writer = None
+    if settings.WRITE_GROUP_COMMIT:
+        from src.services.writer import GroupCommitWriter
+
+        writer = GroupCommitWriter()
+        await writer.start()
+
     # Ghost client + content page builder
     ghost_client = None
     content_page_builder = None
@@ -70,10 +103,12 @@ async def lifespan(app: FastAPI):
         from src.services.content_page import ContentPageBuilder
 
         content_page_builder = ContentPageBuilder(ghost_client, notification_service)
+        await content_page_builder.sync_queue.start()
 
     # Store on app state for dependency injection
     app.state.content_page_builder = content_page_builder
     app.state.notification_service = notification_service
+    app.state.writer = writer
 
     # Setup bot webhook
     if settings.TELEGRAM_BOT_TOKEN:
@@ -96,15 +131,20 @@ async def lifespan(app: FastAPI):
     if scheduler:
         scheduler.shutdown(wait=True)
 
+    if content_page_builder:
+        await content_page_builder.sync_queue.stop()
+
     if bot and settings.TELEGRAM_BOT_TOKEN:
         await bot.session.close()
 
     if ghost_client:
         await ghost_client.close()
 
-    from src.database import engine
+    if writer:
+        await writer.stop()
 
     await engine.dispose()
+    await read_engine.dispose()
     logger.info("KomonBot shutdown complete")
 
 
@@ -116,7 +156,7 @@ app = FastAPI(
     docs_url=docs_url,
     redoc_url=redoc_url,
     lifespan=lifespan,
-    
+
 )
 
 # Rate limiting
@@ -131,7 +171,12 @@ if settings.ALLOWED_ORIGINS:
         allow_origins=settings.ALLOWED_ORIGINS,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PATCH", "DELETE", "OPTIONS"],
-        allow_headers=["Content-Type", "X-Telegram-Init-Data", "X-Request-ID"],
+        allow_headers=[
+            "Authorization",
+            "Content-Type",
+            "X-Telegram-Init-Data",
+            "X-Request-ID",
+        ],
     )
 else:
     # No wildcard — only same-origin requests allowed when not configured
@@ -253,3 +298,16 @@ async def webapp_trailing_slash():
 
 # Static files (webapp)
 app.mount("/webapp", StaticFiles(directory="webapp/dist", html=True), name="webapp")
+
+# Local media store (content-addressed, immutable)
+from src.services.media import MEDIA_URL_PATH, MediaFiles  # noqa: E402
+
+app.mount(
+    MEDIA_URL_PATH,
+    MediaFiles(
+        directory=settings.MEDIA_DIR,
+        check_dir=False,
+        accel_redirect=settings.MEDIA_ACCEL_REDIRECT,
+    ),
+    name="uploads",
+)
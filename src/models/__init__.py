@@ -1,7 +1,11 @@
 from src.models.audit import AuditLog
 from src.models.contact import ContactMessage
+from src.models.counter import EntityCount
 from src.models.course import Course, CourseStatus
 from src.models.event import Event, EventStatus
+from src.models.image import ImageUpload
+from src.models.search import FTS_COLUMNS
+from src.models.sync import GhostSyncTask
 from src.models.user import WhitelistUser
 
 __all__ = [
@@ -9,7 +13,11 @@ __all__ = [
     "ContactMessage",
     "Course",
     "CourseStatus",
+    "EntityCount",
     "Event",
     "EventStatus",
+    "FTS_COLUMNS",
+    "GhostSyncTask",
+    "ImageUpload",
     "WhitelistUser",
 ]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import String, Text, text
+from sqlalchemy import Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.database import Base
@@ -21,3 +21,12 @@ class ContactMessage(Base):
         server_default=text("CURRENT_TIMESTAMP")
     )
     processed_at: Mapped[datetime | None] = mapped_column()
+
+
+# ContactRepository.list_filtered: optional is_processed filter, created_at range + sort
+Index(
+    "ix_contact_messages_processed_created",
+    ContactMessage.is_processed,
+    ContactMessage.created_at,
+)
+Index("ix_contact_messages_created", ContactMessage.created_at)
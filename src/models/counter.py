@@ -0,0 +1,66 @@
+"""Row counts per entity and status, maintained by SQLite triggers.
+
+List endpoints read their totals here instead of running COUNT(*) with the
+list filters. Buckets are the stored status value (enum name) for events
+and courses and processed/unprocessed for contact messages. As with the
+FTS triggers, a batch (table-recreating) migration on a counted table drops
+its triggers — re-create them in the same migration.
+"""
+
+from sqlalchemy import DDL, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+from src.models.contact import ContactMessage
+from src.models.course import Course
+from src.models.event import Event
+
+CONTACT_BUCKET_PROCESSED = "processed"
+CONTACT_BUCKET_UNPROCESSED = "unprocessed"
+
+
+class EntityCount(Base):
+    __tablename__ = "entity_counts"
+
+    entity: Mapped[str] = mapped_column(String(50), primary_key=True)
+    bucket: Mapped[str] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(default=0)
+
+
+# table -> (column that moves a row between buckets, bucket SQL for row alias {row})
+COUNTED_TABLES: dict[str, tuple[str, str]] = {
+    Event.__tablename__: ("status", "{row}.status"),
+    Course.__tablename__: ("status", "{row}.status"),
+    ContactMessage.__tablename__: (
+        "is_processed",
+        f"CASE WHEN {{row}}.is_processed THEN '{CONTACT_BUCKET_PROCESSED}' "
+        f"ELSE '{CONTACT_BUCKET_UNPROCESSED}' END",
+    ),
+}
+
+
+def counter_ddl(source: str, column: str, bucket: str) -> list[str]:
+    """CREATE TRIGGER statements keeping entity_counts in step with source."""
+    new, old = bucket.format(row="new"), bucket.format(row="old")
+    increment = (
+        f"INSERT INTO entity_counts(entity, bucket, count) VALUES ('{source}', {new}, 1) "
+        f"ON CONFLICT(entity, bucket) DO UPDATE SET count = count + 1;"
+    )
+    decrement = (
+        f"UPDATE entity_counts SET count = count - 1 "
+        f"WHERE entity = '{source}' AND bucket = {old};"
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {source}_count_ai AFTER INSERT ON {source} "
+        f"BEGIN {increment} END",
+        f"CREATE TRIGGER IF NOT EXISTS {source}_count_ad AFTER DELETE ON {source} "
+        f"BEGIN {decrement} END",
+        f"CREATE TRIGGER IF NOT EXISTS {source}_count_au AFTER UPDATE OF {column} ON {source} "
+        f"WHEN {old} IS NOT {new} BEGIN {decrement} {increment} END",
+    ]
+
+
+for _model in (Event, Course, ContactMessage):
+    _source = _model.__tablename__
+    for _statement in counter_ddl(_source, *COUNTED_TABLES[_source]):
+        event.listen(_model.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
@@ -2,7 +2,7 @@ import enum
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Numeric, String, Text, text
+from sqlalchemy import JSON, Index, Numeric, String, Text, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -26,6 +26,14 @@ class Course(Base):
     schedule: Mapped[str] = mapped_column(Text, default="")
     image_desktop: Mapped[str | None] = mapped_column(String(500))
     image_mobile: Mapped[str | None] = mapped_column(String(500))
+    # [{"width": int, "url": str}] ascending — rendered as srcset
+    image_desktop_variants: Mapped[list[dict] | None] = mapped_column(JSON)
+    image_mobile_variants: Mapped[list[dict] | None] = mapped_column(JSON)
+    image_desktop_state: Mapped[str | None] = mapped_column(String(10))
+    image_mobile_state: Mapped[str | None] = mapped_column(String(10))
+    # Stash name of the latest upload per slot; only that upload may set the slot
+    image_desktop_token: Mapped[str | None] = mapped_column(String(64))
+    image_mobile_token: Mapped[str | None] = mapped_column(String(64))
     cost: Mapped[Decimal] = mapped_column(Numeric(10, 2), default=Decimal("0"))
     currency: Mapped[str] = mapped_column(String(3), default="RUB")
     status: Mapped[CourseStatus] = mapped_column(
@@ -39,3 +47,8 @@ class Course(Base):
     updated_at: Mapped[datetime] = mapped_column(
         server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now
     )
+
+
+# Indexes follow CourseRepository queries, ordered by (order ASC, id DESC).
+Index("ix_courses_status_order", Course.status, Course.order, Course.id.desc())
+Index("ix_courses_order", Course.order, Course.id.desc())
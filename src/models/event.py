@@ -1,7 +1,7 @@
 import enum
 from datetime import date, datetime, time
 
-from sqlalchemy import Date, String, Text, Time, text
+from sqlalchemy import JSON, Date, Index, String, Text, Time, text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -25,6 +25,11 @@ class Event(Base):
     event_date: Mapped[date | None] = mapped_column(Date)
     event_time: Mapped[time | None] = mapped_column(Time)
     cover_image: Mapped[str | None] = mapped_column(String(500))
+    # [{"width": int, "url": str}] ascending — rendered as srcset
+    cover_image_variants: Mapped[list[dict] | None] = mapped_column(JSON)
+    cover_image_state: Mapped[str | None] = mapped_column(String(10))
+    # Stash name of the latest upload; only that upload may set the slot
+    cover_image_token: Mapped[str | None] = mapped_column(String(64))
     ticket_link: Mapped[str | None] = mapped_column(String(500))
     status: Mapped[EventStatus] = mapped_column(
         SQLEnum(EventStatus, native_enum=False, length=20), default=EventStatus.DRAFT
@@ -37,3 +42,10 @@ class Event(Base):
     updated_at: Mapped[datetime] = mapped_column(
         server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now
     )
+
+
+# Indexes follow EventRepository queries; status leads so the published page,
+# the archive job and filtered admin lists are range searches without a sort.
+Index("ix_events_status_order", Event.status, Event.order, Event.event_date)
+Index("ix_events_status_date", Event.status, Event.event_date)
+Index("ix_events_order", Event.order, Event.event_date)
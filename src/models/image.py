@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+# Per-slot upload state on events/courses (`<field>_state` columns)
+IMAGE_STATE_PENDING = "pending"
+IMAGE_STATE_READY = "ready"
+IMAGE_STATE_FAILED = "failed"
+
+
+class ImageUpload(Base):
+    """Uploaded image keyed by SHA-256 of the stored bytes — repeat uploads reuse url."""
+
+    __tablename__ = "image_uploads"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    url: Mapped[str] = mapped_column(String(500))
+    content_type: Mapped[str] = mapped_column(String(20))
+    size: Mapped[int] = mapped_column()
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=text("CURRENT_TIMESTAMP")
+    )
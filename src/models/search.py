@@ -0,0 +1,80 @@
+"""FTS5 full-text indexes for events, courses and contact messages.
+
+Each index is an external-content FTS5 table over its source table, kept in
+sync by triggers. unicode61 folds case for all scripts (SQLite's LIKE only
+folds ASCII), so «концерт» matches «Концерт». The DDL is attached to the
+source tables so create_all/drop_all handle it; the Alembic migration
+carries the same statements. A batch (table-recreating) migration on a
+source table drops its triggers — re-create them in the same migration.
+"""
+
+import re
+
+from sqlalchemy import DDL, ColumnElement, event, literal_column
+from sqlalchemy.sql import column, table
+
+from src.models.contact import ContactMessage
+from src.models.course import Course
+from src.models.event import Event
+
+FTS_TOKENIZE = "unicode61 remove_diacritics 2"
+FTS_PREFIX = "2 3"  # extra prefix indexes so short "word*" queries stay cheap
+
+# source table -> indexed columns
+FTS_COLUMNS: dict[str, tuple[str, ...]] = {
+    Event.__tablename__: ("title", "description", "location"),
+    Course.__tablename__: ("title", "description", "schedule"),
+    ContactMessage.__tablename__: ("name", "message", "phone"),
+}
+
+
+def fts_ddl(source: str, columns: tuple[str, ...]) -> list[str]:
+    """CREATE statements for <source>_fts and the triggers that maintain it."""
+    fts = f"{source}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    delete = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});"
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, "
+        f"content='{source}', content_rowid='id', "
+        f"tokenize='{FTS_TOKENIZE}', prefix='{FTS_PREFIX}')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {source} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {source} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {source} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+for _model in (Event, Course, ContactMessage):
+    _source = _model.__tablename__
+    for _statement in fts_ddl(_source, FTS_COLUMNS[_source]):
+        event.listen(_model.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+    event.listen(
+        _model.__table__,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {_source}_fts").execute_if(dialect="sqlite"),
+    )
+
+events_fts = table("events_fts", column("rowid"), column("rank"))
+courses_fts = table("courses_fts", column("rowid"), column("rank"))
+contact_messages_fts = table("contact_messages_fts", column("rowid"), column("rank"))
+
+_WORD = re.compile(r"\w+")
+
+
+def fts_query(search: str) -> str | None:
+    """Turn free text into an FTS5 query: every word must match as a prefix.
+
+    Words are quoted, so FTS5 operators typed by the user are matched
+    literally. Returns None when the text has no searchable words.
+    """
+    words = _WORD.findall(search)
+    if not words:
+        return None
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def fts_match(fts, query: str) -> ColumnElement[bool]:
+    return literal_column(fts.name).match(query)
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database import Base
+
+
+class GhostSyncTask(Base):
+    """Pending Ghost page rebuild — one row per page, survives restarts."""
+
+    __tablename__ = "ghost_sync_queue"
+
+    page: Mapped[str] = mapped_column(String(20), primary_key=True)
+    attempts: Mapped[int] = mapped_column(default=0)
+    last_error: Mapped[str | None] = mapped_column(Text)
+    requested_at: Mapped[datetime] = mapped_column(
+        server_default=text("CURRENT_TIMESTAMP")
+    )
@@ -1,13 +1,17 @@
 from src.repositories.base import BaseRepository
 from src.repositories.contact import ContactRepository
+from src.repositories.counter import EntityCountRepository
 from src.repositories.course import CourseRepository
 from src.repositories.event import EventRepository
+from src.repositories.image import ImageUploadRepository
 from src.repositories.user import UserRepository
 
 __all__ = [
     "BaseRepository",
     "ContactRepository",
     "CourseRepository",
+    "EntityCountRepository",
     "EventRepository",
+    "ImageUploadRepository",
     "UserRepository",
 ]
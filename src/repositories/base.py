@@ -1,12 +1,116 @@
-from typing import Generic, TypeVar
+import functools
+from typing import Any, Generic, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    DateTime,
+    Select,
+    String,
+    and_,
+    false,
+    func,
+    or_,
+    select,
+    type_coerce,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database import Base
+from src.database import READ_SCOPE, Base
+from src.models.search import fts_match, fts_query
+from src.utils.cursor import decode_cursor, encode_cursor
 
 T = TypeVar("T", bound=Base)
 
+# (expression, descending). A list's sort order; the last key must be unique (id).
+SortKey = tuple[Any, bool]
+
+
+def search_filter(stmt: Select, model, fts, search: str | None) -> tuple[Select, bool]:
+    """Join stmt to model's FTS index and keep rows matching search.
+
+    Returns (stmt, ranked): ranked is True when a filter was applied and
+    fts.c.rank (bm25, lower is better) can be used for ordering. Callers page
+    ranked results by (rank, id). Rank depends on corpus statistics, so a
+    write between two cursor requests can shift it and make the walk skip or
+    repeat a row near the page boundary.
+    """
+    query = fts_query(search) if search else None
+    if query is None:
+        return stmt, False
+    stmt = stmt.join(fts, fts.c.rowid == model.id).where(fts_match(fts, query))
+    return stmt, True
+
+
+def _python_type(expr) -> type | None:
+    try:
+        return expr.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _nullable(expr) -> bool:
+    column = getattr(expr, "clause", expr)  # through type_coerce
+    column = getattr(column, "expression", column)
+    return bool(getattr(column, "nullable", False))
+
+
+def _stored(expr):
+    """Compare DateTime keys as the text SQLite stores.
+
+    CURRENT_TIMESTAMP defaults are stored without microseconds while bound
+    datetimes carry them, so a row would not equal its own cursor value.
+    """
+    if isinstance(getattr(expr, "type", None), DateTime):
+        return type_coerce(expr, String)
+    return expr
+
+
+def _equal(expr, value) -> ColumnElement[bool]:
+    return expr.is_not_distinct_from(value) if _nullable(expr) else expr == value
+
+
+def _after(expr, desc: bool, value) -> ColumnElement[bool]:
+    """expr sorts strictly after value. SQLite puts NULLs first ascending, last descending."""
+    if value is None:
+        return false() if desc else expr.is_not(None)
+    if desc:
+        return or_(expr < value, expr.is_(None)) if _nullable(expr) else expr < value
+    return expr > value
+
+
+def keyset_after(keys: list[SortKey], values: list) -> ColumnElement[bool]:
+    """Rows that come after `values` in `keys` order — the keyset page condition."""
+    branches = []
+    for i, (expr, desc) in enumerate(keys):
+        equal = [_equal(k, v) for (k, _), v in zip(keys[:i], values[:i], strict=True)]
+        branches.append(and_(*equal, _after(expr, desc, values[i])))
+    clause = or_(*branches)
+    # Redundant bound on the leading key lets SQLite seek its index instead of scanning
+    lead, desc = keys[0]
+    if values[0] is not None and not _nullable(lead):
+        clause = and_(lead <= values[0] if desc else lead >= values[0], clause)
+    return clause
+
+
+def read_only(method):
+    """Mark a repository method as a pure read.
+
+    Its queries go to the read-only engine when the session is a
+    RoutingSession that hasn't written in the current transaction.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        info = self.session.info
+        info[READ_SCOPE] = info.get(READ_SCOPE, 0) + 1
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            info[READ_SCOPE] -= 1
+
+    return wrapper
+
 
 class BaseRepository(Generic[T]):
     def __init__(self, model: type[T], session: AsyncSession):
@@ -16,39 +120,77 @@ class BaseRepository(Generic[T]):
     async def get(self, id: int) -> T | None:
         return await self.session.get(self.model, id)
 
+    async def _page(
+        self,
+        query: Select,
+        keys: list[SortKey],
+        offset: int,
+        limit: int,
+        cursor: str | None,
+    ) -> tuple[list[T], str | None]:
+        """Run query ordered by keys; return one page and the cursor for the next.
+
+        A cursor replaces offset: the page starts right after the row it was
+        taken from, so deep pages cost the same as the first. next_cursor is
+        None on the last page.
+        """
+        keys = [(_stored(expr), desc) for expr, desc in keys]
+        if cursor:
+            values = decode_cursor(cursor, [_python_type(expr) for expr, _ in keys])
+            query = query.where(keyset_after(keys, values))
+        else:
+            query = query.offset(offset)
+        query = (
+            query.add_columns(*(expr.label(f"_key{i}") for i, (expr, _) in enumerate(keys)))
+            .order_by(*(expr.desc() if desc else expr.asc() for expr, desc in keys))
+            .limit(limit + 1)
+        )
+        rows = (await self.session.execute(query)).all()
+        next_cursor = encode_cursor(rows[limit - 1][1:]) if len(rows) > limit else None
+        return [row[0] for row in rows[:limit]], next_cursor
+
+    @read_only
     async def list(
         self,
         offset: int = 0,
         limit: int = 20,
-        order_by=None,
-    ) -> tuple[list[T], int]:
+        keys: list[SortKey] | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[T], int, str | None]:
         count_query = select(func.count()).select_from(self.model)
         total = (await self.session.execute(count_query)).scalar() or 0
 
-        query = select(self.model)
-        if order_by is not None:
-            query = query.order_by(order_by)
-        else:
-            query = query.order_by(self.model.id.desc())
-        query = query.offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
-        return items, total
+        keys = keys or [(self.model.id, True)]
+        items, next_cursor = await self._page(select(self.model), keys, offset, limit, cursor)
+        return items, total, next_cursor
 
     async def create(self, **kwargs) -> T:
         instance = self.model(**kwargs)
         self.session.add(instance)
         await self.session.flush()
-        await self.session.refresh(instance)
         return instance
 
     async def update(self, instance: T, **kwargs) -> T:
         for key, value in kwargs.items():
             setattr(instance, key, value)
         await self.session.flush()
-        await self.session.refresh(instance)
         return instance
 
+    async def update_if(self, id: int, *conditions: ColumnElement[bool], **values) -> T | None:
+        """Update one row only while conditions hold; None if it didn't match.
+
+        A single UPDATE … WHERE … RETURNING, so the check and the write can't
+        be split by a concurrent request.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, *conditions)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return (await self.session.execute(stmt)).scalar_one_or_none()
+
     async def delete(self, instance: T) -> None:
         await self.session.delete(instance)
         await self.session.flush()
@@ -4,13 +4,23 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.contact import ContactMessage
-from src.repositories.base import BaseRepository
+from src.models.counter import CONTACT_BUCKET_PROCESSED, CONTACT_BUCKET_UNPROCESSED
+from src.models.search import contact_messages_fts
+from src.repositories.base import BaseRepository, read_only, search_filter
+from src.repositories.counter import EntityCountRepository
+
+
+def _processed_bucket(is_processed: bool | None) -> str | None:
+    if is_processed is None:
+        return None
+    return CONTACT_BUCKET_PROCESSED if is_processed else CONTACT_BUCKET_UNPROCESSED
 
 
 class ContactRepository(BaseRepository[ContactMessage]):
     def __init__(self, session: AsyncSession):
         super().__init__(ContactMessage, session)
 
+    @read_only
     async def list_filtered(
         self,
         offset: int = 0,
@@ -19,7 +29,9 @@ class ContactRepository(BaseRepository[ContactMessage]):
         sort: str = "desc",
         date_from: date | None = None,
         date_to: date | None = None,
-    ) -> tuple[list[ContactMessage], int]:
+        search: str | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[ContactMessage], int, str | None]:
         base = select(ContactMessage)
         count_base = select(func.count()).select_from(ContactMessage)
 
@@ -37,10 +49,19 @@ class ContactRepository(BaseRepository[ContactMessage]):
             base = base.where(ContactMessage.created_at <= dt_to)
             count_base = count_base.where(ContactMessage.created_at <= dt_to)
 
-        total = (await self.session.execute(count_base)).scalar() or 0
+        base, ranked = search_filter(base, ContactMessage, contact_messages_fts, search)
+        count_base, _ = search_filter(count_base, ContactMessage, contact_messages_fts, search)
+
+        if ranked or date_from is not None or date_to is not None:
+            total = (await self.session.execute(count_base)).scalar() or 0
+        else:
+            total = await EntityCountRepository(self.session).get(
+                ContactMessage.__tablename__, _processed_bucket(is_processed)
+            )
 
-        order = ContactMessage.created_at.asc() if sort == "asc" else ContactMessage.created_at.desc()
-        query = base.order_by(order).offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
-        return items, total
+        desc = sort != "asc"
+        keys = [(ContactMessage.created_at, desc), (ContactMessage.id, desc)]
+        if ranked:
+            keys = [(contact_messages_fts.c.rank, False), (ContactMessage.id, False)]
+        items, next_cursor = await self._page(base, keys, offset, limit, cursor)
+        return items, total, next_cursor
@@ -0,0 +1,18 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.counter import EntityCount
+
+
+class EntityCountRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, entity: str, bucket: str | None = None) -> int:
+        """Rows of entity in bucket, or in all buckets when bucket is None."""
+        query = select(func.coalesce(func.sum(EntityCount.count), 0)).where(
+            EntityCount.entity == entity
+        )
+        if bucket is not None:
+            query = query.where(EntityCount.bucket == bucket)
+        return (await self.session.execute(query)).scalar_one()
@@ -2,20 +2,24 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.course import Course, CourseStatus
-from src.repositories.base import BaseRepository
+from src.models.search import courses_fts
+from src.repositories.base import BaseRepository, read_only, search_filter
+from src.repositories.counter import EntityCountRepository
 
 
 class CourseRepository(BaseRepository[Course]):
     def __init__(self, session: AsyncSession):
         super().__init__(Course, session)
 
+    @read_only
     async def list_filtered(
         self,
         offset: int = 0,
         limit: int = 20,
         status: CourseStatus | None = None,
         search: str | None = None,
-    ) -> tuple[list[Course], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[Course], int, str | None]:
         base = select(Course)
         count_base = select(func.count()).select_from(Course)
 
@@ -23,18 +27,24 @@ class CourseRepository(BaseRepository[Course]):
             base = base.where(Course.status == status)
             count_base = count_base.where(Course.status == status)
 
-        if search:
-            pattern = f"%{search}%"
-            base = base.where(Course.title.like(pattern))
-            count_base = count_base.where(Course.title.like(pattern))
+        base, ranked = search_filter(base, Course, courses_fts, search)
+        count_base, _ = search_filter(count_base, Course, courses_fts, search)
 
-        total = (await self.session.execute(count_base)).scalar() or 0
+        if ranked:
+            total = (await self.session.execute(count_base)).scalar() or 0
+        else:
+            # Stored status is the enum name — the counter bucket
+            total = await EntityCountRepository(self.session).get(
+                Course.__tablename__, status.name if status else None
+            )
 
-        query = base.order_by(Course.order.asc(), Course.id.desc()).offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
-        return items, total
+        keys = [(Course.order, False), (Course.id, True)]
+        if ranked:
+            keys = [(courses_fts.c.rank, False), (Course.id, False)]
+        items, next_cursor = await self._page(base, keys, offset, limit, cursor)
+        return items, total, next_cursor
 
+    @read_only
     async def get_published(self) -> list[Course]:
         query = (
             select(Course)
@@ -4,20 +4,24 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.event import Event, EventStatus
-from src.repositories.base import BaseRepository
+from src.models.search import events_fts
+from src.repositories.base import BaseRepository, read_only, search_filter
+from src.repositories.counter import EntityCountRepository
 
 
 class EventRepository(BaseRepository[Event]):
     def __init__(self, session: AsyncSession):
         super().__init__(Event, session)
 
+    @read_only
     async def list_filtered(
         self,
         offset: int = 0,
         limit: int = 20,
         status: EventStatus | None = None,
         search: str | None = None,
-    ) -> tuple[list[Event], int]:
+        cursor: str | None = None,
+    ) -> tuple[list[Event], int, str | None]:
         base = select(Event)
         count_base = select(func.count()).select_from(Event)
 
@@ -25,18 +29,24 @@ class EventRepository(BaseRepository[Event]):
             base = base.where(Event.status == status)
             count_base = count_base.where(Event.status == status)
 
-        if search:
-            pattern = f"%{search}%"
-            base = base.where(Event.title.like(pattern))
-            count_base = count_base.where(Event.title.like(pattern))
+        base, ranked = search_filter(base, Event, events_fts, search)
+        count_base, _ = search_filter(count_base, Event, events_fts, search)
 
-        total = (await self.session.execute(count_base)).scalar() or 0
+        if ranked:
+            total = (await self.session.execute(count_base)).scalar() or 0
+        else:
+            # Stored status is the enum name — the counter bucket
+            total = await EntityCountRepository(self.session).get(
+                Event.__tablename__, status.name if status else None
+            )
 
-        query = base.order_by(Event.order.asc(), Event.event_date.asc()).offset(offset).limit(limit)
-        result = await self.session.execute(query)
-        items = list(result.scalars().all())
-        return items, total
+        keys = [(Event.order, False), (Event.event_date, False), (Event.id, False)]
+        if ranked:
+            keys = [(events_fts.c.rank, False), (Event.id, False)]
+        items, next_cursor = await self._page(base, keys, offset, limit, cursor)
+        return items, total, next_cursor
 
+    @read_only
     async def get_published(self) -> list[Event]:
         query = (
             select(Event)
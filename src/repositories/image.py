@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.image import ImageUpload
+
+
+class ImageUploadRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_urls(self, digests: list[str]) -> dict[str, str]:
+        query = select(ImageUpload.sha256, ImageUpload.url).where(
+            ImageUpload.sha256.in_(digests)
+        )
+        result = await self.session.execute(query)
+        return dict(result.all())
+
+    async def record(self, sha256: str, url: str, content_type: str, size: int) -> None:
+        """Remember an upload. A concurrent upload of the same bytes keeps the first URL."""
+        stmt = insert(ImageUpload).values(
+            sha256=sha256, url=url, content_type=content_type, size=size
+        )
+        await self.session.execute(stmt.on_conflict_do_nothing(index_elements=["sha256"]))
@@ -2,13 +2,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.user import ROLE_ADMIN, WhitelistUser
-from src.repositories.base import BaseRepository
+from src.repositories.base import BaseRepository, read_only
 
 
 class UserRepository(BaseRepository[WhitelistUser]):
     def __init__(self, session: AsyncSession):
         super().__init__(WhitelistUser, session)
 
+    @read_only
     async def get_by_telegram_id(self, telegram_id: int) -> WhitelistUser | None:
         query = select(WhitelistUser).where(WhitelistUser.telegram_id == telegram_id)
         result = await self.session.execute(query)
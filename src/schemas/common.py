@@ -12,5 +12,12 @@ class ErrorResponse(BaseModel):
     details: dict | None = None
 
 
-class ImageUploadResponse(BaseModel):
+class ImageVariant(BaseModel):
+    width: int
     url: str
+
+
+class ImageUploadResponse(BaseModel):
+    url: str | None  # None while the upload is still processing
+    state: str
+    variants: list[ImageVariant] = []
@@ -4,6 +4,7 @@ from decimal import Decimal
 from pydantic import BaseModel, Field
 
 from src.models.course import CourseStatus
+from src.schemas.common import ImageVariant
 
 
 class CourseCreate(BaseModel):
@@ -34,6 +35,10 @@ class CourseResponse(BaseModel):
     schedule: str
     image_desktop: str | None
     image_mobile: str | None
+    image_desktop_variants: list[ImageVariant] | None = None
+    image_mobile_variants: list[ImageVariant] | None = None
+    image_desktop_state: str | None = None
+    image_mobile_state: str | None = None
     cost: Decimal
     currency: str
     status: CourseStatus
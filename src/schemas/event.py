@@ -3,6 +3,7 @@ from datetime import date, datetime, time
 from pydantic import BaseModel, Field
 
 from src.models.event import EventStatus
+from src.schemas.common import ImageVariant
 
 
 class EventCreate(BaseModel):
@@ -33,6 +34,8 @@ class EventResponse(BaseModel):
     event_date: date | None
     event_time: time | None
     cover_image: str | None
+    cover_image_variants: list[ImageVariant] | None = None
+    cover_image_state: str | None = None
     ticket_link: str | None
     status: EventStatus
     order: int
@@ -8,6 +8,13 @@ class MeResponse(BaseModel):
     first_name: str | None
 
 
+class SessionResponse(BaseModel):
+    token: str
+    expires_at: int  # unix seconds
+    role: str
+    user: MeResponse
+
+
 class UserCreate(BaseModel):
     telegram_id: int
     username: str | None = Field(default=None, max_length=255)
@@ -1,19 +1,41 @@
 import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
 from urllib.parse import urlparse
 
 import structlog
 from markupsafe import escape
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
 
 from src.config import settings
 from src.database import async_session_factory
 from src.models.course import Course
 from src.models.event import Event
+from src.models.sync import GhostSyncTask
 from src.repositories.course import CourseRepository
 from src.repositories.event import EventRepository
 from src.services.ghost import GhostClient
 
 logger = structlog.get_logger()
 
+PAGE_EVENTS = "events"
+PAGE_COURSES = "courses"
+SYNC_PAGES = (PAGE_EVENTS, PAGE_COURSES)
+
+SYNC_DEBOUNCE = 2.0  # seconds — bursts of edits within this window share one rebuild
+SYNC_RETRY_BASE = 30  # seconds — first retry delay after a failed sync
+SYNC_RETRY_MAX = 600  # seconds — backoff cap while Ghost stays unavailable
+
+CARD_CACHE_SIZE = 512  # rendered card fragments kept between syncs (LRU)
+
+# `sizes` hints for srcset — how wide each image slot renders on the Ghost page
+EVENT_COVER_SIZES = "(max-width: 560px) 100vw, 516px"
+COURSE_IMAGE_SIZES = "100vw"
+
 CURRENCY_SYMBOLS = {"RUB": "\u20bd", "USD": "$", "EUR": "\u20ac"}
 
 MONTHS_RU = {
@@ -58,6 +80,14 @@ def _safe_url(url: str | None) -> str | None:
     return url
 
 
+def _srcset_attrs(variants: list[dict] | None, sizes: str) -> str:
+    """srcset/sizes attributes for stored image variants; empty for a single image."""
+    if not variants or len(variants) < 2:
+        return ""
+    srcset = ", ".join(f"{escape(v['url'])} {int(v['width'])}w" for v in variants)
+    return f' srcset="{srcset}" sizes="{sizes}"'
+
+
 def _format_title_html(title: str) -> str:
     """Split title by newlines into <span><br><span> pairs matching Ghost card format."""
     parts = str(escape(title)).split("\n")
@@ -69,26 +99,60 @@ def _format_title_html(title: str) -> str:
 class ContentPageBuilder:
     """Builds HTML from published entities and pushes to Ghost pages."""
 
-    def __init__(self, ghost_client: GhostClient, notification_service=None):
+    def __init__(
+        self,
+        ghost_client: GhostClient,
+        notification_service=None,
+        card_cache_size: int = CARD_CACHE_SIZE,
+    ):
         self.ghost_client = ghost_client
         self.notification_service = notification_service
         self._events_lock = asyncio.Lock()
         self._courses_lock = asyncio.Lock()
+        self._card_cache: OrderedDict[tuple, str] = OrderedDict()
+        self._card_cache_size = card_cache_size
+        self.card_cache_hits = 0
+        self.card_cache_misses = 0
+        self.sync_queue = GhostSyncQueue(self)
 
     def build_events_html(self, events: list[Event]) -> str:
         """Render all event cards wrapped in container div."""
         if not events:
             return "<p>Нет предстоящих мероприятий</p>"
-        cards = "\n".join(self._render_event_card(e) for e in events)
+        cards = "\n".join(
+            self._cached_card("event", e, self._render_event_card) for e in events
+        )
         return f'<div class="col3 kg-width-wide">\n{cards}\n</div>'
 
     def build_courses_html(self, courses: list[Course]) -> str:
         """Render all course cards wrapped in container div."""
         if not courses:
             return "<p>Нет доступных курсов</p>"
-        cards = "\n".join(self._render_course_card(c) for c in courses)
+        cards = "\n".join(
+            self._cached_card("course", c, self._render_course_card) for c in courses
+        )
         return f'<div class="col3 kg-width-wide">\n{cards}\n</div>'
 
+    def _cached_card(self, kind: str, entity, render: Callable[..., str]) -> str:
+        """Return the card fragment for entity, rendering only if it changed.
+
+        Every write bumps updated_at, so (kind, id, updated_at) identifies
+        one version of the card; stale versions age out of the LRU.
+        """
+        key = (kind, entity.id, entity.updated_at)
+        fragment = self._card_cache.get(key)
+        if fragment is not None:
+            self._card_cache.move_to_end(key)
+            self.card_cache_hits += 1
+            return fragment
+
+        self.card_cache_misses += 1
+        fragment = render(entity)
+        self._card_cache[key] = fragment
+        if len(self._card_cache) > self._card_cache_size:
+            self._card_cache.popitem(last=False)
+        return fragment
+
     def _render_event_card(self, event: Event) -> str:
         """Single event -> kg-product-card HTML. All user input escaped."""
         title_html = _format_title_html(event.title)
@@ -99,8 +163,9 @@ class ContentPageBuilder:
         image_html = ""
         if event.cover_image:
             img_url = escape(event.cover_image)
+            srcset = _srcset_attrs(event.cover_image_variants, EVENT_COVER_SIZES)
             image_html = (
-                f'        <img src="{img_url}" width="516" height="516"\n'
+                f'        <img src="{img_url}"{srcset} width="516" height="516"\n'
                 f'             class="kg-product-card-image" loading="lazy">'
             )
 
@@ -148,12 +213,14 @@ class ContentPageBuilder:
         desktop_img = ""
         if course.image_desktop:
             img_url = escape(course.image_desktop)
-            desktop_img = f'    <img class="smh" src="{img_url}" alt="{title}">'
+            srcset = _srcset_attrs(course.image_desktop_variants, COURSE_IMAGE_SIZES)
+            desktop_img = f'    <img class="smh" src="{img_url}"{srcset} alt="{title}">'
 
         mobile_img = ""
         if course.image_mobile:
             img_url = escape(course.image_mobile)
-            mobile_img = f'    <img class="pch" src="{img_url}" alt="{title}">'
+            srcset = _srcset_attrs(course.image_mobile_variants, COURSE_IMAGE_SIZES)
+            mobile_img = f'    <img class="pch" src="{img_url}"{srcset} alt="{title}">'
 
         detailed_html = ""
         if course.detailed_description:
@@ -181,8 +248,8 @@ class ContentPageBuilder:
             f"</div>"
         )
 
-    async def sync_events_page(self) -> None:
-        """Fetch PUBLISHED events -> build HTML -> PUT to Ghost page."""
+    async def sync_events_page(self, notify: bool = True, force: bool = False) -> None:
+        """Fetch PUBLISHED events -> build HTML -> PUT to Ghost page (skipped if unchanged)."""
         async with self._events_lock:
             try:
                 async with async_session_factory() as session:
@@ -190,13 +257,13 @@ class ContentPageBuilder:
                     events = await repo.get_published()
 
                 html = self.build_events_html(events)
-                await self.ghost_client.update_page_html(
-                    settings.GHOST_EVENTS_PAGE_ID, html
+                pushed = await self.ghost_client.update_page_html(
+                    settings.GHOST_EVENTS_PAGE_ID, html, force=force
                 )
-                logger.info("Events page synced", count=len(events))
+                logger.info("Events page synced", count=len(events), pushed=pushed)
             except Exception:
                 logger.exception("Ghost sync failed for events page")
-                if self.notification_service:
+                if notify and self.notification_service:
                     try:
                         await self.notification_service.notify_admins(
                             "Ghost sync FAILED for events page. Manual check required."
@@ -205,8 +272,8 @@ class ContentPageBuilder:
                         pass
                 raise
 
-    async def sync_courses_page(self) -> None:
-        """Fetch PUBLISHED courses -> build HTML -> PUT to Ghost page."""
+    async def sync_courses_page(self, notify: bool = True, force: bool = False) -> None:
+        """Fetch PUBLISHED courses -> build HTML -> PUT to Ghost page (skipped if unchanged)."""
         async with self._courses_lock:
             try:
                 async with async_session_factory() as session:
@@ -214,13 +281,13 @@ class ContentPageBuilder:
                     courses = await repo.get_published()
 
                 html = self.build_courses_html(courses)
-                await self.ghost_client.update_page_html(
-                    settings.GHOST_COURSES_PAGE_ID, html
+                pushed = await self.ghost_client.update_page_html(
+                    settings.GHOST_COURSES_PAGE_ID, html, force=force
                 )
-                logger.info("Courses page synced", count=len(courses))
+                logger.info("Courses page synced", count=len(courses), pushed=pushed)
             except Exception:
                 logger.exception("Ghost sync failed for courses page")
-                if self.notification_service:
+                if notify and self.notification_service:
                     try:
                         await self.notification_service.notify_admins(
                             "Ghost sync FAILED for courses page. Manual check required."
@@ -228,3 +295,180 @@ class ContentPageBuilder:
                     except Exception:
                         pass
                 raise
+
+
+class GhostSyncQueue:
+    """Coalescing background queue for Ghost page rebuilds.
+
+    Services only enqueue a page name; a single worker task waits SYNC_DEBOUNCE
+    seconds and rebuilds every pending page once, so a burst of edits costs one
+    Ghost round trip per page. Pending pages are persisted in ghost_sync_queue
+    and picked up again on start, failed syncs are retried with backoff.
+    A page joins the in-memory pending set only after its row is committed,
+    and the row is deleted only while the page isn't pending again — both
+    under _persist_lock, so the set and the table can't drift apart.
+    """
+
+    def __init__(self, builder: ContentPageBuilder, debounce: float = SYNC_DEBOUNCE):
+        self.builder = builder
+        self.debounce = debounce
+        self._pending: set[str] = set()
+        self._attempts: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+        self._last_synced: dict[str, datetime] = {}
+        self._last_error: dict[str, str] = {}
+        self._running: str | None = None
+        self._wakeup = asyncio.Event()
+        self._persist_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.enqueued = 0
+        self.coalesced = 0
+        self.synced = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Load persisted pending pages and start the worker task."""
+        async with async_session_factory() as session:
+            result = await session.execute(select(GhostSyncTask))
+            for task in result.scalars().all():
+                self._pending.add(task.page)
+                self._attempts[task.page] = task.attempts
+
+        if self._pending:
+            logger.info("Resuming pending Ghost syncs", pages=sorted(self._pending))
+            self._wakeup.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def enqueue(self, page: str) -> None:
+        """Mark a page for rebuild. Returns as soon as the request is persisted."""
+        if page not in SYNC_PAGES:
+            raise ValueError(f"Unknown Ghost page: {page}")
+
+        self.enqueued += 1
+        if page in self._pending:
+            self.coalesced += 1
+            return
+
+        async with self._persist_lock:
+            async with async_session_factory() as session:
+                await session.execute(
+                    insert(GhostSyncTask).values(page=page, attempts=0).on_conflict_do_nothing()
+                )
+                await session.commit()
+            self._pending.add(page)
+        self._wakeup.set()
+
+    def status(self) -> dict:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "in_progress": self._running,
+            "pending": sorted(self._pending),
+            "pages": {
+                page: {
+                    "attempts": self._attempts.get(page, 0),
+                    "last_synced_at": self._last_synced.get(page),
+                    "last_error": self._last_error.get(page),
+                }
+                for page in SYNC_PAGES
+            },
+            "stats": {
+                "enqueued": self.enqueued,
+                "coalesced": self.coalesced,
+                "synced": self.synced,
+                "failed": self.failed,
+            },
+            "ghost": self.builder.ghost_client.stats(),
+        }
+
+    def _next_retry_delay(self) -> float | None:
+        retries = [self._retry_at[p] for p in self._pending if p in self._retry_at]
+        if not retries:
+            return None
+        return max(0.0, min(retries) - time.monotonic())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._next_retry_delay())
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await asyncio.sleep(self.debounce)
+            try:
+                await self.drain()
+            except Exception:
+                # Keep the worker alive; pending pages stay queued for the next wakeup
+                logger.exception("Ghost sync queue drain failed")
+
+    async def drain(self) -> None:
+        """Rebuild every pending page whose retry delay has elapsed."""
+        now = time.monotonic()
+        due = [p for p in SYNC_PAGES if p in self._pending and self._retry_at.get(p, 0) <= now]
+        for page in due:
+            self._pending.discard(page)
+            self._running = page
+            try:
+                await self._sync(page)
+            except Exception as exc:
+                await self._guarded(self._record_failure(page, exc), page)
+            else:
+                await self._guarded(self._record_success(page), page)
+            finally:
+                self._running = None
+
+    async def _guarded(self, record, page: str) -> None:
+        """Await a _record_* call; a failed DB write is logged, not raised."""
+        try:
+            await record
+        except Exception:
+            logger.exception("Failed to persist Ghost sync state", page=page)
+
+    async def _sync(self, page: str) -> None:
+        notify = self._attempts.get(page, 0) == 0
+        if page == PAGE_EVENTS:
+            await self.builder.sync_events_page(notify=notify)
+        else:
+            await self.builder.sync_courses_page(notify=notify)
+
+    async def _record_success(self, page: str) -> None:
+        self.synced += 1
+        self._attempts.pop(page, None)
+        self._retry_at.pop(page, None)
+        self._last_error.pop(page, None)
+        self._last_synced[page] = datetime.now(UTC)
+
+        async with self._persist_lock:
+            # A new enqueue may have arrived while the sync was running — keep its row
+            if page in self._pending:
+                return
+            async with async_session_factory() as session:
+                await session.execute(delete(GhostSyncTask).where(GhostSyncTask.page == page))
+                await session.commit()
+
+    async def _record_failure(self, page: str, exc: Exception) -> None:
+        self.failed += 1
+        attempts = self._attempts.get(page, 0) + 1
+        self._attempts[page] = attempts
+        self._last_error[page] = repr(exc)
+        delay = min(SYNC_RETRY_BASE * 2 ** (attempts - 1), SYNC_RETRY_MAX)
+        self._retry_at[page] = time.monotonic() + delay
+        self._pending.add(page)
+        logger.warning("Ghost sync deferred", page=page, attempts=attempts, retry_in=delay)
+
+        async with self._persist_lock, async_session_factory() as session:
+            await session.execute(
+                insert(GhostSyncTask)
+                .values(page=page, attempts=attempts, last_error=repr(exc))
+                .on_conflict_do_update(
+                    index_elements=[GhostSyncTask.page],
+                    set_={"attempts": attempts, "last_error": repr(exc)},
+                )
+            )
+            await session.commit()
@@ -1,13 +1,35 @@
 import structlog
+from sqlalchemy import and_
 
 from src.exceptions import NotFoundError, ValidationError
 from src.models.course import Course, CourseStatus
+from src.models.image import IMAGE_STATE_PENDING
 from src.repositories.course import CourseRepository
 from src.schemas.course import CourseCreate, CourseUpdate
 from src.services.audit import AuditService
+from src.services.content_page import PAGE_COURSES
+from src.services.lifecycle import Lifecycle, filled
 
 logger = structlog.get_logger()
 
+COURSE_LIFECYCLE = Lifecycle(
+    Course,
+    "Course",
+    requirements=[
+        (filled(Course.title), "Title is required"),
+        (filled(Course.description), "Description is required"),
+        (filled(Course.schedule), "Schedule is required"),
+        (Course.cost.is_not(None), "Cost is required"),
+        (
+            and_(
+                Course.image_desktop_state.is_distinct_from(IMAGE_STATE_PENDING),
+                Course.image_mobile_state.is_distinct_from(IMAGE_STATE_PENDING),
+            ),
+            "Image upload is still in progress",
+        ),
+    ],
+)
+
 
 class CourseService:
     def __init__(
@@ -34,8 +56,9 @@ class CourseService:
         limit: int = 20,
         status: CourseStatus | None = None,
         search: str | None = None,
-    ) -> tuple[list[Course], int]:
-        return await self.repo.list_filtered(offset, limit, status, search)
+        cursor: str | None = None,
+    ) -> tuple[list[Course], int, str | None]:
+        return await self.repo.list_filtered(offset, limit, status, search, cursor)
 
     async def create(self, data: CourseCreate, user_id: int) -> Course:
         course = await self.repo.create(
@@ -80,18 +103,7 @@ class CourseService:
             await self._sync_ghost_page()
 
     async def publish(self, course_id: int, user_id: int) -> Course:
-        course = await self.get(course_id)
-
-        if not course.title:
-            raise ValidationError("Title is required")
-        if not course.description:
-            raise ValidationError("Description is required")
-        if not course.schedule:
-            raise ValidationError("Schedule is required")
-        if not course.cost and course.cost != 0:
-            raise ValidationError("Cost is required")
-
-        course = await self.repo.update(course, status=CourseStatus.PUBLISHED)
+        course = await COURSE_LIFECYCLE.transition(self.repo, "publish", course_id)
         await self.audit.log(user_id, "publish", "course", course.id)
         await self.repo.session.commit()
 
@@ -101,8 +113,7 @@ class CourseService:
         return course
 
     async def unpublish(self, course_id: int, user_id: int) -> Course:
-        course = await self.get(course_id)
-        course = await self.repo.update(course, status=CourseStatus.DRAFT)
+        course = await COURSE_LIFECYCLE.transition(self.repo, "unpublish", course_id)
         await self.audit.log(user_id, "unpublish", "course", course.id)
         await self.repo.session.commit()
 
@@ -112,8 +123,7 @@ class CourseService:
         return course
 
     async def cancel(self, course_id: int, user_id: int) -> Course:
-        course = await self.get(course_id)
-        course = await self.repo.update(course, status=CourseStatus.CANCELLED)
+        course = await COURSE_LIFECYCLE.transition(self.repo, "cancel", course_id)
         await self.audit.log(user_id, "cancel", "course", course.id)
         await self.repo.session.commit()
 
@@ -123,11 +133,7 @@ class CourseService:
         return course
 
     async def archive(self, course_id: int, user_id: int) -> Course:
-        course = await self.get(course_id)
-        if course.status == CourseStatus.DRAFT:
-            raise ValidationError("Нельзя архивировать черновик")
-
-        course = await self.repo.update(course, status=CourseStatus.ARCHIVED)
+        course = await COURSE_LIFECYCLE.transition(self.repo, "archive", course_id)
         await self.audit.log(user_id, "archive", "course", course.id)
         await self.repo.session.commit()
 
@@ -136,22 +142,19 @@ class CourseService:
         return course
 
     async def reactivate(self, course_id: int, user_id: int) -> Course:
-        course = await self.get(course_id)
-        if course.status not in (CourseStatus.CANCELLED, CourseStatus.ARCHIVED):
-            raise ValidationError("Можно вернуть только отменённый или архивный")
-
-        course = await self.repo.update(course, status=CourseStatus.DRAFT)
+        course = await COURSE_LIFECYCLE.transition(self.repo, "reactivate", course_id)
         await self.audit.log(user_id, "reactivate", "course", course.id)
         await self.repo.session.commit()
 
         return course
 
     async def _sync_ghost_page(self) -> None:
+        """Enqueue a background rebuild of the courses Ghost page."""
         if self.content_page_builder:
             try:
-                await self.content_page_builder.sync_courses_page()
+                await self.content_page_builder.sync_queue.enqueue(PAGE_COURSES)
             except Exception:
-                logger.exception("Failed to sync courses Ghost page")
+                logger.exception("Failed to enqueue courses Ghost page sync")
 
     async def _notify_admins(self, message: str) -> None:
         if self.notification_service:
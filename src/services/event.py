@@ -2,12 +2,30 @@ import structlog
 
 from src.exceptions import NotFoundError, ValidationError
 from src.models.event import Event, EventStatus
+from src.models.image import IMAGE_STATE_PENDING
 from src.repositories.event import EventRepository
 from src.schemas.event import EventCreate, EventUpdate
 from src.services.audit import AuditService
+from src.services.content_page import PAGE_EVENTS
+from src.services.lifecycle import Lifecycle, filled
 
 logger = structlog.get_logger()
 
+EVENT_LIFECYCLE = Lifecycle(
+    Event,
+    "Event",
+    requirements=[
+        (filled(Event.title), "Title is required"),
+        (filled(Event.location), "Location is required"),
+        (Event.event_date.is_not(None), "Event date is required"),
+        (Event.event_time.is_not(None), "Event time is required"),
+        (
+            Event.cover_image_state.is_distinct_from(IMAGE_STATE_PENDING),
+            "Image upload is still in progress",
+        ),
+    ],
+)
+
 
 class EventService:
     def __init__(
@@ -34,8 +52,9 @@ class EventService:
         limit: int = 20,
         status: EventStatus | None = None,
         search: str | None = None,
-    ) -> tuple[list[Event], int]:
-        return await self.repo.list_filtered(offset, limit, status, search)
+        cursor: str | None = None,
+    ) -> tuple[list[Event], int, str | None]:
+        return await self.repo.list_filtered(offset, limit, status, search, cursor)
 
     async def create(self, data: EventCreate, user_id: int) -> Event:
         event = await self.repo.create(
@@ -81,19 +100,7 @@ class EventService:
             await self._sync_ghost_page()
 
     async def publish(self, event_id: int, user_id: int) -> Event:
-        event = await self.get(event_id)
-
-        # Validate required fields
-        if not event.title:
-            raise ValidationError("Title is required")
-        if not event.location:
-            raise ValidationError("Location is required")
-        if not event.event_date:
-            raise ValidationError("Event date is required")
-        if not event.event_time:
-            raise ValidationError("Event time is required")
-
-        event = await self.repo.update(event, status=EventStatus.PUBLISHED)
+        event = await EVENT_LIFECYCLE.transition(self.repo, "publish", event_id)
         await self.audit.log(user_id, "publish", "event", event.id)
         await self.repo.session.commit()
 
@@ -103,8 +110,7 @@ class EventService:
         return event
 
     async def unpublish(self, event_id: int, user_id: int) -> Event:
-        event = await self.get(event_id)
-        event = await self.repo.update(event, status=EventStatus.DRAFT)
+        event = await EVENT_LIFECYCLE.transition(self.repo, "unpublish", event_id)
         await self.audit.log(user_id, "unpublish", "event", event.id)
         await self.repo.session.commit()
 
@@ -114,8 +120,7 @@ class EventService:
         return event
 
     async def cancel(self, event_id: int, user_id: int) -> Event:
-        event = await self.get(event_id)
-        event = await self.repo.update(event, status=EventStatus.CANCELLED)
+        event = await EVENT_LIFECYCLE.transition(self.repo, "cancel", event_id)
         await self.audit.log(user_id, "cancel", "event", event.id)
         await self.repo.session.commit()
 
@@ -125,11 +130,7 @@ class EventService:
         return event
 
     async def archive(self, event_id: int, user_id: int) -> Event:
-        event = await self.get(event_id)
-        if event.status == EventStatus.DRAFT:
-            raise ValidationError("Нельзя архивировать черновик")
-
-        event = await self.repo.update(event, status=EventStatus.ARCHIVED)
+        event = await EVENT_LIFECYCLE.transition(self.repo, "archive", event_id)
         await self.audit.log(user_id, "archive", "event", event.id)
         await self.repo.session.commit()
 
@@ -138,22 +139,19 @@ class EventService:
         return event
 
     async def reactivate(self, event_id: int, user_id: int) -> Event:
-        event = await self.get(event_id)
-        if event.status not in (EventStatus.CANCELLED, EventStatus.ARCHIVED):
-            raise ValidationError("Можно вернуть только отменённое или архивное")
-
-        event = await self.repo.update(event, status=EventStatus.DRAFT)
+        event = await EVENT_LIFECYCLE.transition(self.repo, "reactivate", event_id)
         await self.audit.log(user_id, "reactivate", "event", event.id)
         await self.repo.session.commit()
 
         return event
 
     async def _sync_ghost_page(self) -> None:
+        """Enqueue a background rebuild of the events Ghost page."""
         if self.content_page_builder:
             try:
-                await self.content_page_builder.sync_events_page()
+                await self.content_page_builder.sync_queue.enqueue(PAGE_EVENTS)
             except Exception:
-                logger.exception("Failed to sync events Ghost page")
+                logger.exception("Failed to enqueue events Ghost page sync")
 
     async def _notify_admins(self, message: str) -> None:
         if self.notification_service:
@@ -1,36 +1,173 @@
+import asyncio
+import contextlib
+import hashlib
 import json
+from typing import BinaryIO
 
 import structlog
-from httpx import AsyncClient
-from tenacity import retry, stop_after_attempt, wait_exponential
+from httpx import (
+    AsyncClient,
+    AsyncHTTPTransport,
+    HTTPStatusError,
+    Limits,
+    Response,
+    Timeout,
+    TransportError,
+)
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
 
-from src.utils.ghost_jwt import make_ghost_jwt
+from src.config import settings
+from src.exceptions import ServiceUnavailableError
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.ghost_jwt import GhostTokenProvider
 
 logger = structlog.get_logger()
 
 
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry network errors, 5xx and 429; other 4xx are final."""
+    if isinstance(exc, TransportError):
+        return True
+    if isinstance(exc, HTTPStatusError):
+        code = exc.response.status_code
+        return code >= 500 or code == 429
+    return False
+
+
+def _build_http_client() -> AsyncClient:
+    """Keep-alive pooled client; HTTP/2 multiplexes concurrent calls over one TLS session."""
+    transport = AsyncHTTPTransport(
+        http2=settings.GHOST_HTTP2,
+        limits=Limits(
+            max_connections=settings.GHOST_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GHOST_MAX_KEEPALIVE,
+            keepalive_expiry=settings.GHOST_KEEPALIVE_EXPIRY,
+        ),
+    )
+    timeout = Timeout(
+        connect=settings.GHOST_CONNECT_TIMEOUT,
+        read=settings.GHOST_READ_TIMEOUT,
+        write=settings.GHOST_WRITE_TIMEOUT,
+        pool=settings.GHOST_POOL_TIMEOUT,
+    )
+    return AsyncClient(transport=transport, timeout=timeout)
+
+
 class GhostClient:
-    """Async Ghost Admin API client."""
+    """Async Ghost Admin API client.
+
+    Every public call runs under a total deadline (retries included) and goes
+    through a circuit breaker, so a slow or down Ghost fails fast with
+    ServiceUnavailableError instead of stacking retries on each request.
+    """
 
-    def __init__(self, ghost_url: str, admin_api_key: str):
+    def __init__(
+        self,
+        ghost_url: str,
+        admin_api_key: str,
+        call_deadline: float = settings.GHOST_CALL_DEADLINE,
+        breaker: CircuitBreaker | None = None,
+    ):
         self.ghost_url = ghost_url.rstrip("/")
         self.admin_api_key = admin_api_key
         self.api_base = f"{self.ghost_url}/ghost/api/admin"
-        self._client = AsyncClient(timeout=30.0)
+        self.call_deadline = call_deadline
+        self.breaker = breaker or CircuitBreaker(
+            "ghost",
+            failure_threshold=settings.GHOST_BREAKER_THRESHOLD,
+            reset_timeout=settings.GHOST_BREAKER_RESET,
+        )
+        self._client = _build_http_client()
+        self._retry_wait = wait_exponential(min=1, max=10)
+        self._tokens = GhostTokenProvider(admin_api_key)
+        # page_id -> sha256 of the last HTML successfully pushed to that page
+        self._page_digests: dict[str, str] = {}
+        # page_id -> (real_id, updated_at) from the last PUT response
+        self._page_state: dict[str, tuple[str, str]] = {}
+        self.pushes = 0
+        self.skips = 0
+        self.requests_sent = 0
+        self.http2_requests = 0
+        self.connections_opened = 0
 
     def _auth_headers(self) -> dict:
-        token = make_ghost_jwt(self.admin_api_key)
+        token = self._tokens.get_token()
         return {"Authorization": f"Ghost {token}"}
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
-    async def upload_image(self, file_bytes: bytes, filename: str) -> str:
-        """Upload image to Ghost via POST /images/upload, return public URL."""
+    async def _trace(self, event_name: str, info: dict) -> None:
+        """httpcore trace hook — counts new connections vs. requests to show reuse."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connections_opened += 1
+        elif event_name == "http11.send_request_headers.started":
+            self.requests_sent += 1
+        elif event_name == "http2.send_request_headers.started":
+            self.requests_sent += 1
+            self.http2_requests += 1
+
+    @contextlib.asynccontextmanager
+    async def _call_budget(self):
+        """Fail fast while the circuit is open; cap the whole call at call_deadline."""
+        if not self.breaker.allow():
+            raise ServiceUnavailableError("Ghost CMS unavailable")
+        try:
+            async with asyncio.timeout(self.call_deadline):
+                yield
+        except TimeoutError as exc:
+            self.breaker.record_failure()
+            raise ServiceUnavailableError("Ghost CMS did not respond in time") from exc
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None = None,
+        rewind: BinaryIO | None = None,
+        **kwargs,
+    ) -> Response:
+        """Send a request with retries on transient errors and record the outcome.
+
+        rewind: file streamed in the body, seeked back to 0 before every attempt.
+        """
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(3),
+                wait=self._retry_wait,
+                retry=retry_if_exception(_is_retryable),
+                reraise=True,
+            ):
+                with attempt:
+                    if rewind is not None:
+                        rewind.seek(0)
+                    response = await self._client.request(
+                        method,
+                        url,
+                        headers={**self._auth_headers(), **(headers or {})},
+                        extensions={"trace": self._trace},
+                        **kwargs,
+                    )
+                    response.raise_for_status()
+        except Exception as exc:
+            if _is_retryable(exc):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return response
+
+    async def upload_image(
+        self, file: bytes | BinaryIO, filename: str, content_type: str = "image/jpeg"
+    ) -> str:
+        """Upload image to Ghost via POST /images/upload, return public URL.
+
+        file may be raw bytes or a binary file object, which is streamed into
+        the multipart body without being read into memory first.
+        """
         url = f"{self.api_base}/images/upload/"
-        files = {"file": (filename, file_bytes, "image/jpeg")}
-        response = await self._client.post(
-            url, headers=self._auth_headers(), files=files
-        )
-        response.raise_for_status()
+        files = {"file": (filename, file, content_type)}
+        rewind = None if isinstance(file, bytes) else file
+        async with self._call_budget():
+            response = await self._request("POST", url, files=files, rewind=rewind)
         data = response.json()
         return data["images"][0]["url"]
 
@@ -39,15 +176,17 @@ class GhostClient:
         """Ghost IDs are 24-char hex strings (MongoDB ObjectId)."""
         return len(value) == 24 and all(c in "0123456789abcdef" for c in value)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
     async def get_page(self, page_id: str) -> dict:
         """Get page by ID or slug (needed for updated_at for concurrent updates)."""
+        async with self._call_budget():
+            return await self._fetch_page(page_id)
+
+    async def _fetch_page(self, page_id: str) -> dict:
         if self._is_ghost_id(page_id):
             url = f"{self.api_base}/pages/{page_id}/"
         else:
             url = f"{self.api_base}/pages/slug/{page_id}/"
-        response = await self._client.get(url, headers=self._auth_headers())
-        response.raise_for_status()
+        response = await self._request("GET", url)
         data = response.json()
         return data["pages"][0]
 
@@ -65,14 +204,55 @@ class GhostClient:
             }
         })
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
-    async def update_page_html(self, page_id: str, html: str) -> None:
-        """Replace full HTML content of a Ghost page via PUT /pages/{id}."""
-        # First get current page (resolves slug → real ID + updated_at)
-        page = await self.get_page(page_id)
-        real_id = page["id"]
-        updated_at = page["updated_at"]
+    async def update_page_html(self, page_id: str, html: str, force: bool = False) -> bool:
+        """Push HTML to a Ghost page unless it matches the last successful push.
+
+        Returns True if the page was written, False if the push was skipped.
+        """
+        digest = hashlib.sha256(html.encode()).hexdigest()
+        if not force and self._page_digests.get(page_id) == digest:
+            self.skips += 1
+            logger.debug("Ghost page unchanged, skipping push", page_id=page_id)
+            return False
+
+        async with self._call_budget():
+            await self._put_page_html(page_id, html)
+        self._page_digests[page_id] = digest
+        self.pushes += 1
+        return True
+
+    async def _put_page_html(self, page_id: str, html: str) -> None:
+        """Replace full HTML content of a Ghost page via PUT /pages/{id}.
+
+        The real ID and updated_at returned by the previous PUT are reused, so
+        a steady-state sync is a single request. Ghost answers 409/422 when
+        updated_at is stale (page edited elsewhere) — then re-read and retry once.
+        """
+        state = self._page_state.get(page_id)
+        if state is None:
+            state = await self._resolve_page(page_id)
 
+        try:
+            response = await self._send_page_put(state, html)
+        except HTTPStatusError as exc:
+            self._page_state.pop(page_id, None)
+            if exc.response.status_code not in (409, 422):
+                raise
+            logger.info("Ghost page update collision, refetching", page_id=page_id)
+            state = await self._resolve_page(page_id)
+            response = await self._send_page_put(state, html)
+
+        page = response.json()["pages"][0]
+        self._page_state[page_id] = (page["id"], page["updated_at"])
+        logger.info("Ghost page updated", page_id=page["id"])
+
+    async def _resolve_page(self, page_id: str) -> tuple[str, str]:
+        """Resolve slug → real ID and fetch current updated_at."""
+        page = await self._fetch_page(page_id)
+        return page["id"], page["updated_at"]
+
+    async def _send_page_put(self, state: tuple[str, str], html: str) -> Response:
+        real_id, updated_at = state
         url = f"{self.api_base}/pages/{real_id}/"
         payload = {
             "pages": [
@@ -82,13 +262,23 @@ class GhostClient:
                 }
             ]
         }
-        response = await self._client.put(
-            url,
-            headers={**self._auth_headers(), "Content-Type": "application/json"},
-            json=payload,
+        return await self._request(
+            "PUT", url, headers={"Content-Type": "application/json"}, json=payload
         )
-        response.raise_for_status()
-        logger.info("Ghost page updated", page_id=real_id)
+
+    def stats(self) -> dict:
+        return {
+            "pushes": self.pushes,
+            "skips": self.skips,
+            "tokens_minted": self._tokens.minted,
+            "breaker": self.breaker.snapshot(),
+            "connections": {
+                "opened": self.connections_opened,
+                "requests": self.requests_sent,
+                "reused": max(0, self.requests_sent - self.connections_opened),
+                "http2_requests": self.http2_requests,
+            },
+        }
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -0,0 +1,353 @@
+import asyncio
+import hashlib
+import io
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import structlog
+from PIL import Image, ImageOps, UnidentifiedImageError
+from sqlalchemy import update
+
+from src.config import settings
+from src.database import async_session_factory
+from src.exceptions import ValidationError
+from src.models.course import Course, CourseStatus
+from src.models.event import Event, EventStatus
+from src.models.image import IMAGE_STATE_FAILED, IMAGE_STATE_PENDING, IMAGE_STATE_READY
+from src.repositories.image import ImageUploadRepository
+from src.services.media import LocalMediaStore
+from src.utils.image_validation import ValidatedImage, sanitize_filename
+
+logger = structlog.get_logger()
+
+# Upload targets -> bounding box (px) of the largest variant. Sized at 2x the
+# rendered card slot for high-DPI screens: event covers render at 516x516,
+# course images full-width.
+TARGET_EVENT_COVER = "event_cover"
+TARGET_COURSE_DESKTOP = "course_desktop"
+TARGET_COURSE_MOBILE = "course_mobile"
+
+IMAGE_TARGETS: dict[str, tuple[int, int]] = {
+    TARGET_EVENT_COVER: (1032, 1032),
+    TARGET_COURSE_DESKTOP: (1600, 1600),
+    TARGET_COURSE_MOBILE: (828, 1656),
+}
+
+# Widths emitted per target for srcset, ascending. Each variant keeps the
+# target's box aspect; the last one equals IMAGE_TARGETS.
+IMAGE_VARIANT_WIDTHS: dict[str, tuple[int, ...]] = {
+    TARGET_EVENT_COVER: (516, 1032),
+    TARGET_COURSE_DESKTOP: (800, 1200, 1600),
+    TARGET_COURSE_MOBILE: (414, 828),
+}
+
+# Refuse pathological dimensions before decoding (a 1 MB file can still claim
+# gigapixels). Pillow raises DecompressionBombError above twice this value.
+MAX_SOURCE_PIXELS = 25_000_000
+
+FORMAT_MIME = {
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+}
+
+
+@dataclass
+class ProcessedImage:
+    data: bytes
+    content_type: str
+    width: int
+    height: int
+    original_size: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.original_size - len(self.data)
+
+
+def variant_boxes(target: str) -> list[tuple[int, int]]:
+    """Bounding boxes for each srcset width of target, smallest first."""
+    max_w, max_h = IMAGE_TARGETS[target]
+    return [(w, max_h * w // max_w) for w in IMAGE_VARIANT_WIDTHS[target]]
+
+
+def process_variants(
+    source: BinaryIO,
+    boxes: list[tuple[int, int]],
+    fmt: str = "WEBP",
+    quality: int = 80,
+) -> list[ProcessedImage]:
+    """Decode once, apply EXIF orientation, then downscale and re-encode per box.
+
+    Metadata (EXIF, ICC, XMP) is not carried over. Images are never upscaled,
+    so boxes larger than the source collapse into one variant. Blocking — run
+    in a thread.
+    """
+    source.seek(0, io.SEEK_END)
+    original_size = source.tell()
+    source.seek(0)
+
+    results: list[ProcessedImage] = []
+    try:
+        with Image.open(source) as img:
+            if img.width * img.height > MAX_SOURCE_PIXELS:
+                raise ValidationError("Image dimensions too large")
+            # JPEG can decode straight at a reduced scale, skipping most of the work
+            img.draft("RGB", max(boxes))
+            img = ImageOps.exif_transpose(img)
+
+            if fmt == "JPEG" or img.mode not in ("RGB", "RGBA"):
+                has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+                img = img.convert("RGBA" if has_alpha and fmt != "JPEG" else "RGB")
+
+            for box in boxes:
+                variant = img.copy()
+                variant.thumbnail(box, Image.Resampling.LANCZOS)
+                if results and variant.size == (results[-1].width, results[-1].height):
+                    continue
+                out = io.BytesIO()
+                variant.save(out, format=fmt, quality=quality, optimize=True)
+                results.append(
+                    ProcessedImage(
+                        data=out.getvalue(),
+                        content_type=FORMAT_MIME[fmt],
+                        width=variant.width,
+                        height=variant.height,
+                        original_size=original_size,
+                    )
+                )
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as exc:
+        raise ValidationError("Image could not be decoded") from exc
+
+    return results
+
+
+@dataclass
+class UploadedImage:
+    url: str  # largest variant — plain src fallback
+    variants: list[dict]  # [{"width": int, "url": str}], ascending width
+
+
+class ImageService:
+    """Optimises validated uploads and stores them in Ghost or the local media store.
+
+    Each upload becomes a set of width variants for srcset. Without a Ghost
+    client, variants go to LocalMediaStore. With a repo, Ghost uploads are
+    content-addressed: bytes already uploaded once resolve to the stored URL
+    without a network call.
+    """
+
+    def __init__(
+        self,
+        ghost_client=None,
+        repo: ImageUploadRepository | None = None,
+        media_store: LocalMediaStore | None = None,
+        fmt: str = settings.IMAGE_FORMAT,
+        quality: int = settings.IMAGE_QUALITY,
+    ):
+        self.ghost_client = ghost_client
+        self.repo = repo
+        self.media_store = media_store or LocalMediaStore()
+        self.fmt = fmt.upper()
+        self.quality = quality
+
+    async def optimize(self, image: ValidatedImage, target: str) -> list[ProcessedImage]:
+        variants = await asyncio.to_thread(
+            process_variants, image.file, variant_boxes(target), self.fmt, self.quality
+        )
+        largest = variants[-1]
+        logger.info(
+            "Image optimised",
+            target=target,
+            original_bytes=largest.original_size,
+            bytes=len(largest.data),
+            bytes_saved=largest.bytes_saved,
+            size=f"{largest.width}x{largest.height}",
+            variants=[v.width for v in variants],
+        )
+        return variants
+
+    async def upload(self, image: ValidatedImage, target: str) -> UploadedImage:
+        """Optimise the image into srcset variants and upload them concurrently."""
+        variants = await self.optimize(image, target)
+        urls = await self._store(image.filename, variants)
+        return UploadedImage(
+            url=urls[-1],
+            variants=[
+                {"width": v.width, "url": url} for v, url in zip(variants, urls, strict=True)
+            ],
+        )
+
+    async def _store(self, original_name: str | None, variants: list[ProcessedImage]) -> list[str]:
+        """Return one URL per variant, uploading only bytes not seen before."""
+        digests = [hashlib.sha256(v.data).hexdigest() for v in variants]
+        if not self.ghost_client:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.media_store.store(v.data, v.content_type, d)
+                        for v, d in zip(variants, digests, strict=True)
+                    )
+                )
+            )
+
+        names = [sanitize_filename(original_name, v.content_type) for v in variants]
+        known = await self.repo.get_urls(digests) if self.repo else {}
+        if known:
+            logger.info("Image upload deduplicated", reused=len(known), total=len(digests))
+
+        # Network calls run concurrently; the session is only touched before and after
+        missing = [i for i, d in enumerate(digests) if d not in known]
+        uploaded = await asyncio.gather(
+            *(
+                self.ghost_client.upload_image(
+                    variants[i].data, names[i], variants[i].content_type
+                )
+                for i in missing
+            )
+        )
+        for i, url in zip(missing, uploaded, strict=True):
+            known[digests[i]] = url
+            if self.repo:
+                await self.repo.record(
+                    digests[i], url, variants[i].content_type, len(variants[i].data)
+                )
+        return [known[d] for d in digests]
+
+
+# Deferred uploads: the request stores the validated file and returns; the
+# optimise + Ghost upload + page sync runs afterwards as a background task.
+
+PUBLISHED_STATUS = {Event: EventStatus.PUBLISHED, Course: CourseStatus.PUBLISHED}
+
+
+@dataclass
+class PendingImage:
+    path: Path
+    content_type: str
+    original_name: str | None
+
+    @property
+    def token(self) -> str:
+        """Identifies this upload in `<field>_token`; the stash name is a fresh UUID."""
+        return self.path.name
+
+
+def _copy_to(source: BinaryIO, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    source.seek(0)
+    with path.open("wb") as out:
+        shutil.copyfileobj(source, out)
+
+
+async def stash_upload(image: ValidatedImage) -> PendingImage:
+    """Copy a validated upload to the pending dir so it outlives the request."""
+    path = Path(settings.UPLOAD_PENDING_DIR) / image.filename
+    await asyncio.to_thread(_copy_to, image.file, path)
+    return PendingImage(path=path, content_type=image.content_type, original_name=image.filename)
+
+
+async def finish_upload(
+    content_page_builder,
+    model: type[Event] | type[Course],
+    entity_id: int,
+    field: str,
+    target: str,
+    pending: PendingImage,
+    page: str,
+) -> None:
+    """Optimise and upload a stashed image, store it on the entity, re-sync if published.
+
+    Sets `<field>_state` to ready or failed, but only while `<field>_token` still
+    names this upload: when two uploads race for a slot, the older one finishing
+    last is dropped instead of overwriting the newer image. Never raises — runs
+    after the response.
+    """
+    ghost_client = None
+    if content_page_builder and settings.IMAGE_STORAGE == "ghost":
+        ghost_client = content_page_builder.ghost_client
+    try:
+        async with async_session_factory() as session:
+            with pending.path.open("rb") as f:
+                image = ValidatedImage(
+                    file=f,
+                    size=pending.path.stat().st_size,
+                    content_type=pending.content_type,
+                    filename=pending.original_name,
+                )
+                service = ImageService(ghost_client, ImageUploadRepository(session))
+                uploaded = await service.upload(image, target)
+
+            status = await session.scalar(
+                _claim(model, entity_id, field, pending.token)
+                .values(
+                    {
+                        field: uploaded.url,
+                        f"{field}_variants": uploaded.variants,
+                        f"{field}_state": IMAGE_STATE_READY,
+                    }
+                )
+                .returning(model.status)
+            )
+            await session.commit()
+    except Exception:
+        logger.exception("Deferred image upload failed", field=field, id=entity_id)
+        await _set_state(model, entity_id, field, pending.token, IMAGE_STATE_FAILED)
+        return
+    finally:
+        pending.path.unlink(missing_ok=True)
+
+    if status is None:
+        logger.info("Image upload superseded or entity deleted", field=field, id=entity_id)
+        return
+    if status == PUBLISHED_STATUS[model] and content_page_builder:
+        try:
+            await content_page_builder.sync_queue.enqueue(page)
+        except Exception:
+            logger.exception("Failed to queue page sync after image upload", page=page)
+
+
+def _claim(model: type[Event] | type[Course], entity_id: int, field: str, token: str):
+    """UPDATE of the slot that matches nothing once a newer upload took it over."""
+    return update(model).where(
+        model.id == entity_id, getattr(model, f"{field}_token") == token
+    )
+
+
+async def _set_state(
+    model: type[Event] | type[Course], entity_id: int, field: str, token: str, state: str
+) -> None:
+    try:
+        async with async_session_factory() as session:
+            await session.execute(
+                _claim(model, entity_id, field, token).values({f"{field}_state": state})
+            )
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to record image upload state", field=field, id=entity_id)
+
+
+IMAGE_STATE_COLUMNS = (
+    Event.cover_image_state,
+    Course.image_desktop_state,
+    Course.image_mobile_state,
+)
+
+
+async def fail_stale_uploads() -> int:
+    """Mark uploads left pending by a restart as failed and drop their files."""
+    failed = 0
+    async with async_session_factory() as session:
+        for column in IMAGE_STATE_COLUMNS:
+            result = await session.execute(
+                update(column.class_)
+                .where(column == IMAGE_STATE_PENDING)
+                .values({column.key: IMAGE_STATE_FAILED})
+            )
+            failed += result.rowcount
+        await session.commit()
+    await asyncio.to_thread(shutil.rmtree, settings.UPLOAD_PENDING_DIR, True)
+    if failed:
+        logger.warning("Interrupted image uploads marked failed", count=failed)
+    return failed
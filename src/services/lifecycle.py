@@ -0,0 +1,110 @@
+"""Status transitions shared by events and courses.
+
+TRANSITIONS is the state machine: for each action, the statuses it may start
+from and the status it sets. A transition runs as one conditional UPDATE …
+RETURNING (BaseRepository.update_if), so of two editors clicking at once one
+wins and the other gets a ConflictError rather than re-applying the change.
+Only when nothing matched is the row read again, to say why.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import ColumnElement, and_, select
+
+from src.exceptions import ConflictError, NotFoundError, ValidationError
+from src.repositories.base import BaseRepository
+
+# Status member names — EventStatus and CourseStatus share them
+DRAFT = "DRAFT"
+PUBLISHED = "PUBLISHED"
+CANCELLED = "CANCELLED"
+ARCHIVED = "ARCHIVED"
+
+
+@dataclass(frozen=True)
+class Transition:
+    sources: frozenset[str]
+    target: str
+    error: str  # when the current status doesn't allow it
+    check_requirements: bool = False  # publish: the public page needs these fields
+
+
+TRANSITIONS: dict[str, Transition] = {
+    "publish": Transition(
+        frozenset({DRAFT}), PUBLISHED, "Опубликовать можно только черновик", True
+    ),
+    "unpublish": Transition(
+        frozenset({PUBLISHED}), DRAFT, "Снять с публикации можно только опубликованную запись"
+    ),
+    "cancel": Transition(
+        frozenset({PUBLISHED}), CANCELLED, "Отменить можно только опубликованную запись"
+    ),
+    "archive": Transition(
+        frozenset({PUBLISHED, CANCELLED}),
+        ARCHIVED,
+        "В архив можно отправить только опубликованную или отменённую запись",
+    ),
+    "reactivate": Transition(
+        frozenset({CANCELLED, ARCHIVED}),
+        DRAFT,
+        "Вернуть в черновики можно только отменённую или архивную запись",
+    ),
+}
+
+# (condition on the row, error message when it fails)
+Requirement = tuple[ColumnElement[bool], str]
+
+
+def filled(column) -> ColumnElement[bool]:
+    return and_(column.is_not(None), column != "")
+
+
+class Lifecycle:
+    """TRANSITIONS applied to one model, with its publish requirements."""
+
+    def __init__(self, model, entity: str, requirements: list[Requirement]):
+        self.model = model
+        self.entity = entity
+        self.requirements = requirements
+        self.status_enum = model.status.type.enum_class
+
+    async def transition(self, repo: BaseRepository, action: str, entity_id: int):
+        """Move the row to the action's target status and return it.
+
+        Raises NotFoundError, ConflictError (status doesn't allow the action)
+        or ValidationError (a publish requirement isn't met). Doesn't commit.
+        """
+        transition = TRANSITIONS[action]
+        requirements = self.requirements if transition.check_requirements else []
+        row = await repo.update_if(
+            entity_id,
+            self.model.status.in_([self.status_enum[s] for s in transition.sources]),
+            *(condition for condition, _ in requirements),
+            status=self.status_enum[transition.target],
+        )
+        if row is None:
+            await self._explain(repo, transition, entity_id, requirements)
+        return row
+
+    async def _explain(
+        self,
+        repo: BaseRepository,
+        transition: Transition,
+        entity_id: int,
+        requirements: list[Requirement],
+    ) -> None:
+        query = select(
+            self.model.status,
+            *(condition.label(f"requirement_{i}") for i, (condition, _) in enumerate(requirements)),
+        ).where(self.model.id == entity_id)
+        row = (await repo.session.execute(query)).one_or_none()
+        if row is None:
+            raise NotFoundError(self.entity, entity_id)
+
+        status, *met = row
+        if status.name not in transition.sources:
+            raise ConflictError(transition.error)
+        for ok, (_, message) in zip(met, requirements, strict=True):
+            if not ok:
+                raise ValidationError(message)
+        raise ConflictError(transition.error)  # changed again since the UPDATE
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from src.config import settings
+from src.utils.image_validation import MIME_TO_EXT
+
+MEDIA_URL_PATH = "/uploads"
+# Keys are content hashes, so a URL never changes meaning — cache it forever
+MEDIA_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class LocalMediaStore:
+    """Content-addressed files on disk: <root>/ab/cd/<sha256><ext>.
+
+    Two-level sharding keeps directories small; writes go to a temp file in
+    the target directory and are renamed into place, so readers never see a
+    partial file. Saving the same bytes twice is a no-op.
+    """
+
+    def __init__(self, root: str | Path | None = None, base_url: str | None = None):
+        self.root = Path(root or settings.MEDIA_DIR)
+        self.base_url = base_url or f"{settings.PUBLIC_URL}{MEDIA_URL_PATH}"
+
+    @staticmethod
+    def key_for(digest: str, content_type: str) -> str:
+        ext = MIME_TO_EXT.get(content_type, ".bin")
+        return f"{digest[:2]}/{digest[2:4]}/{digest}{ext}"
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key
+
+    def url_for(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def save(self, data: bytes, content_type: str, digest: str) -> str:
+        """Write data atomically under its hash key; return the key. Blocking."""
+        key = self.key_for(digest, content_type)
+        path = self.path_for(key)
+        if path.exists():
+            return key
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return key
+
+    async def store(self, data: bytes, content_type: str, digest: str) -> str:
+        """Save in a worker thread and return the public URL."""
+        key = await asyncio.to_thread(self.save, data, content_type, digest)
+        return self.url_for(key)
+
+
+class MediaFiles(StaticFiles):
+    """StaticFiles for the media store with immutable caching.
+
+    FileResponse provides ETag/Last-Modified (304 via StaticFiles) and Range
+    requests, but uvicorn has no ASGI pathsend, so the body is streamed in
+    chunks through Python. With accel_redirect (an nginx `internal` location
+    aliased to the media root) the app answers with an empty
+    X-Accel-Redirect response instead and nginx sends the file itself with
+    sendfile, ETag and Range handling.
+    """
+
+    def __init__(self, *args, accel_redirect: str = "", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accel_redirect = accel_redirect.rstrip("/")
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        if self.accel_redirect:
+            key = Path(self.get_path(scope)).as_posix()
+            response = Response(
+                status_code=status_code,
+                headers={"X-Accel-Redirect": f"{self.accel_redirect}/{key}"},
+            )
+        else:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = MEDIA_CACHE_CONTROL
+        return response
@@ -4,8 +4,7 @@ import time
 import structlog
 from aiogram import Bot
 
-from src.database import async_session_factory
-from src.repositories.user import UserRepository
+from src.services.whitelist import whitelist
 
 logger = structlog.get_logger()
 
@@ -21,11 +20,7 @@ class NotificationService:
 
     async def notify_admins(self, message: str) -> None:
         """Send message to admin-role users only."""
-        async with async_session_factory() as session:
-            repo = UserRepository(session)
-            admin_ids = await repo.get_admin_telegram_ids()
-
-        for tg_id in admin_ids:
+        for tg_id in await whitelist.admin_ids():
             try:
                 await self.bot.send_message(tg_id, message)
             except Exception:
@@ -9,6 +9,7 @@ from src.database import async_session_factory
 from src.models.event import EventStatus
 from src.repositories.event import EventRepository
 from src.services.audit import AuditService
+from src.services.content_page import PAGE_EVENTS
 
 logger = structlog.get_logger()
 
@@ -36,9 +37,9 @@ async def auto_archive_events(content_page_builder=None):
         # Rebuild Ghost page
         if content_page_builder:
             try:
-                await content_page_builder.sync_events_page()
+                await content_page_builder.sync_queue.enqueue(PAGE_EVENTS)
             except Exception:
-                logger.exception("Ghost sync failed after auto-archive")
+                logger.exception("Failed to enqueue Ghost sync after auto-archive")
 
 
 async def send_event_reminders(notification_service=None):
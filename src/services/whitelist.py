@@ -0,0 +1,55 @@
+import asyncio
+
+import structlog
+from sqlalchemy import select
+
+from src.database import async_session_factory
+from src.models.user import ROLE_ADMIN, WhitelistUser
+
+logger = structlog.get_logger()
+
+
+class WhitelistSnapshot:
+    """Process-wide telegram_id -> role map of whitelist_users.
+
+    Auth checks and admin fan-out read this instead of querying the table.
+    Loaded at startup (and lazily after invalidate()); every write to
+    whitelist_users must call invalidate() after its commit. A load that
+    races with an invalidate is served once but not kept.
+    """
+
+    def __init__(self):
+        self._roles: dict[int, str] | None = None
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> dict[int, str]:
+        roles = self._roles
+        if roles is not None:
+            return roles
+        async with self._lock:
+            if self._roles is not None:
+                return self._roles
+            generation = self._generation
+            async with async_session_factory() as session:
+                result = await session.execute(
+                    select(WhitelistUser.telegram_id, WhitelistUser.role)
+                )
+                roles = dict(result.all())
+            if generation == self._generation:
+                self._roles = roles
+                logger.debug("Whitelist snapshot loaded", users=len(roles))
+            return roles
+
+    def invalidate(self) -> None:
+        self._generation += 1
+        self._roles = None
+
+    async def role_of(self, telegram_id: int) -> str | None:
+        return (await self.load()).get(telegram_id)
+
+    async def admin_ids(self) -> list[int]:
+        return [tg_id for tg_id, role in (await self.load()).items() if role == ROLE_ADMIN]
+
+
+whitelist = WhitelistSnapshot()
@@ -0,0 +1,150 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.database import engine as default_engine
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+WRITE_BATCH_WINDOW = 0.003  # seconds to wait for more writes after the first
+WRITE_BATCH_MAX = 64
+WRITER_STOPPED_MSG = "Writer is not running"
+
+Work = Callable[[AsyncSession], Awaitable[Any]]
+_Job = tuple[Work, asyncio.Future]
+
+
+class GroupCommitWriter:
+    """Single writer task that batches write transactions (group commit).
+
+    submit() hands a unit of work — a coroutine function taking an
+    AsyncSession — to one task that owns a dedicated connection. Jobs that
+    arrive within WRITE_BATCH_WINDOW of the first run in one BEGIN IMMEDIATE
+    transaction and commit together: a burst of writes takes the SQLite write
+    lock and fsyncs once. If a job raises, the batch is rolled back and its
+    jobs re-run one transaction each, so only the failing caller sees an
+    error — work must therefore only touch the session. Callers are resolved
+    after their commit, never before.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine = default_engine,
+        window: float = WRITE_BATCH_WINDOW,
+        max_batch: int = WRITE_BATCH_MAX,
+    ):
+        self.engine = engine
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[_Job | None] = asyncio.Queue()
+        self._conn: AsyncConnection | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self.committed = 0
+        self.failed = 0
+        self.batches = 0
+
+    async def start(self) -> None:
+        self._stopping = False
+        self._conn = await self.engine.connect()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Commit everything already submitted, then release the connection."""
+        self._stopping = True
+        if self._task:
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+        if self._conn:
+            await self._conn.close()
+            self._conn = None
+
+    async def submit(self, work: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run work in the next batch; returns its result once the batch is committed."""
+        if self._stopping or self._task is None or self._task.done():
+            raise RuntimeError(WRITER_STOPPED_MSG)
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((work, future))
+        return await future
+
+    async def _run(self) -> None:
+        try:
+            await self._loop()
+        finally:
+            self._fail_queued()
+
+    async def _loop(self) -> None:
+        while True:
+            job = await self._queue.get()
+            if job is None:
+                return
+            await asyncio.sleep(self.window)
+
+            batch = [job]
+            stopping = False
+            while len(batch) < self.max_batch and not self._queue.empty():
+                job = self._queue.get_nowait()
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+
+            await self._commit(batch)
+            if stopping:
+                return
+
+    def _fail_queued(self) -> None:
+        """Reject jobs left behind the stop sentinel so their callers don't hang."""
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            if job is not None and not job[1].done():
+                job[1].set_exception(RuntimeError(WRITER_STOPPED_MSG))
+
+    async def _commit(self, batch: list[_Job]) -> None:
+        batch = [job for job in batch if not job[1].cancelled()]
+        if not batch:
+            return
+        try:
+            outcomes = [(result, None) for result in await self._transaction(batch)]
+        except Exception as exc:
+            if len(batch) == 1:
+                outcomes = [(None, exc)]
+            else:
+                logger.info("Group commit batch failed, retrying jobs alone", jobs=len(batch))
+                outcomes = [await self._attempt(job) for job in batch]
+
+        for (_, future), (result, exc) in zip(batch, outcomes, strict=True):
+            if exc is None:
+                self.committed += 1
+            else:
+                self.failed += 1
+            if future.done():
+                continue
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+    async def _attempt(self, job: _Job) -> tuple[Any, Exception | None]:
+        try:
+            [result] = await self._transaction([job])
+        except Exception as exc:
+            return None, exc
+        return result, None
+
+    async def _transaction(self, batch: list[_Job]) -> list[Any]:
+        """Run every job in one transaction; any error rolls back all of them."""
+        async with AsyncSession(bind=self._conn, expire_on_commit=False) as session:
+            # Take the write lock up front instead of upgrading a read lock mid-batch
+            await session.execute(text("BEGIN IMMEDIATE"))
+            results = [await work(session) for work, _ in batch]
+            await session.commit()
+        self.batches += 1
+        return results
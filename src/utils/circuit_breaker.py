@@ -0,0 +1,73 @@
+import time
+
+import structlog
+
+logger = structlog.get_logger()
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Closed → open after N consecutive failures → half-open after a cool-down.
+
+    While open, allow() returns False so callers fail fast. In half-open a
+    single probe call is let through: success closes the breaker, failure
+    re-opens it for another cool-down.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started = 0.0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = STATE_HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN:
+            now = time.monotonic()
+            # A probe that never reported back (e.g. cancelled) must not wedge the breaker
+            if not self._probe_in_flight or now - self._probe_started >= self.reset_timeout:
+                self._probe_in_flight = True
+                self._probe_started = now
+                return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state != STATE_CLOSED:
+            logger.info("Circuit closed", breaker=self.name)
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != STATE_OPEN:
+                logger.warning("Circuit opened", breaker=self.name, failures=self._failures)
+            self._state = STATE_OPEN
+            self._opened_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "rejected": self.rejected,
+        }
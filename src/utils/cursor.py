@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from datetime import date, datetime
+
+from src.exceptions import ValidationError
+
+INVALID_CURSOR_MSG = "Invalid cursor"
+
+
+def _default(value):
+    if isinstance(value, date):  # datetime included
+        return value.isoformat()
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Opaque URL-safe token holding the sort-key values of the last row on a page."""
+    raw = json.dumps(list(values), default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[type | None]) -> list:
+    """Inverse of encode_cursor; types restores dates (None keeps the JSON value)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        return [_restore(v, t) for v, t in zip(values, types, strict=True)]
+    except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+        raise ValidationError(INVALID_CURSOR_MSG)
+
+
+def _restore(value, type_: type | None):
+    if value is None or type_ is None:
+        return value
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    if type_ is date:
+        return date.fromisoformat(value)
+    if type_ in (int, float, bool, str) and not isinstance(value, type_):
+        if type_ is float and isinstance(value, int):
+            return float(value)
+        raise ValueError
+    return value
@@ -1,9 +1,13 @@
+import threading
 import time
 
 import jwt
 
+TOKEN_TTL = 300  # seconds (Ghost rejects Admin tokens valid for more than 5 min)
+TOKEN_REFRESH_MARGIN = 60  # seconds — re-mint this long before exp
 
-def make_ghost_jwt(admin_api_key: str) -> str:
+
+def make_ghost_jwt(admin_api_key: str, now: int | None = None, ttl: int = TOKEN_TTL) -> str:
     """Generate short-lived JWT for Ghost Admin API auth (HS256, 5 min expiry).
 
     admin_api_key format: "id:secret" (hex-encoded secret)
@@ -11,10 +15,10 @@ def make_ghost_jwt(admin_api_key: str) -> str:
     key_id, secret_hex = admin_api_key.split(":")
     secret = bytes.fromhex(secret_hex)
 
-    now = int(time.time())
+    now = int(time.time()) if now is None else now
     payload = {
         "iat": now,
-        "exp": now + 300,  # 5 min
+        "exp": now + ttl,
         "aud": "/admin/",
     }
     headers = {
@@ -24,3 +28,40 @@ def make_ghost_jwt(admin_api_key: str) -> str:
     }
 
     return jwt.encode(payload, secret, algorithm="HS256", headers=headers)
+
+
+class GhostTokenProvider:
+    """Caches a token from make_ghost_jwt and re-mints it shortly before expiry.
+
+    The key is only parsed when a token is minted, so a malformed
+    GHOST_ADMIN_API_KEY fails the Ghost calls, not startup. get_token() never
+    awaits, so concurrent coroutines on the loop cannot interleave inside it;
+    the lock covers worker threads.
+    """
+
+    def __init__(
+        self,
+        admin_api_key: str,
+        ttl: int = TOKEN_TTL,
+        refresh_margin: int = TOKEN_REFRESH_MARGIN,
+    ):
+        self._admin_api_key = admin_api_key
+        self._ttl = ttl
+        self._refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._token: str | None = None
+        self._refresh_at: float = 0
+        self.minted = 0
+
+    def get_token(self) -> str:
+        token = self._token
+        if token is not None and time.time() < self._refresh_at:
+            return token
+
+        with self._lock:
+            now = int(time.time())
+            if self._token is None or now >= self._refresh_at:
+                self._token = make_ghost_jwt(self._admin_api_key, now, self._ttl)
+                self._refresh_at = now + self._ttl - self._refresh_margin
+                self.minted += 1
+            return self._token
@@ -1,9 +1,12 @@
 import uuid
+from dataclasses import dataclass
+from typing import BinaryIO
 
 from fastapi import HTTPException, UploadFile
 
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
 MAX_IMAGE_SIZE = 1 * 1024 * 1024  # 1 MB
+READ_CHUNK_SIZE = 64 * 1024  # bytes read per step while validating
 
 MAGIC_BYTES = {
     b"\xff\xd8\xff": "image/jpeg",
@@ -18,34 +21,57 @@ MIME_TO_EXT = {
 }
 
 
+@dataclass
+class ValidatedImage:
+    """Upload that passed validation. file is rewound and still owned by the request."""
+
+    file: BinaryIO
+    size: int
+    content_type: str
+    filename: str
+
+
 def sanitize_filename(original: str | None, detected_type: str) -> str:
     """Generate a safe UUID-based filename with correct extension."""
     ext = MIME_TO_EXT.get(detected_type, ".bin")
     return f"{uuid.uuid4().hex}{ext}"
 
 
-async def validate_image(file: UploadFile) -> tuple[bytes, str]:
-    """Read, validate magic bytes + MIME, enforce size limit.
-
-    Returns (content, safe_filename).
-    """
-    content = await file.read()
-
-    if len(content) > MAX_IMAGE_SIZE:
-        raise HTTPException(413, "Image too large (max 1MB)")
-
-    detected_type = None
+def detect_image_type(head: bytes) -> str | None:
+    """Detect image MIME type from the leading bytes of a file."""
     for magic, mime in MAGIC_BYTES.items():
-        if content[: len(magic)] == magic:
+        if head[: len(magic)] == magic:
             if mime == "image/webp":
-                if len(content) >= 12 and content[8:12] == b"WEBP":
-                    detected_type = mime
-            else:
-                detected_type = mime
-            break
+                if len(head) >= 12 and head[8:12] == b"WEBP":
+                    return mime
+                return None
+            return mime
+    return None
+
 
+async def validate_image(file: UploadFile) -> ValidatedImage:
+    """Validate magic bytes from the first chunk, then stream the rest to enforce the size limit.
+
+    Chunks are only counted, never accumulated — the request's spooled file is
+    rewound and handed on as is, so no extra in-memory copy is made.
+    """
+    first = await file.read(READ_CHUNK_SIZE)
+    detected_type = detect_image_type(first)
     if detected_type not in ALLOWED_IMAGE_TYPES:
         raise HTTPException(400, "Invalid image type. Allowed: JPEG, PNG, WebP")
 
+    size = len(first)
+    while size <= MAX_IMAGE_SIZE:
+        chunk = await file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+
+    if size > MAX_IMAGE_SIZE:
+        raise HTTPException(413, "Image too large (max 1MB)")
+
+    await file.seek(0)
     safe_name = sanitize_filename(file.filename, detected_type)
-    return content, safe_name
+    return ValidatedImage(
+        file=file.file, size=size, content_type=detected_type, filename=safe_name
+    )
@@ -0,0 +1,57 @@
+import secrets
+import time
+
+import jwt
+from pydantic import BaseModel
+
+from src.exceptions import AuthError
+from src.utils.telegram_auth import AUTH_FAILED_MSG, TelegramUser
+
+SESSION_TOKEN_AUDIENCE = "komonbot-webapp"
+
+# Without SECRET_KEY tokens are signed with a per-process key: they stop
+# verifying after a restart and the client simply exchanges initData again.
+_fallback_key = secrets.token_bytes(32)
+
+
+class SessionClaims(BaseModel):
+    user: TelegramUser
+    role: str
+    expires_at: int
+
+
+def _signing_key(secret_key: str) -> str | bytes:
+    return secret_key or _fallback_key
+
+
+def issue_session_token(
+    user: TelegramUser, role: str, secret_key: str, ttl: int
+) -> tuple[str, int]:
+    """Sign an HS256 session token for a verified initData user; return (token, exp)."""
+    now = int(time.time())
+    expires_at = now + ttl
+    payload = {
+        "sub": str(user.id),
+        "name": user.first_name,
+        "role": role,
+        "iat": now,
+        "exp": expires_at,
+        "aud": SESSION_TOKEN_AUDIENCE,
+    }
+    return jwt.encode(payload, _signing_key(secret_key), algorithm="HS256"), expires_at
+
+
+def decode_session_token(token: str, secret_key: str) -> SessionClaims:
+    """Verify signature, audience and expiry. The role claim is checked by the caller."""
+    try:
+        payload = jwt.decode(
+            token,
+            _signing_key(secret_key),
+            algorithms=["HS256"],
+            audience=SESSION_TOKEN_AUDIENCE,
+            options={"require": ["sub", "role", "exp"]},
+        )
+        user = TelegramUser(id=int(payload["sub"]), first_name=payload.get("name"))
+    except (jwt.InvalidTokenError, ValueError):
+        raise AuthError(AUTH_FAILED_MSG)
+    return SessionClaims(user=user, role=payload["role"], expires_at=payload["exp"])
@@ -1,7 +1,10 @@
+import functools
 import hashlib
 import hmac
 import json
+import threading
 import time
+from collections import OrderedDict
 from urllib.parse import parse_qs
 
 import structlog
@@ -12,6 +15,7 @@ from src.exceptions import AuthError
 logger = structlog.get_logger()
 
 INIT_DATA_MAX_AGE = 300  # seconds (5 min)
+INIT_DATA_CACHE_SIZE = 1024  # verified initData strings remembered until they expire
 AUTH_FAILED_MSG = "Authentication failed"
 
 
@@ -22,11 +26,72 @@ class TelegramUser(BaseModel):
     username: str | None = None
 
 
+@functools.lru_cache(maxsize=4)
+def _secret_key(bot_token: str) -> bytes:
+    """HMAC key for initData checks — fixed per bot token, derived once."""
+    return hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+
+
+class VerifiedInitDataCache:
+    """Bounded LRU of initData strings that already passed verification.
+
+    The Mini App resends the same initData on every request, so a hit skips
+    parsing and the HMAC. Keyed on the full initData (not its claimed hash)
+    and the bot key; entries expire at auth_date + INIT_DATA_MAX_AGE.
+    """
+
+    def __init__(self, maxsize: int = INIT_DATA_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple[bytes, bytes], tuple[TelegramUser, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(init_data: str, secret_key: bytes) -> tuple[bytes, bytes]:
+        return secret_key, hashlib.sha256(init_data.encode()).digest()
+
+    def get(self, init_data: str, secret_key: bytes) -> TelegramUser | None:
+        key = self._key(init_data, secret_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if time.time() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user
+
+    def put(
+        self, init_data: str, secret_key: bytes, user: TelegramUser, expires_at: float
+    ) -> None:
+        key = self._key(init_data, secret_key)
+        with self._lock:
+            self._entries[key] = (user, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verified_init_data = VerifiedInitDataCache()
+
+
 def validate_init_data(init_data: str, bot_token: str) -> TelegramUser:
     """Validate Telegram WebApp initData HMAC signature and extract user."""
     if not init_data:
         raise AuthError(AUTH_FAILED_MSG)
 
+    secret_key = _secret_key(bot_token)
+    cached = verified_init_data.get(init_data, secret_key)
+    if cached is not None:
+        return cached
+
     parsed = parse_qs(init_data)
 
     # Check required fields
@@ -44,7 +109,6 @@ def validate_init_data(init_data: str, bot_token: str) -> TelegramUser:
 
     # 2. Verify HMAC-SHA256
     received_hash = parsed["hash"][0]
-    secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
 
     check_items = sorted(
         (k, v[0]) for k, v in parsed.items() if k != "hash"
@@ -58,6 +122,9 @@ def validate_init_data(init_data: str, bot_token: str) -> TelegramUser:
     # 3. Extract user
     try:
         user_data = json.loads(parsed["user"][0])
-        return TelegramUser.model_validate(user_data)
+        user = TelegramUser.model_validate(user_data)
     except (json.JSONDecodeError, KeyError, IndexError):
         raise AuthError(AUTH_FAILED_MSG)
+
+    verified_init_data.put(init_data, secret_key, user, auth_date + INIT_DATA_MAX_AGE)
+    return user
@@ -17,8 +17,9 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from src.config import settings
-from src.database import Base, get_db
+from src.database import Base, RoutingSession, get_db, read_only_url
 from src.main import app
+from src.services.whitelist import whitelist
 
 test_engine = create_async_engine(
     settings.DATABASE_URL,
@@ -26,7 +27,18 @@ test_engine = create_async_engine(
     poolclass=NullPool,
     connect_args={"check_same_thread": False},
 )
-test_session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
+test_read_engine = create_async_engine(
+    read_only_url(settings.DATABASE_URL),
+    echo=False,
+    poolclass=NullPool,
+    connect_args={"check_same_thread": False},
+)
+test_session_factory = async_sessionmaker(
+    test_engine,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    reader=test_read_engine.sync_engine,
+)
 
 
 @pytest_asyncio.fixture(autouse=True, scope="session")
@@ -37,6 +49,7 @@ async def _create_tables():
         await conn.run_sync(Base.metadata.create_all)
     yield
     await test_engine.dispose()
+    await test_read_engine.dispose()
 
 
 @pytest_asyncio.fixture(autouse=True, scope="function")
@@ -45,6 +58,7 @@ async def _truncate_tables(_create_tables):
     async with test_engine.begin() as conn:
         for table in reversed(Base.metadata.sorted_tables):
             await conn.execute(text(f"DELETE FROM {table.name}"))
+    whitelist.invalidate()
 
     yield
 
@@ -99,6 +113,7 @@ async def editor_headers(client):
             WhitelistUser(telegram_id=editor_tg_id, username="editor", role="editor")
         )
         await session.commit()
+    whitelist.invalidate()
     return {"X-Telegram-Init-Data": make_init_data(user_id=editor_tg_id)}
 
 
@@ -113,6 +128,7 @@ def mock_ghost():
     )
     ghost.update_page_html = AsyncMock()
     ghost.close = AsyncMock()
+    ghost.breaker.state = "closed"
     return ghost
 
 
@@ -131,6 +147,10 @@ def mock_content_builder(mock_ghost):
     builder.ghost_client = mock_ghost
     builder.sync_events_page = AsyncMock()
     builder.sync_courses_page = AsyncMock()
+    builder.sync_queue.enqueue = AsyncMock()
+    builder.sync_queue.status = MagicMock(
+        return_value={"running": True, "in_progress": None, "pending": []}
+    )
     return builder
 
 
@@ -147,6 +167,7 @@ async def client(
             WhitelistUser(telegram_id=123456789, username="testadmin", role="admin")
         )
         await session.commit()
+    whitelist.invalidate()
 
     async def override_get_db():
         async with test_session_factory() as session:
@@ -158,6 +179,7 @@ async def client(
     app.dependency_overrides[get_db] = override_get_db
     app.state.content_page_builder = mock_content_builder
     app.state.notification_service = mock_notification
+    app.state.writer = None
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -168,4 +190,5 @@ async def client(
     app.dependency_overrides.clear()
     app.state.content_page_builder = None
     app.state.notification_service = None
+    app.state.writer = None
     limiter.enabled = True
@@ -0,0 +1,84 @@
+from tests.conftest import make_init_data
+from tests.factories import make_user
+
+
+async def _session(client, headers):
+    resp = await client.post("/api/auth/session", headers=headers)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestSessionExchange:
+    async def test_issue_token(self, client, auth_headers):
+        body = await _session(client, auth_headers)
+        assert body["role"] == "admin"
+        assert body["user"]["id"] == 123456789
+        assert body["token"]
+
+    async def test_token_authenticates(self, client, auth_headers):
+        token = (await _session(client, auth_headers))["token"]
+        resp = await client.get("/api/users/me", headers=_bearer(token))
+        assert resp.status_code == 200
+        assert resp.json() == {"id": 123456789, "first_name": "Test"}
+
+    async def test_refresh_with_token(self, client, auth_headers):
+        token = (await _session(client, auth_headers))["token"]
+        body = await _session(client, _bearer(token))
+        assert body["role"] == "admin"
+
+    async def test_not_whitelisted(self, client):
+        headers = {"X-Telegram-Init-Data": make_init_data(user_id=42)}
+        resp = await client.post("/api/auth/session", headers=headers)
+        assert resp.status_code == 403
+
+    async def test_no_credentials(self, client):
+        resp = await client.post("/api/auth/session")
+        assert resp.status_code == 401
+
+    async def test_garbage_token(self, client):
+        resp = await client.get("/api/users/me", headers=_bearer("not.a.token"))
+        assert resp.status_code == 401
+
+    async def test_editor_token_is_not_admin(self, client, editor_headers):
+        token = (await _session(client, editor_headers))["token"]
+        resp = await client.post(
+            "/api/users", json=make_user(telegram_id=555555), headers=_bearer(token)
+        )
+        assert resp.status_code == 403
+
+
+class TestSessionRevocation:
+    async def test_removed_user_token_revoked(self, client, auth_headers):
+        await client.post("/api/users", json=make_user(), headers=auth_headers)
+        users = (await client.get("/api/users", headers=auth_headers)).json()
+        added = next(u for u in users if u["telegram_id"] == 987654321)
+        headers = {"X-Telegram-Init-Data": make_init_data(user_id=987654321)}
+        token = (await _session(client, headers))["token"]
+
+        await client.delete(f"/api/users/{added['id']}", headers=auth_headers)
+        resp = await client.get("/api/users/me", headers=_bearer(token))
+        assert resp.status_code == 401
+
+    async def test_role_change_revokes_token(self, client, auth_headers, db_session):
+        from sqlalchemy import update
+
+        from src.models.user import WhitelistUser
+        from src.services.whitelist import whitelist
+
+        token = (await _session(client, auth_headers))["token"]
+        await db_session.execute(
+            update(WhitelistUser)
+            .where(WhitelistUser.telegram_id == 123456789)
+            .values(role="editor")
+        )
+        await db_session.commit()
+        whitelist.invalidate()
+
+        resp = await client.get("/api/users", headers=_bearer(token))
+        assert resp.status_code == 401
+        # A fresh exchange picks up the new role
+        assert (await _session(client, auth_headers))["role"] == "editor"
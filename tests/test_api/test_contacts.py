@@ -1,3 +1,4 @@
+import pytest
 
 from tests.factories import make_contact
 
@@ -41,6 +42,20 @@ class TestContactAdmin:
         assert resp.status_code == 200
         assert resp.json()["total"] >= 1
 
+    async def test_search_contacts(self, client, auth_headers):
+        await client.post(
+            "/api/contacts", json=make_contact(name="Анна", message="Хочу на курс")
+        )
+        await client.post(
+            "/api/contacts", json=make_contact(name="Пётр", phone="+7 912 000 1122")
+        )
+        resp = await client.get("/api/contacts?search=анна", headers=auth_headers)
+        assert [c["name"] for c in resp.json()["items"]] == ["Анна"]
+        resp = await client.get("/api/contacts?search=курс", headers=auth_headers)
+        assert resp.json()["total"] == 1
+        resp = await client.get("/api/contacts?search=912", headers=auth_headers)
+        assert [c["name"] for c in resp.json()["items"]] == ["Пётр"]
+
     async def test_filter_unprocessed(self, client, auth_headers):
         await client.post("/api/contacts", json=make_contact())
         resp = await client.get("/api/contacts?is_processed=false", headers=auth_headers)
@@ -87,3 +102,25 @@ class TestContactAdmin:
         )
         assert resp.status_code == 200
         assert resp.json()["total"] >= 1
+
+
+class TestContactCursorPagination:
+    @pytest.mark.parametrize("sort", ["desc", "asc"])
+    async def test_cursor_walk_matches_offset_order(self, client, auth_headers, sort):
+        # Submitted within the same second — created_at ties fall back to id
+        for i in range(5):
+            await client.post("/api/contacts", json=make_contact(name=f"P{i}"))
+        resp = await client.get(f"/api/contacts?limit=100&sort={sort}", headers=auth_headers)
+        expected = [c["name"] for c in resp.json()["items"]]
+        assert len(expected) == 5
+
+        names, cursor = [], None
+        while True:
+            path = f"/api/contacts?limit=2&sort={sort}" + (f"&cursor={cursor}" if cursor else "")
+            page = (await client.get(path, headers=auth_headers)).json()
+            assert page["total"] == 5
+            names += [c["name"] for c in page["items"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert names == expected
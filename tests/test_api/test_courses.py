@@ -1,4 +1,8 @@
 
+import io
+
+from PIL import Image
+
 from tests.factories import make_course
 
 
@@ -16,6 +20,17 @@ class TestCoursesCRUD:
         assert resp.status_code == 200
         assert resp.json()["total"] >= 1
 
+    async def test_search_courses(self, client, auth_headers):
+        await client.post(
+            "/api/courses", json=make_course(title="Йога для начинающих"), headers=auth_headers
+        )
+        await client.post("/api/courses", json=make_course(title="Керамика"), headers=auth_headers)
+        resp = await client.get("/api/courses?search=НАЧИН", headers=auth_headers)
+        assert [c["title"] for c in resp.json()["items"]] == ["Йога для начинающих"]
+        # schedule is indexed too
+        resp = await client.get("/api/courses?search=пн", headers=auth_headers)
+        assert resp.json()["total"] == 2
+
     async def test_get_course(self, client, auth_headers):
         create = await client.post("/api/courses", json=make_course(), headers=auth_headers)
         course_id = create.json()["id"]
@@ -81,3 +96,45 @@ class TestCourseRBAC:
         course_id = create.json()["id"]
         resp = await client.delete(f"/api/courses/{course_id}", headers=auth_headers)
         assert resp.status_code == 204
+
+
+class TestCourseImageUpload:
+    async def test_upload_resyncs_published_course(
+        self, client, auth_headers, mock_content_builder
+    ):
+        create = await client.post("/api/courses", json=make_course(), headers=auth_headers)
+        course_id = create.json()["id"]
+        await client.post(f"/api/courses/{course_id}/publish", headers=auth_headers)
+        mock_content_builder.sync_queue.enqueue.reset_mock()
+        buf = io.BytesIO()
+        Image.new("RGB", (1200, 800), "blue").save(buf, format="PNG")
+
+        await client.post(
+            f"/api/courses/{course_id}/upload-image?type=mobile",
+            files={"file": ("m.png", buf.getvalue(), "image/png")},
+            headers=auth_headers,
+        )
+
+        course = (await client.get(f"/api/courses/{course_id}", headers=auth_headers)).json()
+        assert course["image_mobile_state"] == "ready"
+        mock_content_builder.sync_queue.enqueue.assert_awaited_with("courses")
+
+
+class TestCourseCursorPagination:
+    async def test_cursor_walk_matches_offset_order(self, client, auth_headers):
+        for i, order in enumerate([1, 0, 1, 0, 2]):
+            await client.post(
+                "/api/courses", json=make_course(title=f"C{i}", order=order), headers=auth_headers
+            )
+        resp = await client.get("/api/courses?limit=100", headers=auth_headers)
+        expected = [c["title"] for c in resp.json()["items"]]
+
+        titles, cursor = [], None
+        while True:
+            path = "/api/courses?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            page = (await client.get(path, headers=auth_headers)).json()
+            titles += [c["title"] for c in page["items"]]
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert titles == expected
@@ -1,3 +1,6 @@
+import io
+
+from PIL import Image
 
 from tests.conftest import make_init_data
 from tests.factories import make_event
@@ -62,6 +65,63 @@ class TestEventsCRUD:
         assert resp.status_code == 200
         assert resp.json()["total"] >= 1
 
+    async def test_search_cyrillic_case_and_prefix(self, client, auth_headers):
+        await client.post(
+            "/api/events", json=make_event(title="Концерт в саду"), headers=auth_headers
+        )
+        await client.post("/api/events", json=make_event(title="Лекция"), headers=auth_headers)
+        resp = await client.get("/api/events?search=конц", headers=auth_headers)
+        assert [e["title"] for e in resp.json()["items"]] == ["Концерт в саду"]
+
+    async def test_search_description_and_location(self, client, auth_headers):
+        await client.post(
+            "/api/events",
+            json=make_event(title="A", description="джазовый вечер", location="Клуб"),
+            headers=auth_headers,
+        )
+        for query in ("джаз", "клуб", "вечер клуб"):
+            resp = await client.get(f"/api/events?search={query}", headers=auth_headers)
+            assert resp.json()["total"] == 1, query
+
+    async def test_search_ranks_better_matches_first(self, client, auth_headers):
+        await client.post(
+            "/api/events",
+            json=make_event(title="Вечер", description="джаз и не только", order=0),
+            headers=auth_headers,
+        )
+        await client.post(
+            "/api/events",
+            json=make_event(title="Джаз джаз", description="джаз", order=1),
+            headers=auth_headers,
+        )
+        resp = await client.get("/api/events?search=джаз", headers=auth_headers)
+        assert [e["title"] for e in resp.json()["items"]] == ["Джаз джаз", "Вечер"]
+
+    async def test_search_follows_updates_and_deletes(self, client, auth_headers):
+        create = await client.post(
+            "/api/events", json=make_event(title="Старое"), headers=auth_headers
+        )
+        event_id = create.json()["id"]
+        await client.patch(
+            f"/api/events/{event_id}", json={"title": "Новое"}, headers=auth_headers
+        )
+        resp = await client.get("/api/events?search=старое", headers=auth_headers)
+        assert resp.json()["total"] == 0
+        resp = await client.get("/api/events?search=новое", headers=auth_headers)
+        assert resp.json()["total"] == 1
+
+        await client.delete(f"/api/events/{event_id}", headers=auth_headers)
+        resp = await client.get("/api/events?search=новое", headers=auth_headers)
+        assert resp.json()["total"] == 0
+
+    async def test_search_operators_are_literal(self, client, auth_headers):
+        await client.post("/api/events", json=make_event(title="Rock"), headers=auth_headers)
+        for query in ('"', "OR", "NOT rock", "rock*)", "(("):
+            resp = await client.get(
+                "/api/events", params={"search": query}, headers=auth_headers
+            )
+            assert resp.status_code == 200, query
+
 
 class TestEventLifecycle:
     async def test_publish_event(self, client, auth_headers):
@@ -97,6 +157,16 @@ class TestEventLifecycle:
         assert resp.status_code == 200
         assert resp.json()["status"] == "cancelled"
 
+    async def test_transition_from_wrong_status_conflicts(self, client, auth_headers):
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+        resp = await client.post(f"/api/events/{event_id}/archive", headers=auth_headers)
+        assert resp.status_code == 409
+        assert resp.json()["error"] == "conflict"
+
+        missing = await client.post("/api/events/999/publish", headers=auth_headers)
+        assert missing.status_code == 404
+
     async def test_cannot_delete_published(self, client, auth_headers):
         create = await client.post("/api/events", json=make_event(), headers=auth_headers)
         event_id = create.json()["id"]
@@ -147,7 +217,7 @@ class TestEventValidation:
 class TestEventAuth:
     async def test_no_auth_header(self, client):
         resp = await client.get("/api/events")
-        assert resp.status_code == 422  # missing header
+        assert resp.status_code == 401  # no initData or session token
 
     async def test_invalid_auth(self, client):
         resp = await client.get(
@@ -179,3 +249,159 @@ class TestEventRBAC:
         event_id = create.json()["id"]
         resp = await client.delete(f"/api/events/{event_id}", headers=auth_headers)
         assert resp.status_code == 204
+
+
+class TestEventImageUpload:
+    async def _upload(self, client, auth_headers, event_id, size=(2000, 1500)):
+        buf = io.BytesIO()
+        Image.new("RGB", size, "red").save(buf, format="PNG")
+        return await client.post(
+            f"/api/events/{event_id}/upload-image",
+            files={"file": ("cover.png", buf.getvalue(), "image/png")},
+            headers=auth_headers,
+        )
+
+    async def test_upload_returns_pending_then_completes(
+        self, client, auth_headers, mock_ghost
+    ):
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+
+        resp = await self._upload(client, auth_headers, event_id)
+
+        assert resp.status_code == 200
+        assert resp.json()["state"] == "pending"
+        assert resp.json()["url"] is None
+
+        # the test transport runs background tasks before returning
+        event = (await client.get(f"/api/events/{event_id}", headers=auth_headers)).json()
+        assert event["cover_image_state"] == "ready"
+        assert event["cover_image"] == "https://ghost.example.com/image.jpg"
+        assert [v["width"] for v in event["cover_image_variants"]] == [516, 1032]
+        data, filename, content_type = mock_ghost.upload_image.call_args.args
+        assert content_type == "image/webp"
+        assert filename.endswith(".webp")
+        with Image.open(io.BytesIO(data)) as uploaded:
+            assert uploaded.size in {(516, 387), (1032, 774)}
+
+    async def test_upload_resyncs_published_event(
+        self, client, auth_headers, mock_content_builder
+    ):
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+        await client.post(f"/api/events/{event_id}/publish", headers=auth_headers)
+        mock_content_builder.sync_queue.enqueue.reset_mock()
+
+        await self._upload(client, auth_headers, event_id)
+
+        mock_content_builder.sync_queue.enqueue.assert_awaited_with("events")
+
+    async def test_failed_upload_marks_state(self, client, auth_headers, mock_ghost):
+        mock_ghost.upload_image.side_effect = RuntimeError("ghost down")
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+
+        resp = await self._upload(client, auth_headers, event_id)
+
+        assert resp.status_code == 200
+        event = (await client.get(f"/api/events/{event_id}", headers=auth_headers)).json()
+        assert event["cover_image_state"] == "failed"
+        assert event["cover_image"] is None
+
+    async def test_publish_blocked_while_upload_pending(
+        self, client, auth_headers, db_session
+    ):
+        from src.models.event import Event
+
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+        event = await db_session.get(Event, event_id)
+        event.cover_image_state = "pending"
+        await db_session.commit()
+
+        resp = await client.post(f"/api/events/{event_id}/publish", headers=auth_headers)
+
+        assert resp.status_code == 400
+        assert "upload" in resp.json()["message"]
+
+    async def test_upload_rejects_non_image(self, client, auth_headers, mock_ghost):
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+
+        resp = await client.post(
+            f"/api/events/{event_id}/upload-image",
+            files={"file": ("x.png", b"not an image", "image/png")},
+            headers=auth_headers,
+        )
+
+        assert resp.status_code == 400
+        mock_ghost.upload_image.assert_not_called()
+
+    async def test_same_image_uploaded_once(self, client, auth_headers, mock_ghost):
+        for _ in range(2):
+            create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+            await self._upload(client, auth_headers, create.json()["id"], size=(800, 600))
+
+        assert mock_ghost.upload_image.await_count == 2  # 516w + 800w, first upload only
+
+
+async def _walk(client, headers, path, limit=2):
+    """Follow next_cursor from the first page to the last; return all titles."""
+    sep = "&" if "?" in path else "?"
+    resp = await client.get(f"{path}{sep}limit={limit}", headers=headers)
+    pages = [resp.json()]
+    while pages[-1]["next_cursor"]:
+        resp = await client.get(
+            f"{path}{sep}limit={limit}&cursor={pages[-1]['next_cursor']}", headers=headers
+        )
+        assert resp.status_code == 200
+        pages.append(resp.json())
+    return [item["title"] for page in pages for item in page["items"]]
+
+
+class TestEventCursorPagination:
+    async def test_cursor_walk_matches_offset_order(self, client, auth_headers):
+        # Ties on order and NULL dates exercise every key of (order, event_date, id)
+        specs = [
+            (1, "2026-01-02"), (0, None), (1, None), (0, "2026-01-01"),
+            (0, "2026-01-01"), (2, "2025-12-31"), (1, "2026-01-02"),
+        ]
+        for i, (order, day) in enumerate(specs):
+            await client.post(
+                "/api/events",
+                json=make_event(title=f"E{i}", order=order, event_date=day),
+                headers=auth_headers,
+            )
+        resp = await client.get("/api/events?limit=100", headers=auth_headers)
+        expected = [e["title"] for e in resp.json()["items"]]
+        assert resp.json()["next_cursor"] is None
+
+        assert await _walk(client, auth_headers, "/api/events") == expected
+        assert await _walk(client, auth_headers, "/api/events", limit=3) == expected
+
+    async def test_cursor_with_search_keeps_ranking(self, client, auth_headers):
+        for i, text in enumerate(["джаз", "джаз джаз джаз", "джаз джаз", "рок"]):
+            await client.post(
+                "/api/events",
+                json=make_event(title=f"E{i}", description=text, order=i),
+                headers=auth_headers,
+            )
+        resp = await client.get("/api/events?search=джаз&limit=100", headers=auth_headers)
+        expected = [e["title"] for e in resp.json()["items"]]
+        assert expected == ["E1", "E2", "E0"]
+        assert await _walk(client, auth_headers, "/api/events?search=джаз", limit=1) == expected
+
+    async def test_cursor_ignores_offset(self, client, auth_headers):
+        for i in range(3):
+            await client.post(
+                "/api/events", json=make_event(title=f"E{i}", order=i), headers=auth_headers
+            )
+        first = (await client.get("/api/events?limit=1", headers=auth_headers)).json()
+        resp = await client.get(
+            f"/api/events?limit=1&offset=2&cursor={first['next_cursor']}", headers=auth_headers
+        )
+        assert [e["title"] for e in resp.json()["items"]] == ["E1"]
+
+    async def test_invalid_cursor(self, client, auth_headers):
+        resp = await client.get("/api/events?cursor=garbage", headers=auth_headers)
+        assert resp.status_code == 400
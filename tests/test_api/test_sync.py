@@ -0,0 +1,23 @@
+from tests.factories import make_event
+
+
+class TestSyncQueueing:
+    async def test_publish_enqueues_instead_of_syncing(
+        self, client, auth_headers, mock_content_builder,
+    ):
+        create = await client.post("/api/events", json=make_event(), headers=auth_headers)
+        event_id = create.json()["id"]
+        resp = await client.post(f"/api/events/{event_id}/publish", headers=auth_headers)
+
+        assert resp.status_code == 200
+        mock_content_builder.sync_queue.enqueue.assert_awaited_once_with("events")
+        mock_content_builder.sync_events_page.assert_not_awaited()
+
+    async def test_sync_status(self, client, auth_headers):
+        resp = await client.get("/api/sync/status", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.json()["pending"] == []
+
+    async def test_sync_status_requires_auth(self, client):
+        resp = await client.get("/api/sync/status")
+        assert resp.status_code == 401  # no initData or session token
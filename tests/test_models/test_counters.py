@@ -0,0 +1,116 @@
+import random
+
+from sqlalchemy import delete, event, func, select, update
+
+from src.models.contact import ContactMessage
+from src.models.course import Course, CourseStatus
+from src.models.event import Event, EventStatus
+from src.repositories.contact import ContactRepository
+from src.repositories.counter import EntityCountRepository
+from src.repositories.event import EventRepository
+from tests.conftest import test_read_engine
+
+
+async def _event_counts_match(session) -> None:
+    counts = EntityCountRepository(session)
+    for status in EventStatus:
+        actual = await session.scalar(
+            select(func.count()).select_from(Event).where(Event.status == status)
+        )
+        assert await counts.get("events", status.name) == actual, status
+    assert await counts.get("events") == await session.scalar(
+        select(func.count()).select_from(Event)
+    )
+
+
+class TestEntityCounts:
+    async def test_insert_update_delete(self, db_session):
+        db_session.add_all(
+            [Event(title=f"E{i}", status=EventStatus.DRAFT) for i in range(3)]
+            + [Course(title="C", status=CourseStatus.PUBLISHED)]
+        )
+        await db_session.commit()
+        counts = EntityCountRepository(db_session)
+        assert await counts.get("events", "DRAFT") == 3
+        assert await counts.get("courses", "PUBLISHED") == 1
+
+        event = (await db_session.scalars(select(Event).limit(1))).one()
+        event.status = EventStatus.PUBLISHED
+        await db_session.commit()
+        assert await counts.get("events", "DRAFT") == 2
+        assert await counts.get("events", "PUBLISHED") == 1
+
+        # Updating other columns does not move the row between buckets
+        event.title = "Renamed"
+        await db_session.commit()
+        assert await counts.get("events", "PUBLISHED") == 1
+
+        await db_session.delete(event)
+        await db_session.commit()
+        assert await counts.get("events", "PUBLISHED") == 0
+        assert await counts.get("events") == 2
+
+    async def test_random_writes_stay_consistent(self, db_session):
+        rng = random.Random(42)
+        statuses = list(EventStatus)
+        for _ in range(60):
+            op = rng.choice(["insert", "insert", "update", "delete", "bulk"])
+            if op == "insert":
+                db_session.add(Event(title="E", status=rng.choice(statuses)))
+            elif op == "update":
+                await db_session.execute(
+                    update(Event)
+                    .where(Event.id == rng.randint(1, 40))
+                    .values(status=rng.choice(statuses))
+                )
+            elif op == "delete":
+                await db_session.execute(delete(Event).where(Event.id == rng.randint(1, 40)))
+            else:
+                await db_session.execute(
+                    update(Event)
+                    .where(Event.status == rng.choice(statuses))
+                    .values(status=rng.choice(statuses))
+                )
+            await db_session.commit()
+        await _event_counts_match(db_session)
+
+    async def test_contact_processed_buckets(self, db_session):
+        db_session.add_all(
+            [ContactMessage(name="A", phone="1", message="m") for _ in range(3)]
+        )
+        await db_session.commit()
+        await db_session.execute(
+            update(ContactMessage).where(ContactMessage.id == 1).values(is_processed=True)
+        )
+        await db_session.commit()
+
+        repo = ContactRepository(db_session)
+        assert (await repo.list_filtered(is_processed=False))[1] == 2
+        assert (await repo.list_filtered(is_processed=True))[1] == 1
+        assert (await repo.list_filtered())[1] == 3
+
+    async def test_rolled_back_write_is_not_counted(self, db_session):
+        db_session.add(Event(title="E", status=EventStatus.DRAFT))
+        await db_session.flush()
+        await db_session.rollback()
+        assert await EntityCountRepository(db_session).get("events") == 0
+
+    async def test_search_total_still_counts_matches(self, db_session):
+        db_session.add_all([Event(title="Джаз"), Event(title="Рок")])
+        await db_session.commit()
+        _, total, _ = await EventRepository(db_session).list_filtered(search="джаз")
+        assert total == 1
+
+    async def test_list_total_skips_count_query(self, db_session):
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_read_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await EventRepository(db_session).list_filtered(status=EventStatus.DRAFT)
+        finally:
+            event.remove(test_read_engine.sync_engine, "before_cursor_execute", capture)
+        assert not any("count(*)" in s.lower() and "FROM events" in s for s in statements)
+        assert any("entity_counts" in s for s in statements)
@@ -0,0 +1,112 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from src.models.course import CourseStatus
+from src.models.event import EventStatus
+from src.repositories.contact import ContactRepository
+from src.repositories.course import CourseRepository
+from src.repositories.event import EventRepository
+from src.utils.cursor import encode_cursor
+from tests.conftest import test_engine, test_read_engine
+
+
+@pytest.fixture
+def captured_sql():
+    """Record every statement the repositories send, with its parameters."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    for engine in (test_engine, test_read_engine):
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    yield statements
+    for engine in (test_engine, test_read_engine):
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+async def _plans(statements) -> list[str]:
+    plans = []
+    async with test_engine.connect() as conn:
+        for statement, parameters in list(statements):
+            rows = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plans.append(" | ".join(row[3] for row in rows))
+    return plans
+
+
+def _assert_indexed(plans: list[str], index: str):
+    assert plans, "no queries captured"
+    for plan in plans:
+        assert "TEMP B-TREE" not in plan, plan
+        assert "USING" in plan and "INDEX" in plan, plan
+    assert any(index in plan for plan in plans), plans
+
+
+@pytest.mark.parametrize(
+    ("call", "index"),
+    [
+        (lambda r: r.get_published(), "ix_events_status_order"),
+        (lambda r: r.get_past_published(date.today()), "ix_events_status_date"),
+        (lambda r: r.list_filtered(status=EventStatus.DRAFT), "ix_events_status_order"),
+        (lambda r: r.list_filtered(), "ix_events_order"),
+    ],
+)
+async def test_event_queries_use_indexes(db_session, captured_sql, call, index):
+    await call(EventRepository(db_session))
+    _assert_indexed(await _plans(captured_sql), index)
+
+
+@pytest.mark.parametrize(
+    ("call", "index"),
+    [
+        (lambda r: r.get_published(), "ix_courses_status_order"),
+        (lambda r: r.list_filtered(status=CourseStatus.DRAFT), "ix_courses_status_order"),
+        (lambda r: r.list_filtered(), "ix_courses_order"),
+    ],
+)
+async def test_course_queries_use_indexes(db_session, captured_sql, call, index):
+    await call(CourseRepository(db_session))
+    _assert_indexed(await _plans(captured_sql), index)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "index"),
+    [
+        ({"is_processed": False}, "ix_contact_messages_processed_created"),
+        ({"date_from": date(2026, 1, 1), "sort": "asc"}, "ix_contact_messages_created"),
+        ({}, "ix_contact_messages_created"),
+    ],
+)
+async def test_contact_queries_use_indexes(db_session, captured_sql, kwargs, index):
+    await ContactRepository(db_session).list_filtered(**kwargs)
+    _assert_indexed(await _plans(captured_sql), index)
+
+
+@pytest.mark.parametrize(
+    ("call", "plan"),
+    [
+        (
+            lambda s: ContactRepository(s).list_filtered(
+                cursor=encode_cursor(["2026-01-01 00:00:00", 5])
+            ),
+            "ix_contact_messages_created (created_at<?)",
+        ),
+        (
+            lambda s: EventRepository(s).list_filtered(
+                cursor=encode_cursor([1, date(2026, 1, 1), 5])
+            ),
+            "ix_events_order (order>?)",
+        ),
+        (
+            lambda s: CourseRepository(s).list_filtered(cursor=encode_cursor([1, 5])),
+            "ix_courses_order (order>?)",
+        ),
+    ],
+)
+async def test_cursor_pages_seek_the_index(db_session, captured_sql, call, plan):
+    """A cursor page starts with an index range search, not a scan from the top."""
+    await call(db_session)
+    plans = await _plans(captured_sql)
+    assert any(plan in p for p in plans), plans
@@ -0,0 +1,103 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from src.database import make_engine, read_only_url, sqlite_pragmas
+from src.models.event import Event
+from src.repositories.event import EventRepository
+from src.repositories.user import UserRepository
+from tests.conftest import test_engine, test_read_engine
+
+
+@pytest.fixture
+def engine_log():
+    """Which engine ("read" / "write") ran each SELECT."""
+    log = []
+
+    def recorder(name):
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                log.append(name)
+
+        return record
+
+    listeners = [
+        (test_read_engine.sync_engine, recorder("read")),
+        (test_engine.sync_engine, recorder("write")),
+    ]
+    for target, fn in listeners:
+        event.listen(target, "before_cursor_execute", fn)
+    yield log
+    for target, fn in listeners:
+        event.remove(target, "before_cursor_execute", fn)
+
+
+class TestReadRouting:
+    async def test_repository_reads_use_read_engine(self, db_session, engine_log):
+        await EventRepository(db_session).list_filtered()
+        await EventRepository(db_session).get_published()
+        await UserRepository(db_session).get_by_telegram_id(1)
+
+        assert engine_log and set(engine_log) == {"read"}
+
+    async def test_other_reads_use_write_engine(self, db_session, engine_log):
+        await EventRepository(db_session).get(1)
+
+        assert engine_log == ["write"]
+
+    async def test_reads_after_write_see_uncommitted_rows(self, db_session, engine_log):
+        repo = EventRepository(db_session)
+        await repo.create(title="Черновик")
+        engine_log.clear()
+
+        items, total, _ = await repo.list_filtered()
+
+        assert [e.title for e in items] == ["Черновик"]
+        assert total == 1
+        assert set(engine_log) == {"write"}
+
+    async def test_routing_resumes_after_commit(self, db_session, engine_log):
+        repo = EventRepository(db_session)
+        await repo.create(title="Концерт")
+        await db_session.commit()
+        engine_log.clear()
+
+        items, _, _ = await repo.list_filtered()
+
+        assert len(items) == 1
+        assert set(engine_log) == {"read"}
+
+
+class TestReadEngine:
+    async def test_rejects_writes(self):
+        async with test_read_engine.connect() as conn:
+            with pytest.raises(OperationalError, match="readonly"):
+                await conn.execute(Event.__table__.insert().values(title="x"))
+
+    async def test_sets_query_only(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'r.db'}"
+        writer = make_engine(url, "balanced")
+        reader = make_engine(read_only_url(url), "balanced", read_only=True)
+        try:
+            await sqlite_pragmas(writer)  # creates the file
+            pragmas = await sqlite_pragmas(reader)
+        finally:
+            await reader.dispose()
+            await writer.dispose()
+
+        assert pragmas["query_only"] == 1
+        assert pragmas["journal_mode"] == "wal"
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (
+                "sqlite+aiosqlite:///data/komonbot.db",
+                "sqlite+aiosqlite:///file:data/komonbot.db?mode=ro&uri=true",
+            ),
+            ("sqlite+aiosqlite:///:memory:", None),
+            ("sqlite+aiosqlite://", None),
+        ],
+    )
+    def test_read_only_url(self, url, expected):
+        assert read_only_url(url) == expected
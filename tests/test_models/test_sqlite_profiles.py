@@ -0,0 +1,36 @@
+import pytest
+
+from src.database import SQLITE_PROFILES, make_engine, sqlite_pragmas
+
+# PRAGMA synchronous / temp_store read back as numbers
+SYNCHRONOUS = {"OFF": 0, "NORMAL": 1, "FULL": 2}
+TEMP_STORE = {"DEFAULT": 0, "FILE": 1, "MEMORY": 2}
+
+
+@pytest.mark.parametrize("profile", sorted(SQLITE_PROFILES))
+async def test_profile_pragmas_applied_on_connect(tmp_path, profile):
+    expected = SQLITE_PROFILES[profile]
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}", profile)
+    try:
+        pragmas = await sqlite_pragmas(engine)
+    finally:
+        await engine.dispose()
+
+    assert pragmas["journal_mode"] == "wal"
+    assert pragmas["foreign_keys"] == 1
+    assert pragmas["synchronous"] == SYNCHRONOUS[expected["synchronous"]]
+    assert pragmas["temp_store"] == TEMP_STORE[expected["temp_store"]]
+    assert pragmas["cache_size"] == expected["cache_size"]
+    assert pragmas["mmap_size"] == expected["mmap_size"]
+    assert pragmas["busy_timeout"] == expected["busy_timeout"]
+
+
+async def test_every_pooled_connection_gets_profile(tmp_path):
+    engine = make_engine(f"sqlite+aiosqlite:///{tmp_path / 'p.db'}", "fast")
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            for conn in (first, second):
+                result = await conn.exec_driver_sql("PRAGMA synchronous")
+                assert result.scalar() == SYNCHRONOUS["OFF"]
+    finally:
+        await engine.dispose()
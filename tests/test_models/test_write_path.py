@@ -0,0 +1,79 @@
+from datetime import date, time
+
+import pytest
+from sqlalchemy import event, inspect
+
+from src.models.event import Event, EventStatus
+from src.repositories.contact import ContactRepository
+from src.repositories.event import EventRepository
+from src.services.audit import AuditService
+from src.services.event import EventService
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+def statements():
+    """SQL sent to the write engine, in order."""
+    sent = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        sent.append(" ".join(statement.split()))
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    yield sent
+    event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+
+def _load_all(instance) -> dict:
+    """Read every column attribute — any still unloaded would cost a SELECT."""
+    return {attr.key: getattr(instance, attr.key) for attr in inspect(instance).mapper.column_attrs}
+
+
+class TestWritePath:
+    async def test_create_is_one_insert_returning(self, db_session, statements):
+        contact = await ContactRepository(db_session).create(
+            name="Анна", phone="+79001234567", message="Хочу на курс"
+        )
+        values = _load_all(contact)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO contact_messages")
+        assert "RETURNING" in statements[0]
+        assert values["id"] is not None
+        assert values["created_at"] is not None
+        assert values["is_processed"] is False
+
+    async def test_update_is_one_statement(self, db_session, statements):
+        repo = EventRepository(db_session)
+        created = await repo.create(title="Концерт")
+        await db_session.commit()
+        statements.clear()
+
+        updated = await repo.update(created, order=5)
+        values = _load_all(updated)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE events SET")
+        assert values["order"] == 5
+        assert values["updated_at"] is not None
+
+    async def test_publish_round_trips(self, db_session, statements):
+        event_row = Event(
+            title="Концерт",
+            location="Клуб",
+            event_date=date(2026, 6, 1),
+            event_time=time(19, 0),
+        )
+        db_session.add(event_row)
+        await db_session.commit()
+        db_session.expunge_all()
+        statements.clear()
+
+        service = EventService(EventRepository(db_session), AuditService(db_session))
+        published = await service.publish(event_row.id, user_id=1)
+
+        verbs = [s.split()[0] for s in statements]
+        assert verbs == ["UPDATE", "INSERT"]  # conditional status change, audit entry
+        assert "RETURNING" in statements[0]
+        assert published.status == EventStatus.PUBLISHED
+        assert published.title == "Концерт"
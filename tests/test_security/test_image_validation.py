@@ -0,0 +1,69 @@
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from src.utils.image_validation import (
+    MAX_IMAGE_SIZE,
+    READ_CHUNK_SIZE,
+    validate_image,
+)
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n"
+WEBP_HEAD = b"RIFF\x00\x00\x00\x00WEBPVP8 "
+
+
+class _CountingFile(io.BytesIO):
+    """BytesIO that records how many bytes have been read from it."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _upload(data: bytes, name: str = "photo.png") -> UploadFile:
+    return UploadFile(file=_CountingFile(data), filename=name)
+
+
+class TestValidateImage:
+    async def test_returns_rewound_file_with_detected_type(self):
+        data = PNG_HEAD + b"\x00" * 1000
+        image = await validate_image(_upload(data))
+
+        assert image.content_type == "image/png"
+        assert image.size == len(data)
+        assert image.filename.endswith(".png")
+        assert image.file.read() == data
+
+    async def test_detects_webp(self):
+        image = await validate_image(_upload(WEBP_HEAD + b"\x00" * 10, "a.jpg"))
+        assert image.content_type == "image/webp"
+        assert image.filename.endswith(".webp")
+
+    async def test_rejects_bad_magic_after_first_chunk(self):
+        upload = _upload(b"GIF89a" + b"\x00" * (READ_CHUNK_SIZE * 4))
+
+        with pytest.raises(HTTPException) as exc:
+            await validate_image(upload)
+
+        assert exc.value.status_code == 400
+        assert upload.file.bytes_read == READ_CHUNK_SIZE
+
+    async def test_rejects_oversized_without_reading_everything(self):
+        upload = _upload(PNG_HEAD + b"\x00" * (MAX_IMAGE_SIZE * 3))
+
+        with pytest.raises(HTTPException) as exc:
+            await validate_image(upload)
+
+        assert exc.value.status_code == 413
+        assert upload.file.bytes_read <= MAX_IMAGE_SIZE + READ_CHUNK_SIZE
+
+    async def test_accepts_exactly_max_size(self):
+        data = PNG_HEAD + b"\x00" * (MAX_IMAGE_SIZE - len(PNG_HEAD))
+        image = await validate_image(_upload(data))
+        assert image.size == MAX_IMAGE_SIZE
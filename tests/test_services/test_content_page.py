@@ -1,4 +1,4 @@
-from datetime import date, time
+from datetime import date, datetime, time
 from decimal import Decimal
 from unittest.mock import MagicMock
 
@@ -70,6 +70,27 @@ class TestBuildEventsHTML:
         assert "Купить билет" not in html
 
 
+    def test_event_cover_srcset(self, builder):
+        event = _event(1, "Event", datetime(2025, 1, 1))
+        event.cover_image = "https://g/1032.webp"
+        event.cover_image_variants = [
+            {"width": 516, "url": "https://g/516.webp"},
+            {"width": 1032, "url": "https://g/1032.webp"},
+        ]
+        html = builder.build_events_html([event])
+        assert 'src="https://g/1032.webp"' in html
+        assert 'srcset="https://g/516.webp 516w, https://g/1032.webp 1032w"' in html
+        assert 'sizes="(max-width: 560px) 100vw, 516px"' in html
+
+    def test_event_cover_without_variants_has_no_srcset(self, builder):
+        event = _event(1, "Event", datetime(2025, 1, 1))
+        event.cover_image = "https://g/old.jpg"
+        event.cover_image_variants = None
+        html = builder.build_events_html([event])
+        assert 'src="https://g/old.jpg"' in html
+        assert "srcset" not in html
+
+
 class TestBuildCoursesHTML:
     def test_empty_courses(self, builder):
         html = builder.build_courses_html([])
@@ -117,3 +138,70 @@ class TestBuildCoursesHTML:
         html = builder.build_courses_html([course])
         assert "Detailed info here" in html
         assert "Узнать подробнее" in html
+
+    def test_course_images_srcset(self, builder):
+        course = MagicMock(spec=Course)
+        course.title = "Course"
+        course.description = "Desc"
+        course.schedule = "Пн"
+        course.cost = Decimal("0")
+        course.currency = "RUB"
+        course.detailed_description = None
+        course.image_desktop = "https://g/d1600.webp"
+        course.image_desktop_variants = [
+            {"width": 800, "url": "https://g/d800.webp"},
+            {"width": 1600, "url": "https://g/d1600.webp"},
+        ]
+        course.image_mobile = "https://g/m828.webp"
+        course.image_mobile_variants = [
+            {"width": 414, "url": "https://g/m414.webp"},
+            {"width": 828, "url": "https://g/m828.webp"},
+        ]
+        html = builder.build_courses_html([course])
+        assert 'srcset="https://g/d800.webp 800w, https://g/d1600.webp 1600w"' in html
+        assert 'srcset="https://g/m414.webp 414w, https://g/m828.webp 828w"' in html
+
+
+def _event(event_id: int, title: str, updated_at: datetime) -> Event:
+    event = MagicMock(spec=Event)
+    event.id = event_id
+    event.updated_at = updated_at
+    event.title = title
+    event.location = "Venue"
+    event.event_date = date(2025, 1, 1)
+    event.event_time = time(12, 0)
+    event.cover_image = None
+    event.ticket_link = None
+    return event
+
+
+class TestCardCache:
+    def test_unchanged_card_served_from_cache(self, builder):
+        event = _event(1, "Event", datetime(2025, 1, 1, 10, 0))
+        first = builder.build_events_html([event])
+        second = builder.build_events_html([event])
+        assert first == second
+        assert builder.card_cache_misses == 1
+        assert builder.card_cache_hits == 1
+
+    def test_updated_entity_rerendered(self, builder):
+        builder.build_events_html([_event(1, "Old title", datetime(2025, 1, 1, 10, 0))])
+        html = builder.build_events_html([_event(1, "New title", datetime(2025, 1, 1, 11, 0))])
+        assert "New title" in html
+        assert "Old title" not in html
+        assert builder.card_cache_misses == 2
+
+    def test_only_changed_cards_rerendered(self, builder):
+        stamp = datetime(2025, 1, 1, 10, 0)
+        events = [_event(i, f"Event {i}", stamp) for i in range(3)]
+        builder.build_events_html(events)
+        events[1] = _event(1, "Edited", datetime(2025, 1, 1, 12, 0))
+        builder.build_events_html(events)
+        assert builder.card_cache_misses == 4
+        assert builder.card_cache_hits == 2
+
+    def test_cache_is_bounded(self):
+        builder = ContentPageBuilder(ghost_client=MagicMock(), card_cache_size=2)
+        stamp = datetime(2025, 1, 1, 10, 0)
+        builder.build_events_html([_event(i, f"Event {i}", stamp) for i in range(5)])
+        assert len(builder._card_cache) == 2
@@ -0,0 +1,241 @@
+import asyncio
+import io
+import json
+
+import httpx
+import pytest
+import respx
+from tenacity import wait_none
+
+from src.exceptions import ServiceUnavailableError
+from src.services.ghost import GhostClient
+from src.utils.circuit_breaker import STATE_CLOSED, STATE_OPEN, CircuitBreaker
+
+GHOST_URL = "https://ghost.example.com"
+API = f"{GHOST_URL}/ghost/api/admin"
+PAGE_ID = "0123456789abcdef01234567"
+ADMIN_KEY = "abc123:" + "00" * 32
+
+
+@pytest.fixture
+async def ghost():
+    client = GhostClient(GHOST_URL, ADMIN_KEY)
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def ghost_api():
+    with respx.mock(assert_all_called=False) as mock:
+        mock.get(f"{API}/pages/{PAGE_ID}/").mock(
+            return_value=httpx.Response(
+                200,
+                json={"pages": [{"id": PAGE_ID, "updated_at": "2026-01-01T00:00:00.000Z"}]},
+            )
+        )
+        mock.put(f"{API}/pages/{PAGE_ID}/").mock(
+            return_value=httpx.Response(
+                200,
+                json={"pages": [{"id": PAGE_ID, "updated_at": "2026-01-01T00:00:01.000Z"}]},
+            )
+        )
+        yield mock
+
+
+class TestPageContentHash:
+    async def test_first_push_writes_page(self, ghost, ghost_api):
+        pushed = await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        assert pushed is True
+        assert (ghost.pushes, ghost.skips) == (1, 0)
+
+    async def test_unchanged_html_skips_network(self, ghost, ghost_api):
+        await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        calls_after_first = len(ghost_api.calls)
+
+        pushed = await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+
+        assert pushed is False
+        assert len(ghost_api.calls) == calls_after_first
+        assert (ghost.pushes, ghost.skips) == (1, 1)
+
+    async def test_changed_html_pushed(self, ghost, ghost_api):
+        await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        pushed = await ghost.update_page_html(PAGE_ID, "<p>b</p>")
+        assert pushed is True
+        assert ghost.pushes == 2
+
+    async def test_force_pushes_unchanged_html(self, ghost, ghost_api):
+        await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        pushed = await ghost.update_page_html(PAGE_ID, "<p>a</p>", force=True)
+        assert pushed is True
+        assert ghost.skips == 0
+
+
+class TestPageStateCache:
+    async def test_second_push_skips_get(self, ghost, ghost_api):
+        await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        await ghost.update_page_html(PAGE_ID, "<p>b</p>")
+
+        methods = [call.request.method for call in ghost_api.calls]
+        assert methods == ["GET", "PUT", "PUT"]
+
+    async def test_put_uses_updated_at_from_previous_response(self, ghost, ghost_api):
+        await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        await ghost.update_page_html(PAGE_ID, "<p>b</p>")
+
+        last_put = json.loads(ghost_api.calls[-1].request.content)
+        assert last_put["pages"][0]["updated_at"] == "2026-01-01T00:00:01.000Z"
+
+    async def test_collision_refetches_and_retries(self, ghost, ghost_api):
+        await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+        ghost_api.put(f"{API}/pages/{PAGE_ID}/").mock(
+            side_effect=[
+                httpx.Response(409, json={"errors": [{"type": "UpdateCollisionError"}]}),
+                httpx.Response(
+                    200,
+                    json={"pages": [{"id": PAGE_ID, "updated_at": "2026-01-01T00:00:02.000Z"}]},
+                ),
+            ]
+        )
+
+        pushed = await ghost.update_page_html(PAGE_ID, "<p>b</p>")
+
+        assert pushed is True
+        methods = [call.request.method for call in ghost_api.calls]
+        assert methods == ["GET", "PUT", "PUT", "GET", "PUT"]
+        assert ghost._page_state[PAGE_ID][1] == "2026-01-01T00:00:02.000Z"
+
+
+class TestCircuitBreakerAndDeadline:
+    async def test_open_circuit_fails_fast(self, ghost_api):
+        ghost = GhostClient(GHOST_URL, ADMIN_KEY, breaker=CircuitBreaker("t", 1, 60))
+        ghost.breaker.record_failure()
+
+        with pytest.raises(ServiceUnavailableError):
+            await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+
+        assert len(ghost_api.calls) == 0
+        await ghost.close()
+
+    async def test_server_errors_open_circuit(self, ghost_api):
+        ghost = GhostClient(GHOST_URL, ADMIN_KEY, breaker=CircuitBreaker("t", 1, 60))
+        ghost._retry_wait = wait_none()
+        ghost_api.get(f"{API}/pages/{PAGE_ID}/").mock(return_value=httpx.Response(502))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+
+        assert len(ghost_api.calls) == 3  # retried, then gave up
+        assert ghost.breaker.state == STATE_OPEN
+        await ghost.close()
+
+    async def test_client_errors_do_not_open_circuit(self, ghost_api):
+        ghost = GhostClient(GHOST_URL, ADMIN_KEY, breaker=CircuitBreaker("t", 1, 60))
+        ghost_api.get(f"{API}/pages/{PAGE_ID}/").mock(return_value=httpx.Response(404))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+
+        assert len(ghost_api.calls) == 1
+        assert ghost.breaker.state == STATE_CLOSED
+        await ghost.close()
+
+    async def test_deadline_caps_whole_call(self, ghost_api):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={"pages": []})
+
+        ghost = GhostClient(GHOST_URL, ADMIN_KEY, call_deadline=0.05)
+        ghost_api.get(f"{API}/pages/{PAGE_ID}/").mock(side_effect=slow)
+
+        with pytest.raises(ServiceUnavailableError):
+            await ghost.get_page(PAGE_ID)
+
+        assert ghost.breaker.snapshot()["failures"] == 1
+        await ghost.close()
+
+
+class _StubGhost:
+    """Minimal keep-alive HTTP/1.1 server that answers every request with a page."""
+
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        body = json.dumps(
+            {"pages": [{"id": PAGE_ID, "updated_at": "2026-01-01T00:00:00.000Z"}]}
+        ).encode()
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n"):
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                await reader.readexactly(length)
+                self.requests += 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestConnectionPool:
+    async def test_connection_reused_across_calls(self):
+        stub = _StubGhost()
+        async with stub as url:
+            ghost = GhostClient(url, ADMIN_KEY)
+            await ghost.get_page(PAGE_ID)
+            await ghost.update_page_html(PAGE_ID, "<p>a</p>")
+            await ghost.update_page_html(PAGE_ID, "<p>b</p>")
+            await ghost.close()
+
+        assert stub.requests == 4  # GET; GET+PUT (page state resolved); PUT
+        assert stub.connections == 1
+        pool = ghost.stats()["connections"]
+        assert pool["opened"] == 1
+        assert pool["requests"] == 4
+        assert pool["reused"] == 3
+
+
+class TestUploadImage:
+    async def test_streams_file_with_content_type_and_rewinds_on_retry(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            if len(bodies) == 1:
+                return httpx.Response(503)
+            return httpx.Response(201, json={"images": [{"url": "https://cdn/x.png"}]})
+
+        ghost = GhostClient(GHOST_URL, ADMIN_KEY)
+        ghost._retry_wait = wait_none()
+        payload = b"\x89PNG" + b"\x01" * 2048
+        with respx.mock:
+            respx.post(f"{API}/images/upload/").mock(side_effect=handler)
+            url = await ghost.upload_image(io.BytesIO(payload), "a.png", "image/png")
+
+        assert url == "https://cdn/x.png"
+        assert len(bodies) == 2
+        for body in bodies:  # the file was rewound for the retry
+            assert body.count(payload) == 1
+            assert b"Content-Type: image/png" in body
+        await ghost.close()
@@ -0,0 +1,254 @@
+import asyncio
+import io
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from PIL import Image
+from sqlalchemy import select
+
+from src.config import settings
+from src.exceptions import ValidationError
+from src.repositories.image import ImageUploadRepository
+from src.services.image import (
+    IMAGE_TARGETS,
+    TARGET_COURSE_DESKTOP,
+    TARGET_EVENT_COVER,
+    ImageService,
+    PendingImage,
+    fail_stale_uploads,
+    finish_upload,
+    process_variants,
+    variant_boxes,
+)
+from src.services.media import LocalMediaStore
+from src.utils.image_validation import ValidatedImage
+
+
+def _encode(img: Image.Image, fmt: str = "JPEG", **kwargs) -> io.BytesIO:
+    buf = io.BytesIO()
+    img.save(buf, format=fmt, **kwargs)
+    buf.seek(0)
+    return buf
+
+
+def _photo(size=(3000, 2000)) -> Image.Image:
+    return Image.linear_gradient("L").resize(size).convert("RGB")
+
+
+def process_image(source, max_size, fmt="WEBP", quality=80):
+    return process_variants(source, [max_size], fmt, quality)[0]
+
+
+class TestProcessImage:
+    def test_downscales_to_target_and_reports_savings(self):
+        source = _encode(_photo(), quality=95)
+
+        result = process_image(source, IMAGE_TARGETS[TARGET_EVENT_COVER])
+
+        assert (result.width, result.height) == (1032, 688)
+        assert result.content_type == "image/webp"
+        assert result.bytes_saved > 0
+        assert result.original_size == len(source.getvalue())
+
+    def test_small_images_are_not_upscaled(self):
+        result = process_image(_encode(_photo((300, 200))), (1032, 1032))
+        assert (result.width, result.height) == (300, 200)
+
+    def test_strips_exif_and_applies_orientation(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotate 90° CW on display
+        exif[0x010F] = "PhoneMaker"
+        source = _encode(_photo((400, 200)), exif=exif.tobytes())
+
+        result = process_image(source, (1032, 1032))
+
+        with Image.open(io.BytesIO(result.data)) as out:
+            assert out.size == (200, 400)
+            assert not out.getexif()
+
+    def test_jpeg_output_flattens_alpha(self):
+        source = _encode(Image.new("RGBA", (100, 100), (0, 0, 255, 128)), "PNG")
+
+        result = process_image(source, (1032, 1032), fmt="JPEG", quality=70)
+
+        assert result.content_type == "image/jpeg"
+        with Image.open(io.BytesIO(result.data)) as out:
+            assert out.format == "JPEG"
+            assert out.mode == "RGB"
+
+    def test_webp_keeps_alpha(self):
+        source = _encode(Image.new("RGBA", (100, 100), (0, 0, 255, 128)), "PNG")
+
+        result = process_image(source, (1032, 1032))
+
+        with Image.open(io.BytesIO(result.data)) as out:
+            assert out.mode == "RGBA"
+
+    def test_undecodable_image_is_rejected(self):
+        with pytest.raises(ValidationError):
+            process_image(io.BytesIO(b"\x89PNG\r\n\x1a\n" + b"\x00" * 64), (1032, 1032))
+
+
+class TestProcessVariants:
+    def test_one_variant_per_width(self):
+        variants = process_variants(_encode(_photo()), variant_boxes(TARGET_COURSE_DESKTOP))
+
+        assert [v.width for v in variants] == [800, 1200, 1600]
+        assert len(variants[0].data) < len(variants[-1].data)
+
+    def test_small_source_collapses_variants(self):
+        variants = process_variants(_encode(_photo((600, 400))), variant_boxes(TARGET_EVENT_COVER))
+        assert [(v.width, v.height) for v in variants] == [(516, 344), (600, 400)]
+
+        variants = process_variants(_encode(_photo((300, 200))), variant_boxes(TARGET_EVENT_COVER))
+        assert [(v.width, v.height) for v in variants] == [(300, 200)]
+
+
+class TestImageService:
+    async def test_upload_without_ghost_uses_media_store(self, tmp_path):
+        source = _encode(_photo((600, 400)))
+        image = ValidatedImage(
+            file=source, size=len(source.getvalue()), content_type="image/jpeg",
+            filename="x.jpg",
+        )
+
+        store = LocalMediaStore(tmp_path, "https://bot.example.com/uploads")
+        uploaded = await ImageService(None, media_store=store).upload(image, TARGET_EVENT_COVER)
+
+        assert uploaded.url.startswith("https://bot.example.com/uploads/")
+        assert uploaded.url.endswith(".webp")
+        key = uploaded.url.removeprefix("https://bot.example.com/uploads/")
+        assert store.path_for(key).is_file()
+        assert [v["width"] for v in uploaded.variants] == [516, 600]
+        assert uploaded.variants[-1]["url"] == uploaded.url
+
+    async def test_repeat_upload_reuses_stored_url(self, db_session):
+        ghost = AsyncMock()
+        ghost.upload_image.return_value = "https://ghost.example.com/content/a.webp"
+        photo = _photo((400, 300))  # below the smallest width: single variant
+
+        urls = []
+        for _ in range(2):
+            source = _encode(photo)
+            image = ValidatedImage(
+                file=source, size=len(source.getvalue()), content_type="image/jpeg",
+                filename="x.jpg",
+            )
+            service = ImageService(ghost, ImageUploadRepository(db_session))
+            urls.append((await service.upload(image, TARGET_EVENT_COVER)).url)
+            await db_session.commit()
+
+        assert urls == [ghost.upload_image.return_value] * 2
+        ghost.upload_image.assert_awaited_once()
+
+    async def test_different_bytes_are_uploaded_separately(self, db_session):
+        ghost = AsyncMock()
+        ghost.upload_image.side_effect = ["https://g/a.webp", "https://g/b.webp"]
+        # both below the smallest width, so one variant each
+
+        service = ImageService(ghost, ImageUploadRepository(db_session))
+        for size in ((400, 300), (300, 400)):
+            source = _encode(_photo(size))
+            image = ValidatedImage(
+                file=source, size=len(source.getvalue()), content_type="image/jpeg",
+                filename="x.jpg",
+            )
+            await service.upload(image, TARGET_EVENT_COVER)
+
+        assert ghost.upload_image.await_count == 2
+
+    async def test_variants_uploaded_concurrently(self, db_session):
+        in_flight = 0
+        peak = 0
+
+        async def upload(data, filename, content_type):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"https://g/{filename}"
+
+        ghost = AsyncMock()
+        ghost.upload_image.side_effect = upload
+        source = _encode(_photo())
+        image = ValidatedImage(
+            file=source, size=len(source.getvalue()), content_type="image/jpeg",
+            filename="x.jpg",
+        )
+
+        service = ImageService(ghost, ImageUploadRepository(db_session))
+        uploaded = await service.upload(image, TARGET_COURSE_DESKTOP)
+
+        assert [v["width"] for v in uploaded.variants] == [800, 1200, 1600]
+        assert ghost.upload_image.await_count == 3
+        assert peak == 3
+
+
+class TestFinishUpload:
+    async def _finish(self, db_session, tmp_path, token, status="draft", enqueue_error=None):
+        """Run finish_upload for a stashed "old.jpg" against an event holding token."""
+        from src.models.event import Event
+
+        event = Event(
+            title="A", status=status, cover_image_state="pending", cover_image_token=token
+        )
+        db_session.add(event)
+        await db_session.commit()
+        path = tmp_path / "old.jpg"
+        path.write_bytes(_encode(_photo((600, 400))).getvalue())
+        builder = Mock(ghost_client=AsyncMock(), sync_queue=Mock(enqueue=AsyncMock()))
+        builder.ghost_client.upload_image.return_value = "https://ghost.example.com/old.webp"
+        builder.sync_queue.enqueue.side_effect = enqueue_error
+
+        await finish_upload(
+            builder, Event, event.id, "cover_image", TARGET_EVENT_COVER,
+            PendingImage(path=path, content_type="image/jpeg", original_name="old.jpg"),
+            "events",
+        )
+
+        await db_session.refresh(event)
+        assert not path.exists()
+        return event, builder
+
+    async def test_superseded_upload_is_dropped(self, db_session, tmp_path):
+        event, builder = await self._finish(db_session, tmp_path, "new.jpg", "published")
+
+        assert event.cover_image_state == "pending"
+        assert event.cover_image is None
+        builder.sync_queue.enqueue.assert_not_awaited()
+
+    async def test_superseded_failure_leaves_state(self, db_session, tmp_path, monkeypatch):
+        monkeypatch.setattr(ImageService, "upload", AsyncMock(side_effect=RuntimeError("x")))
+
+        event, _ = await self._finish(db_session, tmp_path, "new.jpg")
+
+        assert event.cover_image_state == "pending"
+
+    async def test_resync_error_does_not_raise(self, db_session, tmp_path):
+        event, builder = await self._finish(
+            db_session, tmp_path, "old.jpg", "published", enqueue_error=RuntimeError("down")
+        )
+
+        assert event.cover_image_state == "ready"
+        assert event.cover_image == "https://ghost.example.com/old.webp"
+        builder.sync_queue.enqueue.assert_awaited_once_with("events")
+
+
+class TestStaleUploads:
+    async def test_pending_uploads_marked_failed(self, db_session, tmp_path, monkeypatch):
+        from src.models.event import Event
+
+        pending_dir = tmp_path / "pending"
+        pending_dir.mkdir()
+        (pending_dir / "orphan.png").write_bytes(b"x")
+        monkeypatch.setattr(settings, "UPLOAD_PENDING_DIR", str(pending_dir))
+        db_session.add(Event(title="A", cover_image_state="pending"))
+        db_session.add(Event(title="B", cover_image_state="ready"))
+        await db_session.commit()
+
+        assert await fail_stale_uploads() == 1
+
+        states = (await db_session.execute(select(Event.cover_image_state))).scalars().all()
+        assert sorted(states) == ["failed", "ready"]
+        assert not pending_dir.exists()
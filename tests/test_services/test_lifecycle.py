@@ -0,0 +1,131 @@
+import asyncio
+from datetime import date, time
+
+import pytest
+from sqlalchemy import func, select
+
+from src.database import async_session_factory
+from src.exceptions import ConflictError, NotFoundError, ValidationError
+from src.models.audit import AuditLog
+from src.models.course import Course, CourseStatus
+from src.models.event import Event, EventStatus
+from src.models.image import IMAGE_STATE_PENDING
+from src.repositories.course import CourseRepository
+from src.repositories.event import EventRepository
+from src.services.audit import AuditService
+from src.services.course import COURSE_LIFECYCLE
+from src.services.event import EVENT_LIFECYCLE, EventService
+from src.services.lifecycle import TRANSITIONS
+
+ENTITIES = [
+    (
+        EVENT_LIFECYCLE,
+        EventRepository,
+        lambda status: Event(
+            title="Концерт",
+            location="Клуб",
+            event_date=date(2026, 6, 1),
+            event_time=time(19, 0),
+            status=status,
+        ),
+    ),
+    (
+        COURSE_LIFECYCLE,
+        CourseRepository,
+        lambda status: Course(
+            title="Гончарное дело", description="Курс", schedule="Пн 19:00", status=status
+        ),
+    ),
+]
+
+
+async def _add(session, row) -> int:
+    session.add(row)
+    await session.commit()
+    return row.id
+
+
+@pytest.mark.parametrize("action", sorted(TRANSITIONS))
+@pytest.mark.parametrize(("lifecycle", "repo_cls", "build"), ENTITIES)
+async def test_transition_table(db_session, lifecycle, repo_cls, build, action):
+    transition = TRANSITIONS[action]
+    for status in lifecycle.status_enum:
+        row_id = await _add(db_session, build(status))
+
+        if status.name in transition.sources:
+            row = await lifecycle.transition(repo_cls(db_session), action, row_id)
+            assert row.status.name == transition.target
+        else:
+            with pytest.raises(ConflictError):
+                await lifecycle.transition(repo_cls(db_session), action, row_id)
+        await db_session.rollback()
+
+
+async def test_concurrent_publish_has_one_winner():
+    async with async_session_factory() as session:
+        event_id = await _add(session, ENTITIES[0][2](EventStatus.DRAFT))
+
+    async def publish(user_id: int):
+        async with async_session_factory() as session:
+            service = EventService(EventRepository(session), AuditService(session))
+            return await service.publish(event_id, user_id)
+
+    results = await asyncio.gather(publish(1), publish(2), return_exceptions=True)
+
+    assert sorted(type(r).__name__ for r in results) == ["ConflictError", "Event"]
+    async with async_session_factory() as session:
+        audits = await session.scalar(
+            select(func.count()).select_from(AuditLog).where(AuditLog.action == "publish")
+        )
+    assert audits == 1
+
+
+async def test_missing_row(db_session):
+    with pytest.raises(NotFoundError):
+        await EVENT_LIFECYCLE.transition(EventRepository(db_session), "publish", 999)
+
+
+@pytest.mark.parametrize(
+    ("lifecycle", "repo_cls", "row", "message"),
+    [
+        (EVENT_LIFECYCLE, EventRepository, Event(title="Без места"), "Location is required"),
+        (
+            EVENT_LIFECYCLE,
+            EventRepository,
+            Event(
+                title="Концерт",
+                location="Клуб",
+                event_date=date(2026, 6, 1),
+                event_time=time(19, 0),
+                cover_image_state=IMAGE_STATE_PENDING,
+            ),
+            "Image upload is still in progress",
+        ),
+        (
+            COURSE_LIFECYCLE,
+            CourseRepository,
+            Course(title="Курс", description="Описание"),
+            "Schedule is required",
+        ),
+    ],
+)
+async def test_publish_requirements(db_session, lifecycle, repo_cls, row, message):
+    row_id = await _add(db_session, row)
+
+    with pytest.raises(ValidationError, match=message):
+        await lifecycle.transition(repo_cls(db_session), "publish", row_id)
+
+    await db_session.refresh(row)
+    assert row.status.name == "DRAFT"
+
+
+async def test_transition_bumps_updated_at(db_session):
+    row = ENTITIES[1][2](CourseStatus.PUBLISHED)
+    row_id = await _add(db_session, row)
+    before = row.updated_at
+
+    archived = await COURSE_LIFECYCLE.transition(CourseRepository(db_session), "archive", row_id)
+
+    assert archived is row
+    assert archived.status == CourseStatus.ARCHIVED
+    assert archived.updated_at != before
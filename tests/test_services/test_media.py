@@ -0,0 +1,105 @@
+import hashlib
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from src.services.media import MEDIA_CACHE_CONTROL, LocalMediaStore, MediaFiles
+
+DATA = b"RIFF\x00\x00\x00\x00WEBP" + bytes(range(256)) * 8
+DIGEST = hashlib.sha256(DATA).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalMediaStore(tmp_path, "https://bot.example.com/uploads")
+
+
+class TestLocalMediaStore:
+    def test_sharded_content_addressed_path(self, store, tmp_path):
+        key = store.save(DATA, "image/webp", DIGEST)
+
+        assert key == f"{DIGEST[:2]}/{DIGEST[2:4]}/{DIGEST}.webp"
+        assert (tmp_path / key).read_bytes() == DATA
+        assert store.url_for(key) == f"https://bot.example.com/uploads/{key}"
+
+    def test_no_temp_files_left(self, store, tmp_path):
+        key = store.save(DATA, "image/webp", DIGEST)
+        assert os.listdir((tmp_path / key).parent) == [f"{DIGEST}.webp"]
+
+    def test_existing_file_not_rewritten(self, store, tmp_path):
+        key = store.save(DATA, "image/webp", DIGEST)
+        mtime = (tmp_path / key).stat().st_mtime_ns
+
+        assert store.save(DATA, "image/webp", DIGEST) == key
+        assert (tmp_path / key).stat().st_mtime_ns == mtime
+
+    def test_failed_write_leaves_nothing(self, store, tmp_path, monkeypatch):
+        def boom(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", boom)
+        with pytest.raises(OSError):
+            store.save(DATA, "image/webp", DIGEST)
+
+        shard = tmp_path / DIGEST[:2] / DIGEST[2:4]
+        assert list(shard.iterdir()) == []
+
+    async def test_store_returns_url(self, store):
+        url = await store.store(DATA, "image/webp", DIGEST)
+        assert url.endswith(f"/{DIGEST}.webp")
+
+
+class TestMediaFiles:
+    @pytest.fixture
+    async def media_client(self, store):
+        key = store.save(DATA, "image/webp", DIGEST)
+        app = Starlette(routes=[Mount("/uploads", MediaFiles(directory=store.root))])
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client, f"/uploads/{key}"
+
+    async def test_immutable_cache_headers(self, media_client):
+        client, path = media_client
+        resp = await client.get(path)
+
+        assert resp.status_code == 200
+        assert resp.content == DATA
+        assert resp.headers["cache-control"] == MEDIA_CACHE_CONTROL
+        assert resp.headers["content-type"] == "image/webp"
+        assert resp.headers["etag"]
+
+    async def test_etag_revalidation(self, media_client):
+        client, path = media_client
+        etag = (await client.get(path)).headers["etag"]
+
+        resp = await client.get(path, headers={"If-None-Match": etag})
+
+        assert resp.status_code == 304
+        assert resp.headers["cache-control"] == MEDIA_CACHE_CONTROL
+
+    async def test_range_request(self, media_client):
+        client, path = media_client
+        resp = await client.get(path, headers={"Range": "bytes=0-11"})
+
+        assert resp.status_code == 206
+        assert resp.content == DATA[:12]
+
+    async def test_accel_redirect_hands_file_to_proxy(self, store):
+        key = store.save(DATA, "image/webp", DIGEST)
+        files = MediaFiles(directory=store.root, accel_redirect="/_media/")
+        app = Starlette(routes=[Mount("/uploads", files)])
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            resp = await client.get(f"/uploads/{key}")
+            missing = await client.get("/uploads/00/00/missing.webp")
+
+        assert resp.status_code == 200
+        assert resp.content == b""
+        assert resp.headers["x-accel-redirect"] == f"/_media/{key}"
+        assert resp.headers["cache-control"] == MEDIA_CACHE_CONTROL
+        assert missing.status_code == 404
@@ -0,0 +1,165 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from src.database import async_session_factory
+from src.models.sync import GhostSyncTask
+from src.services.content_page import (
+    PAGE_COURSES,
+    PAGE_EVENTS,
+    ContentPageBuilder,
+    GhostSyncQueue,
+)
+
+
+@pytest.fixture
+def builder():
+    builder = ContentPageBuilder(ghost_client=MagicMock())
+    builder.sync_events_page = AsyncMock()
+    builder.sync_courses_page = AsyncMock()
+    return builder
+
+
+async def _persisted_pages() -> dict[str, GhostSyncTask]:
+    async with async_session_factory() as session:
+        result = await session.execute(select(GhostSyncTask))
+        return {t.page: t for t in result.scalars().all()}
+
+
+class TestGhostSyncQueue:
+    async def test_burst_coalesced_into_single_sync(self, builder):
+        queue = GhostSyncQueue(builder, debounce=0.01)
+        for _ in range(5):
+            await queue.enqueue(PAGE_EVENTS)
+
+        await queue.drain()
+
+        builder.sync_events_page.assert_awaited_once()
+        builder.sync_courses_page.assert_not_awaited()
+        assert queue.coalesced == 4
+        assert queue.synced == 1
+
+    async def test_enqueue_persists_pending_page(self, builder):
+        queue = GhostSyncQueue(builder)
+        await queue.enqueue(PAGE_COURSES)
+
+        assert PAGE_COURSES in await _persisted_pages()
+        builder.sync_courses_page.assert_not_awaited()
+
+    async def test_successful_sync_clears_persisted_row(self, builder):
+        queue = GhostSyncQueue(builder)
+        await queue.enqueue(PAGE_EVENTS)
+        await queue.drain()
+
+        assert await _persisted_pages() == {}
+        assert queue.status()["pending"] == []
+
+    async def test_pending_work_resumed_on_start(self, builder):
+        first = GhostSyncQueue(builder)
+        await first.enqueue(PAGE_EVENTS)
+
+        # Simulate restart: a fresh queue picks the page up from the table
+        second = GhostSyncQueue(builder, debounce=0.01)
+        await second.start()
+        try:
+            for _ in range(50):
+                if builder.sync_events_page.await_count:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await second.stop()
+
+        builder.sync_events_page.assert_awaited_once()
+
+    async def test_failed_sync_kept_for_retry(self, builder):
+        builder.sync_events_page.side_effect = RuntimeError("ghost down")
+        queue = GhostSyncQueue(builder)
+        await queue.enqueue(PAGE_EVENTS)
+        await queue.drain()
+
+        status = queue.status()
+        assert status["pending"] == [PAGE_EVENTS]
+        assert status["pages"][PAGE_EVENTS]["attempts"] == 1
+        assert (await _persisted_pages())[PAGE_EVENTS].attempts == 1
+
+        # Retry is delayed — an immediate drain must not hit Ghost again
+        await queue.drain()
+        assert builder.sync_events_page.await_count == 1
+
+    async def test_only_first_failure_notifies(self, builder):
+        builder.sync_events_page.side_effect = RuntimeError("ghost down")
+        queue = GhostSyncQueue(builder)
+        await queue.enqueue(PAGE_EVENTS)
+        await queue.drain()
+        queue._retry_at[PAGE_EVENTS] = 0
+        await queue.drain()
+
+        notify_flags = [c.kwargs["notify"] for c in builder.sync_events_page.await_args_list]
+        assert notify_flags == [True, False]
+
+    async def test_unknown_page_rejected(self, builder):
+        queue = GhostSyncQueue(builder)
+        with pytest.raises(ValueError):
+            await queue.enqueue("posts")
+
+    async def test_worker_survives_persistence_error(self, builder, monkeypatch):
+        queue = GhostSyncQueue(builder, debounce=0.01)
+        calls = 0
+        original = queue._record_success
+
+        async def flaky_record_success(page):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("database is locked")
+            await original(page)
+
+        monkeypatch.setattr(queue, "_record_success", flaky_record_success)
+        await queue.start()
+        try:
+            await queue.enqueue(PAGE_EVENTS)
+            for _ in range(50):
+                if calls:
+                    break
+                await asyncio.sleep(0.01)
+
+            await queue.enqueue(PAGE_COURSES)
+            for _ in range(50):
+                if builder.sync_courses_page.await_count:
+                    break
+                await asyncio.sleep(0.01)
+            assert queue.status()["running"] is True
+        finally:
+            await queue.stop()
+
+        builder.sync_courses_page.assert_awaited_once()
+
+    async def test_enqueue_during_drain_keeps_row(self, builder):
+        queue = GhostSyncQueue(builder)
+        await queue.enqueue(PAGE_EVENTS)
+
+        async def edit_during_sync(notify):
+            await queue.enqueue(PAGE_EVENTS)
+
+        builder.sync_events_page.side_effect = edit_during_sync
+        await asyncio.gather(queue.drain(), queue.enqueue(PAGE_COURSES))
+
+        assert queue.status()["pending"] == sorted([PAGE_EVENTS, PAGE_COURSES])
+        assert set(await _persisted_pages()) == {PAGE_EVENTS, PAGE_COURSES}
+
+    async def test_pending_only_after_row_committed(self, builder):
+        queue = GhostSyncQueue(builder)
+        seen = []
+
+        async def drain_while_enqueueing():
+            await asyncio.sleep(0)
+            seen.append((set(queue._pending), set(await _persisted_pages())))
+            await queue.drain()
+
+        await asyncio.gather(queue.enqueue(PAGE_EVENTS), drain_while_enqueueing())
+
+        pending, persisted = seen[0]
+        assert pending <= persisted
+        assert set(queue.status()["pending"]) == set(await _persisted_pages())
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.user import WhitelistUser
+from src.services.whitelist import WhitelistSnapshot
+from tests.conftest import make_init_data
+
+
+async def _add(session, telegram_id: int, role: str) -> None:
+    session.add(WhitelistUser(telegram_id=telegram_id, role=role))
+    await session.commit()
+
+
+class TestWhitelistSnapshot:
+    async def test_roles_and_admins(self, db_session):
+        await _add(db_session, 1, "admin")
+        await _add(db_session, 2, "editor")
+        snapshot = WhitelistSnapshot()
+
+        assert await snapshot.role_of(1) == "admin"
+        assert await snapshot.role_of(2) == "editor"
+        assert await snapshot.role_of(3) is None
+        assert await snapshot.admin_ids() == [1]
+
+    async def test_loaded_once_until_invalidated(self, db_session):
+        await _add(db_session, 1, "admin")
+        snapshot = WhitelistSnapshot()
+        await snapshot.load()
+
+        await _add(db_session, 2, "editor")
+        with patch("src.services.whitelist.async_session_factory") as factory:
+            assert await snapshot.role_of(2) is None
+            factory.assert_not_called()
+
+        snapshot.invalidate()
+        assert await snapshot.role_of(2) == "editor"
+
+    async def test_load_racing_invalidate_is_not_kept(self, db_session):
+        await _add(db_session, 1, "admin")
+        snapshot = WhitelistSnapshot()
+        real_execute = AsyncSession.execute
+
+        # Simulate a write + invalidate landing while the load query runs
+        async def racing_execute(self, *args, **kwargs):
+            snapshot.invalidate()
+            return await real_execute(self, *args, **kwargs)
+
+        with patch.object(AsyncSession, "execute", racing_execute):
+            assert await snapshot.role_of(1) == "admin"
+
+        assert snapshot._roles is None
+
+
+class TestWhitelistInvalidationViaApi:
+    async def test_added_user_gains_access(self, client, auth_headers):
+        headers = {"X-Telegram-Init-Data": make_init_data(user_id=987654321)}
+        assert (await client.get("/api/events", headers=headers)).status_code == 403
+
+        await client.post(
+            "/api/users", json={"telegram_id": 987654321}, headers=auth_headers
+        )
+
+        assert (await client.get("/api/events", headers=headers)).status_code == 200
+
+    async def test_deleted_user_loses_access(self, client, auth_headers):
+        create = await client.post(
+            "/api/users", json={"telegram_id": 987654321}, headers=auth_headers
+        )
+        headers = {"X-Telegram-Init-Data": make_init_data(user_id=987654321)}
+        assert (await client.get("/api/events", headers=headers)).status_code == 200
+
+        await client.delete(f"/api/users/{create.json()['id']}", headers=auth_headers)
+
+        assert (await client.get("/api/events", headers=headers)).status_code == 403
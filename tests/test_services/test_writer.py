@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from src.database import async_session_factory, engine
+from src.models.contact import ContactMessage
+from src.repositories.contact import ContactRepository
+from src.services.writer import GroupCommitWriter
+
+
+@pytest.fixture
+async def writer():
+    writer = GroupCommitWriter(engine, window=0.02)
+    await writer.start()
+    yield writer
+    await writer.stop()
+
+
+def _create(name: str):
+    async def work(session):
+        contact = await ContactRepository(session).create(
+            name=name, phone="+79001234567", message="hi"
+        )
+        return contact.id
+
+    return work
+
+
+async def _names() -> list[str]:
+    async with async_session_factory() as session:
+        result = await session.execute(select(ContactMessage.name).order_by(ContactMessage.id))
+        return list(result.scalars().all())
+
+
+class TestGroupCommitWriter:
+    async def test_concurrent_writes_share_one_commit(self, writer):
+        ids = await asyncio.gather(*(writer.submit(_create(f"c{i}")) for i in range(10)))
+
+        assert len(set(ids)) == 10
+        assert writer.batches == 1
+        assert writer.committed == 10
+        assert await _names() == [f"c{i}" for i in range(10)]
+
+    async def test_failed_job_fails_only_its_caller(self, writer):
+        async def fail(session):
+            await _create("doomed")(session)
+            raise ValueError("bad input")
+
+        results = await asyncio.gather(
+            writer.submit(_create("a")),
+            writer.submit(fail),
+            writer.submit(_create("b")),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], ValueError)
+        assert isinstance(results[0], int) and isinstance(results[2], int)
+        assert writer.committed == 2
+        assert writer.failed == 1
+        assert await _names() == ["a", "b"]
+
+    async def test_nothing_visible_before_commit(self, writer):
+        seen = []
+
+        async def peek(session):
+            await _create("pending")(session)
+            seen.extend(await _names())
+
+        await writer.submit(peek)
+
+        assert seen == []
+        assert await _names() == ["pending"]
+
+    async def test_stop_commits_queued_jobs(self):
+        writer = GroupCommitWriter(engine, window=0.05)
+        await writer.start()
+        pending = asyncio.ensure_future(writer.submit(_create("late")))
+        await asyncio.sleep(0)
+
+        await writer.stop()
+
+        assert isinstance(await pending, int)
+        assert await _names() == ["late"]
+
+    async def test_submit_rejected_once_stopping(self):
+        writer = GroupCommitWriter(engine, window=0.05)
+        await writer.start()
+        first = asyncio.ensure_future(writer.submit(_create("before")))
+        await asyncio.sleep(0)
+
+        stopping = asyncio.ensure_future(writer.stop())
+        await asyncio.sleep(0)
+        with pytest.raises(RuntimeError):
+            await writer.submit(_create("after"))
+        await stopping
+
+        assert isinstance(await first, int)
+        assert await _names() == ["before"]
+
+    async def test_jobs_behind_sentinel_fail_instead_of_hanging(self):
+        writer = GroupCommitWriter(engine, window=0.05)
+        await writer.start()
+        first = asyncio.ensure_future(writer.submit(_create("before")))
+        await asyncio.sleep(0)
+        # A job that slipped in behind the stop sentinel
+        stopping = asyncio.ensure_future(writer.stop())
+        await asyncio.sleep(0)
+        late = asyncio.get_running_loop().create_future()
+        writer._queue.put_nowait((_create("late"), late))
+        await stopping
+
+        assert isinstance(await first, int)
+        with pytest.raises(RuntimeError):
+            await asyncio.wait_for(late, 1)
+        assert await _names() == ["before"]
+
+    async def test_submit_requires_running_writer(self):
+        with pytest.raises(RuntimeError):
+            await GroupCommitWriter(engine).submit(_create("x"))
+
+
+async def test_submit_contact_through_writer(client, writer):
+    from src.main import app
+
+    app.state.writer = writer
+    payloads = [
+        {"name": f"Гость {i}", "phone": "+79001234567", "message": "Хочу записаться"}
+        for i in range(5)
+    ]
+
+    responses = await asyncio.gather(*(client.post("/api/contacts", json=p) for p in payloads))
+
+    assert [r.status_code for r in responses] == [201] * 5
+    assert len({r.json()["id"] for r in responses}) == 5
+    assert writer.committed == 5
+    async with async_session_factory() as session:
+        total = await session.scalar(select(func.count()).select_from(ContactMessage))
+    assert total == 5
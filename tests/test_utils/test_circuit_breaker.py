@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from src.utils.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+def _opened_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+class TestCircuitBreaker:
+    def test_starts_closed(self):
+        breaker = CircuitBreaker("test")
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow()
+
+    def test_opens_after_threshold(self):
+        breaker = _opened_breaker()
+        assert breaker.state == STATE_OPEN
+        assert not breaker.allow()
+        assert breaker.rejected == 1
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("test", failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+    def test_half_open_after_reset_timeout(self):
+        breaker = _opened_breaker()
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=10**9):
+            assert breaker.state == STATE_HALF_OPEN
+            assert breaker.allow()
+            # Only one probe at a time
+            assert not breaker.allow()
+
+    def test_probe_success_closes(self):
+        breaker = _opened_breaker()
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=10**9):
+            assert breaker.allow()
+            breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+
+    def test_probe_failure_reopens(self):
+        breaker = _opened_breaker()
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=10**9):
+            assert breaker.allow()
+            breaker.record_failure()
+            assert breaker.state == STATE_OPEN
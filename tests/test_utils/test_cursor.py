@@ -0,0 +1,32 @@
+import base64
+from datetime import date, datetime
+
+import pytest
+
+from src.exceptions import ValidationError
+from src.utils.cursor import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    def test_round_trip(self):
+        values = [3, date(2026, 5, 1), datetime(2026, 5, 1, 12, 30), None, -1.5, 42]
+        cursor = encode_cursor(values)
+        types = [int, date, datetime, date, None, int]
+        assert decode_cursor(cursor, types) == values
+
+    def test_url_safe(self):
+        cursor = encode_cursor(["?&/+=" * 10])
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["", "!!!", encode_cursor([1]), encode_cursor(["x", 1]), encode_cursor([1, "nope"])],
+    )
+    def test_invalid(self, cursor):
+        with pytest.raises(ValidationError, match="Invalid cursor"):
+            decode_cursor(cursor, [int, date])
+
+    def test_not_a_list(self):
+        cursor = base64.urlsafe_b64encode(b'{"a": 1}').decode()
+        with pytest.raises(ValidationError):
+            decode_cursor(cursor, [int])
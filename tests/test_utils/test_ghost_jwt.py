@@ -0,0 +1,60 @@
+from unittest.mock import patch
+
+import jwt
+import pytest
+
+from src.utils.ghost_jwt import (
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_TTL,
+    GhostTokenProvider,
+    make_ghost_jwt,
+)
+
+KEY_ID = "abc123"
+SECRET_HEX = "00" * 32
+ADMIN_KEY = f"{KEY_ID}:{SECRET_HEX}"
+
+
+def _decode(token: str) -> dict:
+    return jwt.decode(
+        token, bytes.fromhex(SECRET_HEX), algorithms=["HS256"], audience="/admin/"
+    )
+
+
+class TestMakeGhostJwt:
+    def test_token_has_kid_and_expiry(self):
+        token = make_ghost_jwt(ADMIN_KEY)
+        assert jwt.get_unverified_header(token)["kid"] == KEY_ID
+        claims = _decode(token)
+        assert claims["exp"] - claims["iat"] == TOKEN_TTL
+
+
+class TestGhostTokenProvider:
+    def test_token_reused_within_lifetime(self):
+        provider = GhostTokenProvider(ADMIN_KEY)
+        first = provider.get_token()
+        for _ in range(10):
+            assert provider.get_token() == first
+        assert provider.minted == 1
+
+    def test_token_refreshed_before_expiry(self):
+        provider = GhostTokenProvider(ADMIN_KEY)
+        with patch("src.utils.ghost_jwt.time.time", return_value=1_000_000):
+            first = provider.get_token()
+        refresh_at = 1_000_000 + TOKEN_TTL - TOKEN_REFRESH_MARGIN
+        with patch("src.utils.ghost_jwt.time.time", return_value=refresh_at - 1):
+            assert provider.get_token() == first
+        with patch("src.utils.ghost_jwt.time.time", return_value=refresh_at):
+            second = provider.get_token()
+        assert second != first
+        assert provider.minted == 2
+
+    def test_cached_token_is_valid(self):
+        provider = GhostTokenProvider(ADMIN_KEY)
+        claims = _decode(provider.get_token())
+        assert claims["aud"] == "/admin/"
+
+    def test_malformed_key_fails_on_first_token(self):
+        provider = GhostTokenProvider("not-a-key")
+        with pytest.raises(ValueError):
+            provider.get_token()
@@ -0,0 +1,69 @@
+import time
+
+import jwt
+import pytest
+
+from src.exceptions import AuthError
+from src.utils.session_token import (
+    SESSION_TOKEN_AUDIENCE,
+    decode_session_token,
+    issue_session_token,
+)
+from src.utils.telegram_auth import TelegramUser
+
+SECRET = "test-secret"
+USER = TelegramUser(id=12345, first_name="Test")
+
+
+def _claims(role="admin"):
+    return {
+        "sub": "12345",
+        "role": role,
+        "exp": int(time.time()) + 60,
+        "aud": SESSION_TOKEN_AUDIENCE,
+    }
+
+
+class TestSessionToken:
+    def test_round_trip(self):
+        token, expires_at = issue_session_token(USER, "admin", SECRET, ttl=60)
+        claims = decode_session_token(token, SECRET)
+        assert claims.user.id == 12345
+        assert claims.user.first_name == "Test"
+        assert claims.role == "admin"
+        assert claims.expires_at == expires_at
+
+    def test_expired(self):
+        token, _ = issue_session_token(USER, "admin", SECRET, ttl=-1)
+        with pytest.raises(AuthError):
+            decode_session_token(token, SECRET)
+
+    def test_wrong_key(self):
+        token, _ = issue_session_token(USER, "admin", SECRET, ttl=60)
+        with pytest.raises(AuthError):
+            decode_session_token(token, "other-secret")
+
+    def test_tampered_payload(self):
+        token, _ = issue_session_token(USER, "editor", SECRET, ttl=60)
+        header, _, sig = token.split(".")
+        forged = jwt.encode(_claims(role="admin"), "guess", algorithm="HS256")
+        with pytest.raises(AuthError):
+            decode_session_token(f"{header}.{forged.split('.')[1]}.{sig}", SECRET)
+
+    def test_wrong_audience(self):
+        claims = _claims()
+        del claims["aud"]
+        token = jwt.encode(claims, SECRET, algorithm="HS256")
+        with pytest.raises(AuthError):
+            decode_session_token(token, SECRET)
+
+    def test_unsigned_token_rejected(self):
+        token = jwt.encode(_claims(), None, algorithm="none")
+        with pytest.raises(AuthError):
+            decode_session_token(token, SECRET)
+
+    def test_empty_secret_uses_process_key(self):
+        token, _ = issue_session_token(USER, "admin", "", ttl=60)
+        assert decode_session_token(token, "").user.id == 12345
+        with pytest.raises(AuthError):
+            decode_session_token(token, "x")
@@ -6,7 +6,13 @@ import time
 import pytest
 
 from src.exceptions import AuthError
-from src.utils.telegram_auth import TelegramUser, validate_init_data
+from src.utils import telegram_auth
+from src.utils.telegram_auth import (
+    TelegramUser,
+    VerifiedInitDataCache,
+    validate_init_data,
+    verified_init_data,
+)
 
 BOT_TOKEN = "123456:ABC-DEF-test-token"
 
@@ -83,3 +89,53 @@ class TestValidateInitData:
             with pytest.raises(AuthError) as exc_info:
                 validate_init_data(init_data, token)
             assert exc_info.value.message == "Authentication failed"
+
+
+class TestVerifiedInitDataCache:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        verified_init_data.clear()
+        yield
+        verified_init_data.clear()
+
+    def test_repeat_validation_skips_hmac(self, monkeypatch):
+        init_data = _make_init_data()
+        validate_init_data(init_data, BOT_TOKEN)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("HMAC recomputed")
+
+        monkeypatch.setattr(telegram_auth.hmac, "compare_digest", fail)
+        assert validate_init_data(init_data, BOT_TOKEN).id == 12345
+
+    def test_cache_is_per_bot_token(self):
+        init_data = _make_init_data()
+        validate_init_data(init_data, BOT_TOKEN)
+
+        with pytest.raises(AuthError):
+            validate_init_data(init_data, "other:token")
+
+    def test_failures_are_not_cached(self):
+        init_data = _make_init_data(tamper_hash=True)
+        with pytest.raises(AuthError):
+            validate_init_data(init_data, BOT_TOKEN)
+        assert verified_init_data.get(init_data, telegram_auth._secret_key(BOT_TOKEN)) is None
+
+    def test_entries_expire_with_init_data(self, monkeypatch):
+        init_data = _make_init_data()
+        validate_init_data(init_data, BOT_TOKEN)
+
+        later = time.time() + telegram_auth.INIT_DATA_MAX_AGE + 1
+        monkeypatch.setattr(telegram_auth.time, "time", lambda: later)
+
+        with pytest.raises(AuthError):
+            validate_init_data(init_data, BOT_TOKEN)
+
+    def test_bounded_size(self):
+        cache = VerifiedInitDataCache(maxsize=2)
+        user = TelegramUser(id=1)
+        for data in ("a", "b", "c"):
+            cache.put(data, b"k", user, time.time() + 60)
+
+        assert cache.get("a", b"k") is None
+        assert cache.get("c", b"k") == user
@@ -1,6 +1,7 @@
-import { useState, useEffect, useRef } from "preact/hooks";
+import { useState } from "preact/hooks";
+import { useCursorList } from "@/hooks/useCursorList";
 import { api } from "@/services/api";
-import type { Contact, PaginatedResponse } from "@/types";
+import type { Contact } from "@/types";
 
 const PAGE_SIZE = 20;
 
@@ -9,94 +10,37 @@ interface ContactListProps {
 }
 
 export function ContactList({ onToast }: ContactListProps) {
-  const [contacts, setContacts] = useState<Contact[]>([]);
-  const [total, setTotal] = useState(0);
-  const [page, setPage] = useState(0);
   const [tab, setTab] = useState(0); // 0=unprocessed, 1=processed, 2=all
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState<string | null>(null);
   const [sort, setSort] = useState<"desc" | "asc">("desc");
   const [dateFrom, setDateFrom] = useState("");
   const [dateTo, setDateTo] = useState("");
+  const [search, setSearch] = useState("");
   const [actionIds, setActionIds] = useState<Set<number>>(new Set());
-  const [reloadKey, setReloadKey] = useState(0);
-  const pageRef = useRef(page);
-  pageRef.current = page;
 
-  useEffect(() => {
-    const controller = new AbortController();
-    const fetchData = async () => {
-      setLoading(true);
-      setError(null);
-      try {
-        const offset = page * PAGE_SIZE;
-        const params = new URLSearchParams();
-        params.set("limit", String(PAGE_SIZE));
-        params.set("offset", String(offset));
-        if (tab === 0) params.set("is_processed", "false");
-        else if (tab === 1) params.set("is_processed", "true");
-        params.set("sort", sort);
-        if (dateFrom) params.set("date_from", dateFrom);
-        if (dateTo) params.set("date_to", dateTo);
-        const data = await api.get<PaginatedResponse<Contact>>(
-          `/contacts?${params}`,
-          controller.signal,
-        );
-        if (!controller.signal.aborted) {
-          // Clamp page if total shrank (e.g. after processing on last page)
-          const maxPage = Math.max(
-            0,
-            Math.ceil(data.total / PAGE_SIZE) - 1,
-          );
-          if (pageRef.current > maxPage) {
-            setPage(maxPage);
-            // Don't set stale data — the re-triggered effect will fetch correct page
-            return;
-          }
-          setContacts(data.items);
-          setTotal(data.total);
-        }
-      } catch (e) {
-        if (e instanceof DOMException && e.name === "AbortError") return;
-        if (!controller.signal.aborted) {
-          console.error(e);
-          setError("Не удалось загрузить заявки");
-        }
-      }
-      if (!controller.signal.aborted) setLoading(false);
-    };
-    fetchData();
-    return () => controller.abort();
-  }, [page, tab, sort, dateFrom, dateTo, reloadKey]);
-
-  const changeTab = (newTab: number) => {
-    setPage(0);
-    setTab(newTab);
-  };
-
-  const toggleSort = () => {
-    setPage(0);
-    setSort(sort === "desc" ? "asc" : "desc");
-  };
-
-  const changeDateFrom = (value: string) => {
-    setPage(0);
-    setDateFrom(value);
-  };
-
-  const changeDateTo = (value: string) => {
-    setPage(0);
-    setDateTo(value);
-  };
+  const params = new URLSearchParams();
+  if (tab === 0) params.set("is_processed", "false");
+  else if (tab === 1) params.set("is_processed", "true");
+  params.set("sort", sort);
+  if (dateFrom) params.set("date_from", dateFrom);
+  if (dateTo) params.set("date_to", dateTo);
+  if (search) params.set("search", search);
+  const {
+    items: contacts,
+    total,
+    loading,
+    error,
+    hasMore,
+    sentinelRef,
+    reload,
+  } = useCursorList<Contact>(`/contacts?${params}`, PAGE_SIZE);
+
+  const toggleSort = () => setSort(sort === "desc" ? "asc" : "desc");
 
   const resetDates = () => {
-    setPage(0);
     setDateFrom("");
     setDateTo("");
   };
 
-  const reload = () => setReloadKey((k) => k + 1);
-
   const markProcessed = async (id: number) => {
     if (actionIds.has(id)) return;
     setActionIds((prev) => new Set(prev).add(id));
@@ -133,8 +77,6 @@ export function ContactList({ onToast }: ContactListProps) {
     }
   };
 
-  const totalPages = Math.max(1, Math.ceil(total / PAGE_SIZE));
-
   return (
     <div className="page">
       <h2>Заявки</h2>
@@ -142,24 +84,32 @@ export function ContactList({ onToast }: ContactListProps) {
       <div className="tabs">
         <button
           className={`tab ${tab === 0 ? "active" : ""}`}
-          onClick={() => changeTab(0)}
+          onClick={() => setTab(0)}
         >
           Новые
         </button>
         <button
           className={`tab ${tab === 1 ? "active" : ""}`}
-          onClick={() => changeTab(1)}
+          onClick={() => setTab(1)}
         >
           Обработанные
         </button>
         <button
           className={`tab ${tab === 2 ? "active" : ""}`}
-          onClick={() => changeTab(2)}
+          onClick={() => setTab(2)}
         >
           Все
         </button>
       </div>
 
+      <input
+        className="search-input"
+        type="text"
+        placeholder="Поиск по имени, телефону, тексту..."
+        value={search}
+        onInput={(e) => setSearch((e.target as HTMLInputElement).value)}
+      />
+
       <div className="filters">
         <button className="btn btn-sm" onClick={toggleSort}>
           Дата {sort === "desc" ? "↓" : "↑"}
@@ -169,7 +119,7 @@ export function ContactList({ onToast }: ContactListProps) {
           className="filter-date"
           value={dateFrom}
           onChange={(e) =>
-            changeDateFrom((e.target as HTMLInputElement).value)
+            setDateFrom((e.target as HTMLInputElement).value)
           }
           placeholder="С"
         />
@@ -178,7 +128,7 @@ export function ContactList({ onToast }: ContactListProps) {
           className="filter-date"
           value={dateTo}
           onChange={(e) =>
-            changeDateTo((e.target as HTMLInputElement).value)
+            setDateTo((e.target as HTMLInputElement).value)
           }
           placeholder="По"
         />
@@ -248,25 +198,14 @@ export function ContactList({ onToast }: ContactListProps) {
             ))}
           </div>
 
-          {totalPages > 1 && (
-            <div className="pagination">
-              <button
-                className="btn btn-sm"
-                disabled={page === 0 || loading}
-                onClick={() => setPage(page - 1)}
-              >
-                ←
-              </button>
-              <span className="pagination-info">
-                {page + 1} / {totalPages}
-              </span>
-              <button
-                className="btn btn-sm"
-                disabled={page >= totalPages - 1 || loading}
-                onClick={() => setPage(page + 1)}
-              >
-                →
-              </button>
+          {hasMore && (
+            <div ref={sentinelRef} className="loading">
+              Загрузка...
+            </div>
+          )}
+          {total > 0 && (
+            <div className="pagination-info">
+              {contacts.length} / {total}
             </div>
           )}
         </>
@@ -1,6 +1,11 @@
 import { useState, useEffect } from "preact/hooks";
 import { api } from "@/services/api";
-import type { Course, CourseFormData, EntityStatus } from "@/types";
+import type {
+  Course,
+  CourseFormData,
+  EntityStatus,
+  ImageUploadResult,
+} from "@/types";
 
 const tg = window.Telegram?.WebApp;
 const DRAFT_KEY = "komonbot_course_draft";
@@ -180,14 +185,27 @@ export function CourseForm({ id, onNavigate, onToast }: CourseFormProps) {
     (type: string) => async (e: globalThis.Event) => {
       const file = (e.target as HTMLInputElement).files?.[0];
       if (!file) return;
+      const setImage = type === "desktop" ? setImageDesktop : setImageMobile;
+      const stateOf = (c: Course) =>
+        type === "desktop" ? c.image_desktop_state : c.image_mobile_state;
       try {
-        const data = await api.uploadFile<{ url: string }>(
+        await api.uploadFile<ImageUploadResult>(
           `/courses/${id}/upload-image?type=${type}`,
           file,
         );
-        if (type === "desktop") setImageDesktop(data.url);
-        else setImageMobile(data.url);
-        onToast("Изображение загружено");
+        // Processing continues on the server — preview the local file meanwhile
+        setImage(URL.createObjectURL(file));
+        onToast("Изображение обрабатывается...");
+        const course = await api.poll<Course>(
+          `/courses/${id}`,
+          (c) => stateOf(c) !== "pending",
+        );
+        setImage(type === "desktop" ? course.image_desktop : course.image_mobile);
+        onToast(
+          stateOf(course) === "failed"
+            ? "Не удалось загрузить изображение"
+            : "Изображение загружено",
+        );
       } catch (err) {
         onToast((err as Error).message);
       }
@@ -1,6 +1,6 @@
-import { useState, useEffect } from "preact/hooks";
-import { api } from "@/services/api";
-import type { Course, EntityStatus, PaginatedResponse } from "@/types";
+import { useState } from "preact/hooks";
+import { useCursorList } from "@/hooks/useCursorList";
+import type { Course, EntityStatus } from "@/types";
 
 const STATUS_LABELS: Record<EntityStatus, string> = {
   draft: "Черновик",
@@ -23,31 +23,16 @@ interface CourseListProps {
 }
 
 export function CourseList({ onNavigate }: CourseListProps) {
-  const [courses, setCourses] = useState<Course[]>([]);
-  const [_total, setTotal] = useState(0);
   const [tab, setTab] = useState(0);
   const [search, setSearch] = useState("");
-  const [loading, setLoading] = useState(true);
 
-  const load = async () => {
-    setLoading(true);
-    try {
-      const status = STATUS_TABS[tab];
-      let path = `/courses?limit=50`;
-      if (status) path += `&status=${status}`;
-      if (search) path += `&search=${encodeURIComponent(search)}`;
-      const data = await api.get<PaginatedResponse<Course>>(path);
-      setCourses(data.items);
-      setTotal(data.total);
-    } catch (e) {
-      console.error(e);
-    }
-    setLoading(false);
-  };
-
-  useEffect(() => {
-    load();
-  }, [tab, search]);
+  const status = STATUS_TABS[tab];
+  const params = new URLSearchParams();
+  if (status) params.set("status", status);
+  if (search) params.set("search", search);
+  const query = params.toString();
+  const path = query ? `/courses?${query}` : "/courses";
+  const { items: courses, loading, hasMore, sentinelRef } = useCursorList<Course>(path, 30);
 
   return (
     <div className="page">
@@ -81,7 +66,7 @@ export function CourseList({ onNavigate }: CourseListProps) {
         onInput={(e) => setSearch((e.target as HTMLInputElement).value)}
       />
 
-      {loading ? (
+      {loading && courses.length === 0 ? (
         <div className="loading">Загрузка...</div>
       ) : (
         <div className="card-list">
@@ -103,6 +88,11 @@ export function CourseList({ onNavigate }: CourseListProps) {
               </div>
             </div>
           ))}
+          {hasMore && (
+            <div ref={sentinelRef} className="loading">
+              Загрузка...
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -1,6 +1,11 @@
 import { useState, useEffect } from "preact/hooks";
 import { api } from "@/services/api";
-import type { Event, EventFormData, EntityStatus } from "@/types";
+import type {
+  Event,
+  EventFormData,
+  EntityStatus,
+  ImageUploadResult,
+} from "@/types";
 
 const tg = window.Telegram?.WebApp;
 const DRAFT_KEY = "komonbot_event_draft";
@@ -179,12 +184,20 @@ export function EventForm({ id, onNavigate, onToast }: EventFormProps) {
     const file = (e.target as HTMLInputElement).files?.[0];
     if (!file) return;
     try {
-      const data = await api.uploadFile<{ url: string }>(
-        `/events/${id}/upload-image`,
-        file,
+      await api.uploadFile<ImageUploadResult>(`/events/${id}/upload-image`, file);
+      // Processing continues on the server — preview the local file meanwhile
+      setCoverImage(URL.createObjectURL(file));
+      onToast("Изображение обрабатывается...");
+      const event = await api.poll<Event>(
+        `/events/${id}`,
+        (e) => e.cover_image_state !== "pending",
+      );
+      setCoverImage(event.cover_image);
+      onToast(
+        event.cover_image_state === "failed"
+          ? "Не удалось загрузить изображение"
+          : "Изображение загружено",
       );
-      setCoverImage(data.url);
-      onToast("Изображение загружено");
     } catch (err) {
       onToast((err as Error).message);
     }
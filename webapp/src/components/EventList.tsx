@@ -1,6 +1,6 @@
-import { useState, useEffect } from "preact/hooks";
-import { api } from "@/services/api";
-import type { Event, EntityStatus, PaginatedResponse } from "@/types";
+import { useState } from "preact/hooks";
+import { useCursorList } from "@/hooks/useCursorList";
+import type { Event, EntityStatus } from "@/types";
 
 const STATUS_LABELS: Record<EntityStatus, string> = {
   draft: "Черновик",
@@ -23,31 +23,16 @@ interface EventListProps {
 }
 
 export function EventList({ onNavigate }: EventListProps) {
-  const [events, setEvents] = useState<Event[]>([]);
-  const [_total, setTotal] = useState(0);
   const [tab, setTab] = useState(0);
   const [search, setSearch] = useState("");
-  const [loading, setLoading] = useState(true);
 
-  const load = async () => {
-    setLoading(true);
-    try {
-      const status = STATUS_TABS[tab];
-      let path = `/events?limit=50`;
-      if (status) path += `&status=${status}`;
-      if (search) path += `&search=${encodeURIComponent(search)}`;
-      const data = await api.get<PaginatedResponse<Event>>(path);
-      setEvents(data.items);
-      setTotal(data.total);
-    } catch (e) {
-      console.error(e);
-    }
-    setLoading(false);
-  };
-
-  useEffect(() => {
-    load();
-  }, [tab, search]);
+  const status = STATUS_TABS[tab];
+  const params = new URLSearchParams();
+  if (status) params.set("status", status);
+  if (search) params.set("search", search);
+  const query = params.toString();
+  const path = query ? `/events?${query}` : "/events";
+  const { items: events, loading, hasMore, sentinelRef } = useCursorList<Event>(path, 30);
 
   return (
     <div className="page">
@@ -81,7 +66,7 @@ export function EventList({ onNavigate }: EventListProps) {
         onInput={(e) => setSearch((e.target as HTMLInputElement).value)}
       />
 
-      {loading ? (
+      {loading && events.length === 0 ? (
         <div className="loading">Загрузка...</div>
       ) : (
         <div className="card-list">
@@ -104,6 +89,11 @@ export function EventList({ onNavigate }: EventListProps) {
               </div>
             </div>
           ))}
+          {hasMore && (
+            <div ref={sentinelRef} className="loading">
+              Загрузка...
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -0,0 +1,88 @@
+import { useCallback, useEffect, useRef, useState } from "preact/hooks";
+import { api } from "@/services/api";
+import type { PaginatedResponse } from "@/types";
+
+/**
+ * Infinite list over a cursor-paginated endpoint.
+ *
+ * `path` carries the filters (no limit/cursor); changing it starts again from
+ * the first page. Attach `sentinelRef` to an element after the last item —
+ * the next page loads when it scrolls into view, and again after each page
+ * while it stays in view.
+ */
+export function useCursorList<T>(path: string, pageSize = 20) {
+  const [items, setItems] = useState<T[]>([]);
+  const [total, setTotal] = useState(0);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+  const [reloadKey, setReloadKey] = useState(0);
+  const inFlight = useRef<AbortController | null>(null);
+
+  const fetchPage = async (cursor: string | null) => {
+    inFlight.current?.abort();
+    const controller = new AbortController();
+    inFlight.current = controller;
+    setLoading(true);
+    setError(null);
+
+    const sep = path.includes("?") ? "&" : "?";
+    let url = `${path}${sep}limit=${pageSize}`;
+    if (cursor) url += `&cursor=${encodeURIComponent(cursor)}`;
+    try {
+      const data = await api.get<PaginatedResponse<T>>(url, controller.signal);
+      if (controller.signal.aborted) return;
+      setItems((prev) => (cursor ? [...prev, ...data.items] : data.items));
+      setTotal(data.total);
+      setNextCursor(data.next_cursor);
+    } catch (e) {
+      if (controller.signal.aborted) return;
+      console.error(e);
+      setError("Не удалось загрузить список");
+    }
+    setLoading(false);
+  };
+
+  useEffect(() => {
+    fetchPage(null);
+    return () => inFlight.current?.abort();
+  }, [path, pageSize, reloadKey]);
+
+  // The observer outlives renders; read the latest state through a ref
+  const loadMore = useRef(() => {});
+  loadMore.current = () => {
+    if (nextCursor && !loading && !error) fetchPage(nextCursor);
+  };
+
+  const observer = useRef<IntersectionObserver | null>(null);
+  const sentinelVisible = useRef(false);
+  const sentinelRef = useCallback((node: Element | null) => {
+    observer.current?.disconnect();
+    sentinelVisible.current = false;
+    if (!node) return;
+    observer.current = new IntersectionObserver(
+      (entries) => {
+        sentinelVisible.current = entries[entries.length - 1].isIntersecting;
+        if (sentinelVisible.current) loadMore.current();
+      },
+      { rootMargin: "200px" },
+    );
+    observer.current.observe(node);
+  }, []);
+
+  // The observer only fires on a change: if the sentinel is still in view once
+  // a page lands (short rows, or it appeared mid-load), keep loading
+  useEffect(() => {
+    if (sentinelVisible.current) loadMore.current();
+  }, [nextCursor, loading]);
+
+  return {
+    items,
+    total,
+    loading,
+    error,
+    hasMore: nextCursor !== null,
+    sentinelRef,
+    reload: () => setReloadKey((k) => k + 1),
+  };
+}
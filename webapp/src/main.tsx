@@ -54,7 +54,7 @@ function App() {
   useEffect(() => {
     if (auth !== "loading") return;
     api
-      .get("/users/me")
+      .startSession()
       .then(() => setAuth("allowed"))
       .catch((err) => {
         if (err.message === "Forbidden") setAuth("denied");
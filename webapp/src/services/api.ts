@@ -4,6 +4,38 @@ function getInitData(): string {
   return tg?.initData || "";
 }
 
+interface Session {
+  token: string;
+  expires_at: number; // unix seconds
+  role: string;
+}
+
+// Short-lived server token exchanged for initData once; refreshed before expiry
+let session: Session | null = null;
+let refreshTimer: ReturnType<typeof setTimeout> | undefined;
+
+function authHeaders(): Record<string, string> {
+  if (session) return { Authorization: `Bearer ${session.token}` };
+  return { "X-Telegram-Init-Data": getInitData() };
+}
+
+function scheduleRefresh() {
+  clearTimeout(refreshTimer);
+  if (!session) return;
+  const ms = (session.expires_at - Date.now() / 1000) * 1000 * 0.8;
+  refreshTimer = setTimeout(() => {
+    startSession().catch(() => {
+      session = null;
+    });
+  }, Math.max(ms, 0));
+}
+
+async function startSession(): Promise<Session> {
+  session = await request<Session>("POST", "/auth/session", { retry: false });
+  scheduleRefresh();
+  return session;
+}
+
 function getApiBase(): string {
   // Derive API prefix from current page URL
   // e.g. /bot179654/webapp/ → /bot179654/api
@@ -16,16 +48,16 @@ interface RequestOptions {
   body?: unknown;
   isFormData?: boolean;
   signal?: AbortSignal;
+  retry?: boolean;
 }
 
 async function request<T>(
   method: string,
   path: string,
-  { body, isFormData, signal }: RequestOptions = {},
+  { body, isFormData, signal, retry = true }: RequestOptions = {},
 ): Promise<T> {
-  const headers: Record<string, string> = {
-    "X-Telegram-Init-Data": getInitData(),
-  };
+  const headers = authHeaders();
+  const usedSession = session !== null;
   if (!isFormData) {
     headers["Content-Type"] = "application/json";
   }
@@ -38,6 +70,16 @@ async function request<T>(
   const res = await fetch(`${getApiBase()}${path}`, opts);
 
   if (res.status === 401) {
+    // Token expired or revoked (role change) — exchange initData again, once
+    if (usedSession && retry) {
+      session = null;
+      try {
+        await startSession();
+        return request<T>(method, path, { body, isFormData, signal, retry: false });
+      } catch {
+        // fall through to the session-expired alert
+      }
+    }
     if (tg) {
       tg.showAlert("Сессия истекла. Откройте приложение заново.", () => {
         tg.close();
@@ -63,6 +105,9 @@ async function request<T>(
 }
 
 export const api = {
+  /** Exchange initData for a session token; later requests send it instead. */
+  startSession,
+
   get: <T>(path: string, signal?: AbortSignal) =>
     request<T>("GET", path, { signal }),
   post: <T>(path: string, body?: unknown) =>
@@ -76,4 +121,19 @@ export const api = {
     formData.append("file", file);
     return request<T>("POST", path, { body: formData, isFormData: true });
   },
+
+  /** Re-fetch `path` until `done(item)` holds (e.g. a deferred image upload finished). */
+  async poll<T>(
+    path: string,
+    done: (item: T) => boolean,
+    intervalMs = 1500,
+    maxAttempts = 40,
+  ): Promise<T> {
+    for (let i = 0; i < maxAttempts; i++) {
+      await new Promise((r) => setTimeout(r, intervalMs));
+      const item = await request<T>("GET", path);
+      if (done(item)) return item;
+    }
+    throw new Error("Превышено время ожидания загрузки");
+  },
 };
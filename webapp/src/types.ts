@@ -1,5 +1,18 @@
 export type EntityStatus = "draft" | "published" | "cancelled" | "archived";
 
+export type ImageState = "pending" | "ready" | "failed";
+
+export interface ImageUploadResult {
+  url: string | null;
+  state: ImageState;
+  variants: ImageVariant[];
+}
+
+export interface ImageVariant {
+  width: number;
+  url: string;
+}
+
 export interface Event {
   id: number;
   title: string;
@@ -8,6 +21,8 @@ export interface Event {
   event_date: string | null;
   event_time: string | null;
   cover_image: string | null;
+  cover_image_variants: ImageVariant[] | null;
+  cover_image_state: ImageState | null;
   ticket_link: string | null;
   status: EntityStatus;
   order: number;
@@ -34,6 +49,10 @@ export interface Course {
   schedule: string;
   image_desktop: string | null;
   image_mobile: string | null;
+  image_desktop_variants: ImageVariant[] | null;
+  image_mobile_variants: ImageVariant[] | null;
+  image_desktop_state: ImageState | null;
+  image_mobile_state: ImageState | null;
   cost: number;
   currency: string;
   status: EntityStatus;
@@ -85,4 +104,5 @@ export interface NewUserFormData {
 export interface PaginatedResponse<T> {
   items: T[];
   total: number;
+  next_cursor: string | null; // pass as ?cursor= for the following page
 }